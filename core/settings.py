@@ -48,6 +48,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so it times the whole request. Removes itself unless REQUEST_TIMING.
+    "time_tracking.timing.RequestTimingMiddleware",
+    # Profiles requests with an X-Profile token. Removes itself without PROFILING_DIR.
+    "time_tracking.profiling.ProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -56,6 +60,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "time_tracking.replicas.ReplicaRoutingMiddleware",
 ]
 
 ROOT_URLCONF = "core.urls"
@@ -120,28 +125,161 @@ STATIC_URL = "static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+
+def env_bool(name: str, default: bool) -> bool:
+    """
+    Boolean value of an environment variable: "1", "true", "yes" or "on"
+    (in any case) are true, any other value false, default when unset.
+    """
+    return os.environ.get(name, str(default)).lower() in ("1", "true", "yes", "on")
+
+
+def database(name: str, host: str = None, pooled: bool = True) -> dict:
+    """
+    PostgreSQL settings of a database, read from DB_* environment variables.
+
+    With DB_POOL on, connections come from a psycopg 3 pool (needs psycopg
+    and psycopg-pool), unless pooled is False; otherwise each connection is
+    kept open for DB_CONN_MAX_AGE seconds, 0 (closed after each request) by
+    default. Keep it at 0 under ASGI, where connections opened by the
+    threads running async views' queries aren't reliably closed, and reuse
+    them with DB_POOL instead. Either way, with DB_CONN_HEALTH_CHECKS a
+    connection is pinged before it is reused: by Django, or by the pool
+    with ConnectionPool.check_connection, which Django (5.1.1 and later)
+    passes it for CONN_HEALTH_CHECKS. host ("host" or "host:port")
+    overrides DB_HOST and DB_PORT.
+    """
+    config = {
+        "ENGINE": os.environ.get("DB_ENGINE", "django.db.backends.postgresql"),
+        "NAME": name,
+        "USER": os.environ.get("DB_USER", "postgres"),
+        "PASSWORD": os.environ.get("DB_PASSWORD", "timetrackerdevdb"),
+        "HOST": os.environ.get("DB_HOST", "postgres"),
+        "PORT": os.environ.get("DB_PORT", "5432"),
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 0)),
+        "CONN_HEALTH_CHECKS": env_bool("DB_CONN_HEALTH_CHECKS", True),
+    }
+
+    if pooled and env_bool("DB_POOL", False):
+        # Pooled connections are returned to the pool at the end of each
+        # request, so Django must not keep them itself.
+        config["CONN_MAX_AGE"] = 0
+        config["OPTIONS"] = {
+            "pool": {
+                "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", 2)),
+                "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+                # Seconds before a connection is replaced, and before an
+                # unused one above min_size is closed.
+                "max_lifetime": float(os.environ.get("DB_POOL_MAX_LIFETIME", 1800)),
+                "max_idle": float(os.environ.get("DB_POOL_MAX_IDLE", 300)),
+                # Seconds a request waits for a free connection.
+                "timeout": float(os.environ.get("DB_POOL_TIMEOUT", 10)),
+                # No "check": Django passes the pool one itself, from
+                # CONN_HEALTH_CHECKS, and fails when it's set here too.
+            },
+        }
+
+    if host:
+        config["HOST"], _, port = host.partition(":")
+        config["PORT"] = port or config["PORT"]
+
+    return config
+
+
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": "dev",
-        "USER": "postgres",
-        "PASSWORD": "timetrackerdevdb",
-        "HOST": "postgres",
-        "PORT": "5432",
-    },
-    "test": {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": "test",
-        "USER": "postgres",
-        "PASSWORD": "timetrackerdevdb",
-        "HOST": "postgres",
-        "PORT": "5432",
-    },
+    "default": database(os.environ.get("DB_NAME", "dev")),
+    # Not used by the app, so it doesn't get a pool of its own.
+    "test": database(os.environ.get("DB_TEST_NAME", "test"), pooled=False),
 }
+# Read replicas of the default database, DB_REPLICA_HOSTS="host[:port],...".
+# Safe API requests read from them, see time_tracking.replicas.
+DATABASE_REPLICAS = []
+for index, host in enumerate(filter(None, os.environ.get("DB_REPLICA_HOSTS", "").split(",")), 1):
+    alias = f"replica_{index}"
+    DATABASES[alias] = database(os.environ.get("DB_NAME", "dev"), host=host.strip())
+    # Tests run the replicas on the test database of the primary.
+    DATABASES[alias]["TEST"] = {"MIRROR": "default"}
+    DATABASE_REPLICAS.append(alias)
+DATABASE_ROUTERS = ["time_tracking.replicas.ReplicaRouter"]
+# Seconds a user's reads stay on the primary after a write of theirs, to
+# cover the replication lag, and the cache alias keeping track of it.
+DATABASE_REPLICA_PIN_SECONDS = 10
+DATABASE_REPLICA_PIN_CACHE_ALIAS = "default"
+# Seconds a replica that failed to connect is left out before it's retried.
+DATABASE_REPLICA_RETRY_SECONDS = 30
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # JWTAuthentication with the token's user cached, see AUTH_USER_CACHE_TIMEOUT.
+        "time_tracking.authentication.CachedJWTAuthentication",
+    ),
+    # orjson based JSON, falling back to the stdlib when orjson is missing.
+    "DEFAULT_RENDERER_CLASSES": (
+        "time_tracking.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "time_tracking.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ),
 }
 
+CACHES = {
+    "default": {
+        # locmem is per process; point CACHE_BACKEND/CACHE_LOCATION at a shared
+        # backend (e.g. django.core.cache.backends.redis.RedisCache) when
+        # running several workers so cache invalidation reaches all of them.
+        "BACKEND": os.environ.get(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("CACHE_LOCATION", "time-tracker"),
+    },
+}
+# Cache alias and timeout (seconds) of the cached project responses
+PROJECTS_CACHE_ALIAS = "default"
+PROJECTS_CACHE_TIMEOUT = 300
+# Cache alias and timeout (seconds) of the users CachedJWTAuthentication looks up
+AUTH_USER_CACHE_ALIAS = "default"
+AUTH_USER_CACHE_TIMEOUT = 60
+
+# Per-request SQL and phase timings in a Server-Timing header and the logs,
+# with the SQL of requests slower than REQUEST_TIMING_SLOW_MS logged.
+REQUEST_TIMING = env_bool("REQUEST_TIMING", False)
+REQUEST_TIMING_SLOW_MS = int(os.environ.get("REQUEST_TIMING_SLOW_MS", 500))
+
+# Requests profiled on demand, see time_tracking.profiling. An empty
+# PROFILING_DIR turns profiling off.
+PROFILING_DIR = os.environ.get("PROFILING_DIR", os.path.join(BASE_DIR, "var", "profiles"))
+PROFILING_MAX_FILES = 50
+PROFILING_MAX_CONCURRENT = 1
+PROFILING_TOKEN_MAX_AGE = 900
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "time_tracking": {
+            "handlers": ["console"],
+            "level": os.environ.get("TIME_TRACKING_LOG_LEVEL", "INFO"),
+        },
+    },
+}
+
+# Keyset pagination of the time tracking list (opt-in via ?page_size / ?cursor)
+TIME_TRACKING_PAGE_SIZE = 100
+TIME_TRACKING_MAX_PAGE_SIZE = 1000
+# Maximum number of entries accepted by POST /api/time-tracking/batch
+TIME_TRACKING_BATCH_MAX_SIZE = 5000
+# Entries updated or deleted per transaction by the bulk update/delete endpoints
+TIME_TRACKING_BULK_CHUNK_SIZE = 1000
+# Entries are archived once older than this many months (counted from the
+# start of the current month), or once their project has been soft-deleted
+# for this many days, see time_tracking.archival.
+TIME_TRACKING_RETENTION_MONTHS = 24
+TIME_TRACKING_DELETED_PROJECT_GRACE_DAYS = 30
+
 STATIC_ROOT = os.path.join(BASE_DIR, "var", "static")
@@ -1,6 +1,9 @@
 from django.contrib import admin
+from django.db import transaction
 
+from time_tracking.cache import invalidate_entries
 from time_tracking.models import ProjectsModel, TimeTrackingModel
+from time_tracking.rollups import apply_deltas, entry_delta, merge_deltas, queryset_delta
 
 # Display the models/tables in django admin.
 
@@ -20,3 +23,42 @@ class TimeTrackingModelAdmin(admin.ModelAdmin):
         "project",
         "user",
     )
+
+    def save_model(self, request, obj, form, change):
+        """Keep the daily rollups in sync with admin edits."""
+        with transaction.atomic():
+            before = {}
+            if change:
+                # Locked so concurrent edits can't both remove the same old values.
+                before = entry_delta(
+                    TimeTrackingModel.objects.select_for_update().get(pk=obj.pk), sign=-1
+                )
+            super().save_model(request, obj, form, change)
+            deltas = merge_deltas(before, entry_delta(obj))
+            apply_deltas(deltas)
+            # The admin may move the entry to another user.
+            invalidate_entries(user_id for user_id, _, _ in deltas)
+
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            locked = TimeTrackingModel.objects.select_for_update().filter(pk=obj.pk).first()
+            if locked is None:
+                # Deleted in the meantime, along with its hours.
+                return
+            apply_deltas(entry_delta(locked, sign=-1))
+            super().delete_model(request, obj)
+            invalidate_entries([obj.user_id])
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            # Lock the rows first: the delta is aggregated, which can't lock them.
+            ids = (
+                TimeTrackingModel.objects.filter(pk__in=queryset.values("pk"))
+                .select_for_update()
+                .values_list("pk", flat=True)
+            )
+            queryset = TimeTrackingModel.objects.filter(pk__in=list(ids))
+            deltas = queryset_delta(queryset, sign=-1)
+            apply_deltas(deltas)
+            super().delete_queryset(request, queryset)
+            invalidate_entries(user_id for user_id, _, _ in deltas)
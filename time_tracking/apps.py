@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TimeTrackingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'time_tracking'
+
+    def ready(self):
+        # Connect the signal receivers.
+        from time_tracking import signals  # noqa: F401
@@ -0,0 +1,136 @@
+"""
+Archival of time entries out of the TimeTrackingModel table.
+
+Entries are archived once they are older than
+settings.TIME_TRACKING_RETENTION_MONTHS, counted in whole months so
+archiving empties whole partitions (see time_tracking.partitions), or once
+their project has been soft-deleted for
+settings.TIME_TRACKING_DELETED_PROJECT_GRACE_DAYS. They move to
+TimeTrackingArchiveModel with their ids, and their hours leave the daily
+rollups, which only count the entries of TimeTrackingModel. The hours report
+reads the rollups, so it leaves archived entries out: a report over a period
+past the retention is empty, and one over a deleted project's time drops it
+once archived. Archived entries are only read from the archived endpoint.
+
+Entries move in batches, each in a short transaction of its own that
+skips the entries other transactions have locked (on PostgreSQL), with an
+optional pause between batches. Nothing else keeps track of the progress:
+a run can be stopped at any time and the next one carries on from the
+entries left.
+"""
+
+import datetime
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from time_tracking.cache import invalidate_entries
+from time_tracking.models import TimeTrackingArchiveModel, TimeTrackingModel
+from time_tracking.partitions import add_months, month_bounds, month_start
+from time_tracking.rollups import apply_deltas, entry_delta, merge_deltas
+
+# The TimeTrackingModel fields copied to the archive.
+ARCHIVED_FIELDS = (
+    "id",
+    "project_id",
+    "user_id",
+    "date_worked",
+    "work_description",
+    "hours",
+    "created_at",
+    "updated_at",
+    "is_active",
+)
+
+
+def retention_cutoff(retention_months: int, now: datetime.datetime = None) -> datetime.datetime:
+    """Entries worked before this UTC month start are past the retention."""
+    today = (now or timezone.now()).astimezone(datetime.timezone.utc).date()
+    return month_bounds(add_months(month_start(today), -retention_months))[0]
+
+
+class EntryArchiver:
+    """Moves the entries due for archival to TimeTrackingArchiveModel, see the module docstring."""
+
+    def __init__(
+        self,
+        retention_months: int = None,
+        grace_days: int = None,
+        batch_size: int = 1000,
+        pause: float = 0,
+        write=lambda message: None,
+    ):
+        if retention_months is None:
+            retention_months = getattr(settings, "TIME_TRACKING_RETENTION_MONTHS", 24)
+        if grace_days is None:
+            grace_days = getattr(settings, "TIME_TRACKING_DELETED_PROJECT_GRACE_DAYS", 30)
+        self.retention_months = retention_months
+        self.grace_days = grace_days
+        self.batch_size = batch_size
+        self.pause = pause
+        self.write = write
+
+    def due_entries(self, now: datetime.datetime = None) -> dict:
+        """The querysets of the entries due for archival, by archive reason."""
+        now = now or timezone.now()
+        return {
+            "retention": TimeTrackingModel.objects.filter(
+                date_worked__lt=retention_cutoff(self.retention_months, now)
+            ),
+            # Soft-deleting a project is its last update.
+            "deleted_project": TimeTrackingModel.objects.filter(
+                project__is_deleted=True,
+                project__updated_at__lt=now - datetime.timedelta(days=self.grace_days),
+            ),
+        }
+
+    def count(self) -> dict:
+        """The number of entries due for archival, by archive reason."""
+        return {reason: queryset.count() for reason, queryset in self.due_entries().items()}
+
+    def archive_batch(self, queryset: QuerySet, reason: str, after_id: int = 0) -> list:
+        """Archives the next batch of the queryset's entries after after_id, returns their ids."""
+        with transaction.atomic():
+            # Only the entries are locked, not their projects.
+            entries = list(
+                queryset.filter(id__gt=after_id)
+                .order_by("id")
+                .select_for_update(skip_locked=True, of=("self",))[: self.batch_size]
+            )
+            if not entries:
+                return []
+
+            TimeTrackingArchiveModel.objects.bulk_create(
+                TimeTrackingArchiveModel(
+                    reason=reason,
+                    **{field: getattr(entry, field) for field in ARCHIVED_FIELDS},
+                )
+                for entry in entries
+            )
+            ids = [entry.id for entry in entries]
+            TimeTrackingModel.objects.filter(id__in=ids).delete()
+            apply_deltas(merge_deltas(*(entry_delta(entry, sign=-1) for entry in entries)))
+            invalidate_entries(entry.user_id for entry in entries)
+        return ids
+
+    def run(self, max_batches: int = None) -> dict:
+        """Archives the due entries, at most max_batches batches, returns the counts by reason."""
+        archived = {}
+        batches = 0
+        for reason, queryset in self.due_entries().items():
+            archived[reason] = 0
+            after_id = 0
+            while max_batches is None or batches < max_batches:
+                if batches:
+                    time.sleep(self.pause)
+                ids = self.archive_batch(queryset, reason, after_id)
+                if not ids:
+                    break
+                batches += 1
+                after_id = ids[-1]
+                archived[reason] += len(ids)
+                self.write(f"Archived {len(ids)} entries ({reason}), up to id {after_id}.")
+        return archived
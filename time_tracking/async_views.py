@@ -0,0 +1,166 @@
+"""
+Async variants of the read endpoints, served under api/async/.
+
+They return the same responses as the list/retrieve actions of
+ProjectsViewSet and TimeTrackingsViewSet, but run on Django's async ORM and
+cache APIs, so under an ASGI server a request waiting on the database
+doesn't hold a thread. DRF views are synchronous, so these are plain Django
+views that reuse the DRF pieces which don't touch the database:
+authentication token checks, filtersets, serializers and the renderer.
+"""
+
+from django.http import Http404, HttpResponse
+from django.views import View
+
+from django_filters.utils import translate_validation
+
+from rest_framework import exceptions, status
+from rest_framework.request import Request
+
+from time_tracking.authentication import CachedJWTAuthentication
+from time_tracking.cache import (
+    aget_entries_version,
+    aget_or_set_projects,
+    aget_projects_version,
+)
+from time_tracking.conditional import (
+    conditional_response,
+    content_etag,
+    entry_validators,
+    list_etag,
+    validator_headers,
+)
+from time_tracking.filters import TimeTrackingModelFilter
+from time_tracking.models import ProjectsModel, TimeTrackingModel
+from time_tracking.pagination import TimeTrackingCursorPagination
+from time_tracking.renderers import FastJSONRenderer
+from time_tracking.serializers import (
+    ProjectsSerializer,
+    TimeTrackingModelSerializer,
+    TimeTrackingValuesSerializer,
+)
+
+
+class AsyncAPIView(View):
+    """
+    Base of the async endpoints: authenticates the JWT like the API's
+    default authentication class and renders data and API errors to JSON
+    the way DRF does.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    authenticator = CachedJWTAuthentication()
+    renderer = FastJSONRenderer()
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            authenticated = await self.authenticator.aauthenticate(request)
+            if authenticated is None:
+                raise exceptions.NotAuthenticated()
+            request.user, request.auth = authenticated
+
+            return await super().dispatch(request, *args, **kwargs)
+        except Http404 as exc:
+            return self.error_response(exceptions.NotFound(str(exc)))
+        except exceptions.APIException as exc:
+            return self.error_response(exc)
+
+    def json_response(self, data, headers: dict = None) -> HttpResponse:
+        content = self.renderer.render(data)
+        return HttpResponse(content, content_type=self.renderer.media_type, headers=headers)
+
+    def error_response(self, exc: exceptions.APIException) -> HttpResponse:
+        data = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+        response = self.json_response(data)
+        response.status_code = exc.status_code
+        if exc.status_code == status.HTTP_401_UNAUTHORIZED:
+            response["WWW-Authenticate"] = self.authenticator.authenticate_header(self.request)
+        return response
+
+
+class AsyncProjectListView(AsyncAPIView):
+    async def get(self, request) -> HttpResponse:
+        """Endpoint to fetch the projects, served from the projects cache."""
+
+        async def load():
+            projects = [project async for project in ProjectsModel.objects.filter(is_deleted=False)]
+            data = list(ProjectsSerializer(projects, many=True).data)
+            return {"data": data, "etag": content_etag(data)}
+
+        return await cached_projects_response(self, request, "list", load)
+
+
+class AsyncProjectDetailView(AsyncAPIView):
+    async def get(self, request, pk: int) -> HttpResponse:
+        """Endpoint to fetch a project, served from the projects cache."""
+
+        async def load():
+            try:
+                project = await ProjectsModel.objects.filter(is_deleted=False).aget(pk=pk)
+            except ProjectsModel.DoesNotExist:
+                raise Http404("No ProjectsModel matches the given query.")
+            data = dict(ProjectsSerializer(project).data)
+            return {"data": data, "etag": content_etag(data)}
+
+        return await cached_projects_response(self, request, f"detail:{pk}", load)
+
+
+async def cached_projects_response(view: AsyncAPIView, request, name: str, load) -> HttpResponse:
+    """Same cache entries and responses as ProjectsViewSet.cached_response."""
+    cached = await aget_or_set_projects(name, load)
+    not_modified = conditional_response(request, etag=cached["etag"])
+    if not_modified is not None:
+        return not_modified
+
+    return view.json_response(cached["data"], headers=validator_headers(cached["etag"]))
+
+
+class AsyncTimeTrackingListView(AsyncAPIView):
+    async def get(self, request) -> HttpResponse:
+        """Endpoint to fetch list of entries"""
+        filterset = TimeTrackingModelFilter(
+            request.GET, queryset=TimeTrackingModel.objects.filter(user=request.user), request=request
+        )
+        if not filterset.is_valid():
+            raise translate_validation(filterset.errors)
+        queryset = filterset.qs
+
+        etag = list_etag(
+            request.user.id,
+            request.get_full_path(),
+            await aget_entries_version(request.user.id),
+            await aget_projects_version(),
+        )
+        not_modified = conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        paginator = TimeTrackingCursorPagination()
+        rows = TimeTrackingValuesSerializer.values(queryset.order_by(*paginator.ordering))
+        page = await paginator.apaginate_queryset(rows, Request(request))
+        if page is not None:
+            data = paginator.get_paginated_data(TimeTrackingValuesSerializer(page).data)
+        else:
+            data = TimeTrackingValuesSerializer([row async for row in rows]).data
+
+        return self.json_response(data, headers={"ETag": etag})
+
+
+class AsyncTimeTrackingDetailView(AsyncAPIView):
+    async def get(self, request, pk: int) -> HttpResponse:
+        """Endpoint to fetch an entry, or a 304 when the client's copy is current."""
+        queryset = TimeTrackingModel.objects.filter(user=request.user).select_related("project")
+        try:
+            instance = await queryset.aget(pk=pk)
+        except TimeTrackingModel.DoesNotExist:
+            raise Http404("No TimeTrackingModel matches the given query.")
+
+        etag, last_modified = entry_validators(instance)
+        not_modified = conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        return self.json_response(
+            TimeTrackingModelSerializer(instance).data,
+            headers=validator_headers(etag, last_modified),
+        )
@@ -0,0 +1,111 @@
+"""
+JWT authentication that doesn't query the user table on every request.
+
+The few user fields requests rely on are cached by user id for
+settings.AUTH_USER_CACHE_TIMEOUT seconds. Saving or deleting a user drops
+its entry (see time_tracking.signals), so deactivation applies on the next
+request; writes that skip signals, like QuerySet.update(), apply once the
+entry expires.
+"""
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from time_tracking.timing import timed
+
+# The user fields kept in the cache, in model order as from_db() expects;
+# the others are loaded on first access.
+CACHED_USER_FIELDS = tuple(
+    field.attname
+    for field in User._meta.concrete_fields
+    if field.attname
+    in {"id", "username", "email", "first_name", "last_name", "is_active", "is_staff", "is_superuser"}
+)
+
+
+def get_auth_cache():
+    return caches[getattr(settings, "AUTH_USER_CACHE_ALIAS", "default")]
+
+
+def user_cache_key(user_id) -> str:
+    return f"auth:user:{user_id}"
+
+
+def invalidate_user(user_id) -> None:
+    """Drop the cached state of the user."""
+    get_auth_cache().delete(user_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication reading the token's user from the cache when it can."""
+
+    @property
+    def cache_timeout(self) -> int:
+        return getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 60)
+
+    def authenticate(self, request):
+        with timed("auth"):
+            return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        user_id = self.get_user_id(validated_token)
+        cache = get_auth_cache()
+        state = cache.get(user_cache_key(user_id))
+        if state is None:
+            state = self.get_user_queryset(user_id).first()
+            if state is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            cache.set(user_cache_key(user_id), state, timeout=self.cache_timeout)
+
+        return self.build_user(state)
+
+    async def aauthenticate(self, request):
+        """authenticate() for async views, on the async cache and ORM APIs."""
+        with timed("auth"):
+            return await self._aauthenticate(request)
+
+    async def _aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        user_id = self.get_user_id(validated_token)
+        cache = get_auth_cache()
+        state = await cache.aget(user_cache_key(user_id))
+        if state is None:
+            state = await self.get_user_queryset(user_id).afirst()
+            if state is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            await cache.aset(user_cache_key(user_id), state, timeout=self.cache_timeout)
+
+        return self.build_user(state), validated_token
+
+    def get_user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+    def get_user_queryset(self, user_id):
+        return User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).values_list(
+            *CACHED_USER_FIELDS
+        )
+
+    def build_user(self, state) -> User:
+        # from_db marks the fields that aren't cached as deferred.
+        user = User.from_db(router.db_for_read(User), CACHED_USER_FIELDS, state)
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
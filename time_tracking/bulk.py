@@ -0,0 +1,78 @@
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from time_tracking.cache import invalidate_entries
+from time_tracking.models import TimeTrackingModel
+from time_tracking.rollups import apply_deltas, entry_delta, merge_deltas, queryset_delta
+
+
+def bulk_insert_entries(entries: list, batch_size: int = 1000) -> list:
+    """
+    Insert unsaved TimeTrackingModel instances with bulk_create and add them
+    to the daily rollups, all in one transaction. Returns the saved entries.
+    """
+    with transaction.atomic():
+        created = TimeTrackingModel.objects.bulk_create(entries, batch_size=batch_size)
+        apply_deltas(merge_deltas(*(entry_delta(entry) for entry in created)))
+        invalidate_entries(entry.user_id for entry in created)
+
+    return created
+
+
+def _in_chunks(queryset: QuerySet, chunk_size: int, operation) -> int:
+    """
+    Call operation with querysets of up to chunk_size entries of the queryset,
+    each chunk locked and processed in its own transaction, so a large
+    operation never holds many row locks for long. Paging on the id keeps
+    rows changed by one chunk from being visited again. Returns the sum of
+    the operation's results.
+    """
+    total = 0
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            ids = list(
+                queryset.filter(id__gt=last_id)
+                .order_by("id")
+                .select_for_update()
+                .values_list("id", flat=True)[:chunk_size]
+            )
+            if not ids:
+                return total
+            total += operation(TimeTrackingModel.objects.filter(id__in=ids))
+        last_id = ids[-1]
+
+
+def bulk_update_entries(queryset: QuerySet, changes: dict, chunk_size: int = 1000) -> int:
+    """
+    Apply the changes to every entry of the queryset with set-based UPDATEs in
+    bounded chunks, moving their hours in the daily rollups. Returns the
+    number of updated entries.
+    """
+
+    def update_chunk(chunk: QuerySet) -> int:
+        before = queryset_delta(chunk, sign=-1)
+        # QuerySet.update() skips auto_now, so set updated_at explicitly.
+        updated = chunk.update(**changes, updated_at=timezone.now())
+        apply_deltas(merge_deltas(before, queryset_delta(chunk)))
+        invalidate_entries(user_id for user_id, _, _ in before)
+        return updated
+
+    return _in_chunks(queryset, chunk_size, update_chunk)
+
+
+def bulk_delete_entries(queryset: QuerySet, chunk_size: int = 1000) -> int:
+    """
+    Delete every entry of the queryset in bounded chunks and remove their hours
+    from the daily rollups. Returns the number of deleted entries.
+    """
+
+    def delete_chunk(chunk: QuerySet) -> int:
+        deltas = queryset_delta(chunk, sign=-1)
+        apply_deltas(deltas)
+        deleted, _ = chunk.delete()
+        invalidate_entries(user_id for user_id, _, _ in deltas)
+        return deleted
+
+    return _in_chunks(queryset, chunk_size, delete_chunk)
@@ -0,0 +1,168 @@
+"""
+Versioned cache of the project list and detail responses.
+
+Every cached response is stored under a key that includes the current
+projects version. A write to any project bumps the version, which makes
+every older key unreachable at once; they then simply expire. The backend
+is the Django cache named by settings.PROJECTS_CACHE_ALIAS, so running
+several workers needs a shared backend (Redis, Memcached) for the
+invalidation to reach all of them.
+
+The same cache holds a version of each user's entries, bumped by every
+write to them, which the entry lists' ETags are built from instead of
+aggregating the entries.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+VERSION_KEY = "projects:version"
+ENTRIES_VERSION_KEY = "entries:version:{}"
+HITS_KEY = "projects:stats:hits"
+MISSES_KEY = "projects:stats:misses"
+
+
+def get_projects_cache():
+    return caches[getattr(settings, "PROJECTS_CACHE_ALIAS", "default")]
+
+
+def _increment(key: str) -> int:
+    cache = get_projects_cache()
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # The key is missing (first use or evicted).
+        cache.add(key, 0, timeout=None)
+        return cache.incr(key)
+
+
+def get_projects_version() -> int:
+    cache = get_projects_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # Start from the clock so a lost version never reuses an old one.
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate_projects() -> None:
+    """Make every cached project response stale."""
+    cache = get_projects_cache()
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def get_entries_version(user_id) -> int:
+    """The version of the user's entries, see invalidate_entries."""
+    cache = get_projects_cache()
+    key = ENTRIES_VERSION_KEY.format(user_id)
+    version = cache.get(key)
+    if version is None:
+        # Start from the clock so a lost version never reuses an old one.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def aget_entries_version(user_id) -> int:
+    """get_entries_version for async views."""
+    cache = get_projects_cache()
+    key = ENTRIES_VERSION_KEY.format(user_id)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+def _bump_entries_versions(user_ids) -> None:
+    cache = get_projects_cache()
+    for user_id in user_ids:
+        key = ENTRIES_VERSION_KEY.format(user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def invalidate_entries(user_ids) -> None:
+    """
+    Bump the entries version of the given users. Call it with every write to
+    their entries, inside the write's transaction if any.
+    """
+    user_ids = set(user_ids)
+    _bump_entries_versions(user_ids)
+    # Again once committed, in case a read saw the old rows with the new version.
+    transaction.on_commit(lambda: _bump_entries_versions(user_ids))
+
+
+def get_or_set_projects(name: str, loader):
+    """
+    Returns the cached response data called name for the current projects
+    version, calling loader to build and store it on a miss.
+    """
+    cache = get_projects_cache()
+    key = f"projects:{get_projects_version()}:{name}"
+
+    data = cache.get(key)
+    if data is not None:
+        _increment(HITS_KEY)
+        return data
+
+    _increment(MISSES_KEY)
+    data = loader()
+    cache.set(key, data, timeout=getattr(settings, "PROJECTS_CACHE_TIMEOUT", 300))
+    return data
+
+
+async def aget_or_set_projects(name: str, aloader):
+    """get_or_set_projects for async views, awaiting aloader on a miss."""
+    cache = get_projects_cache()
+    key = f"projects:{await aget_projects_version()}:{name}"
+
+    data = await cache.aget(key)
+    if data is not None:
+        await _aincrement(HITS_KEY)
+        return data
+
+    await _aincrement(MISSES_KEY)
+    data = await aloader()
+    await cache.aset(key, data, timeout=getattr(settings, "PROJECTS_CACHE_TIMEOUT", 300))
+    return data
+
+
+async def aget_projects_version() -> int:
+    """get_projects_version for async views."""
+    cache = get_projects_cache()
+    version = await cache.aget(VERSION_KEY)
+    if version is None:
+        await cache.aadd(VERSION_KEY, time.time_ns(), timeout=None)
+        version = await cache.aget(VERSION_KEY)
+    return version
+
+
+async def _aincrement(key: str) -> int:
+    cache = get_projects_cache()
+    try:
+        return await cache.aincr(key)
+    except ValueError:
+        await cache.aadd(key, 0, timeout=None)
+        return await cache.aincr(key)
+
+
+def get_projects_cache_stats() -> dict:
+    cache = get_projects_cache()
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    return {
+        "version": get_projects_version(),
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / (hits + misses) if hits + misses else None,
+    }
@@ -0,0 +1,73 @@
+"""
+Helpers for conditional GET (ETag / Last-Modified) on the API endpoints.
+"""
+
+import datetime
+import hashlib
+import json
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def make_etag(*parts) -> str:
+    """Returns a strong ETag built from the given validator parts."""
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode(), usedforsecurity=False)
+    return f'"{digest.hexdigest()}"'
+
+
+def list_etag(user_id, path: str, entries_version: int, projects_version: int) -> str:
+    """
+    Returns the ETag of a user's entry list at path (with its query string).
+    It changes with every write to the user's entries, which bumps their
+    version (see time_tracking.cache), and with every project write, since
+    the entries are listed with their project's title. Reading the versions
+    from the cache keeps the validator's cost flat whatever the list size.
+    """
+    return make_etag(user_id, path, entries_version, projects_version)
+
+
+def entry_validators(entry) -> tuple:
+    """
+    Returns the ETag and Last-Modified of an entry, which is rendered with
+    its project's title and so also changes with the project. The entry's
+    project should be selected along with it.
+    """
+    last_modified = max(entry.updated_at, entry.project.updated_at)
+    etag = make_etag(entry.id, entry.updated_at.isoformat(), entry.project.updated_at.isoformat())
+    return etag, last_modified
+
+
+def content_etag(data) -> str:
+    """Returns an ETag of the response data itself."""
+    return make_etag(json.dumps(data, cls=JSONEncoder, sort_keys=True))
+
+
+def validator_headers(etag: str = None, last_modified: datetime.datetime = None) -> dict:
+    """Returns the ETag/Last-Modified response headers of the validators."""
+    headers = {}
+    if etag:
+        headers["ETag"] = etag
+    if last_modified:
+        headers["Last-Modified"] = http_date(last_modified.timestamp())
+    return headers
+
+
+def conditional_response(request: Request, etag: str = None, last_modified: datetime.datetime = None):
+    """
+    Returns a 304 Not Modified (or 412) response when the request's
+    preconditions match the validators, else None to build the full response.
+    """
+    headers = validator_headers(etag, last_modified)
+    validators = HttpResponse(headers=headers)
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+        response=validators,
+    )
+    return None if response is validators else response
@@ -0,0 +1,50 @@
+import csv
+
+from django.db.models import QuerySet
+
+from rest_framework.utils.encoders import JSONEncoder
+
+from time_tracking.serializers import TimeTrackingValuesSerializer
+
+# Same columns, in the same order, as TimeTrackingModelSerializer.
+EXPORT_FIELDS = TimeTrackingValuesSerializer.fields
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for streaming csv.writer rows."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def export_rows(queryset: QuerySet, chunk_size: int = 2000):
+    """
+    Yield the entries of the queryset as dicts identical to the
+    TimeTrackingModelSerializer output, reading them in chunks from a
+    server-side cursor with the project title joined in.
+    """
+    serializer = TimeTrackingValuesSerializer()
+    rows = serializer.values(queryset.order_by("date_worked", "id"))
+    for row in rows.iterator(chunk_size=chunk_size):
+        yield serializer.to_representation(row)
+
+
+def stream_csv(rows):
+    """Yield the rows as CSV lines, header first."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow(row.values())
+
+
+def stream_ndjson(rows):
+    """Yield the rows as newline delimited JSON objects."""
+    encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    for row in rows:
+        yield encoder.encode(row) + "\n"
+
+
+EXPORT_FORMATS = {
+    "csv": (stream_csv, "text/csv"),
+    "ndjson": (stream_ndjson, "application/x-ndjson"),
+}
@@ -1,20 +1,65 @@
+import datetime
+
 import django_filters
-from time_tracking.models import TimeTrackingModel
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from time_tracking.models import (
+    DailyTimeTrackingRollupModel,
+    TimeTrackingArchiveModel,
+    TimeTrackingModel,
+)
+
+
+def start_of_day(value: datetime.date) -> datetime.datetime:
+    """Returns the aware datetime at which the given date starts in the active timezone."""
+    return timezone.make_aware(datetime.datetime.combine(value, datetime.time.min))
 
 
 class TimeTrackingModelFilter(django_filters.FilterSet):
     """The filter class for time tracking"""
 
-    # Filter by date range
-    start_date = django_filters.DateFilter(
-        field_name="date_worked__date", lookup_expr="gte", label="Start Date"
-    )
-    end_date = django_filters.DateFilter(
-        field_name="date_worked__date", lookup_expr="lte", label="End Date"
-    )
+    # Filter by date range. Dates are turned into a half-open datetime range
+    # on date_worked, instead of casting the column with __date, so the
+    # (user, date_worked) indexes can serve the query and PostgreSQL only
+    # scans the monthly partitions in the range.
+    start_date = django_filters.DateFilter(method="filter_start_date", label="Start Date")
+    end_date = django_filters.DateFilter(method="filter_end_date", label="End Date")
     # Filter by Project
     project = django_filters.NumberFilter(field_name="project__id", lookup_expr="exact")
 
     class Meta:
         model = TimeTrackingModel
         fields = ["start_date", "end_date", "project"]
+
+    def filter_start_date(self, queryset: QuerySet, name: str, value: datetime.date) -> QuerySet:
+        """Entries worked on or after the start of the given day."""
+        return queryset.filter(date_worked__gte=start_of_day(value))
+
+    def filter_end_date(self, queryset: QuerySet, name: str, value: datetime.date) -> QuerySet:
+        """Entries worked before the start of the day after the given day."""
+        if value == datetime.date.max:
+            # There's no day after it to bound the range with.
+            return queryset
+        return queryset.filter(
+            date_worked__lt=start_of_day(value + datetime.timedelta(days=1))
+        )
+
+
+class TimeTrackingArchiveFilter(TimeTrackingModelFilter):
+    """Same params as TimeTrackingModelFilter, applied to the archived entries."""
+
+    class Meta(TimeTrackingModelFilter.Meta):
+        model = TimeTrackingArchiveModel
+
+
+class DailyRollupFilter(django_filters.FilterSet):
+    """Same params as TimeTrackingModelFilter, applied to the daily rollups."""
+
+    start_date = django_filters.DateFilter(field_name="day", lookup_expr="gte", label="Start Date")
+    end_date = django_filters.DateFilter(field_name="day", lookup_expr="lte", label="End Date")
+    project = django_filters.NumberFilter(field_name="project_id", lookup_expr="exact")
+
+    class Meta:
+        model = DailyTimeTrackingRollupModel
+        fields = ["start_date", "end_date", "project"]
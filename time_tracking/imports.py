@@ -0,0 +1,128 @@
+import csv
+from contextlib import contextmanager
+
+from rest_framework.exceptions import ValidationError
+
+from time_tracking.bulk import bulk_insert_entries
+from time_tracking.models import ProjectsModel, TimeTrackingModel
+from time_tracking.serializers import TimeTrackingImportRowSerializer
+
+
+class TimeEntryCSVImporter:
+    """
+    Import time entries for a user from a CSV file, e.g. historical
+    timesheets. Expects the columns project_title, date_worked,
+    work_description and hours (the export's other columns are ignored, so
+    an export can be imported back).
+
+    Rows are parsed one at a time and inserted in bulk_create chunks, each in
+    its own transaction. Rows matching an entry the user already has (same
+    project, date_worked, work_description and hours) are skipped, so rerunning
+    an import, even one that stopped halfway, doesn't insert them twice.
+    """
+
+    required_columns = ("project_title", "date_worked", "work_description", "hours")
+
+    def __init__(self, user, chunk_size: int = 500, max_reported_errors: int = 1000):
+        self.user = user
+        self.chunk_size = chunk_size
+        self.max_reported_errors = max_reported_errors
+        self.row_serializer = TimeTrackingImportRowSerializer()
+
+    def run(self, lines) -> dict:
+        """Import the rows of a text stream and return the import report."""
+        reader = csv.DictReader(lines)
+        with self.read_errors(reader):
+            fieldnames = reader.fieldnames or []
+        missing = [column for column in self.required_columns if column not in fieldnames]
+        if missing:
+            raise ValidationError({"file": [f"Missing columns: {', '.join(missing)}."]})
+
+        # Resolve titles to ids from one preloaded map, lowest id first on clashes.
+        self.projects = dict(
+            ProjectsModel.objects.filter(is_deleted=False).order_by("-id").values_list("title", "id")
+        )
+        self.report = {"created": 0, "duplicates": 0, "invalid": 0, "errors": []}
+
+        chunk = []
+        with self.read_errors(reader):
+            for row in reader:
+                entry = self.build_entry(row, reader.line_num)
+                if entry is None:
+                    continue
+                chunk.append(entry)
+                if len(chunk) >= self.chunk_size:
+                    self.flush(chunk)
+                    chunk = []
+        self.flush(chunk)
+
+        return self.report
+
+    @contextmanager
+    def read_errors(self, reader):
+        """
+        Turn errors reading the file into a ValidationError. The chunks
+        inserted before stay imported, and are skipped when the fixed file is
+        imported again.
+        """
+        try:
+            yield
+        except UnicodeDecodeError:
+            raise ValidationError({"file": ["The file isn't UTF-8 encoded text."]})
+        except csv.Error as exc:
+            raise ValidationError({"file": [f"Invalid CSV after line {reader.line_num}: {exc}."]})
+
+    def build_entry(self, row: dict, line: int):
+        """Validate a row with the API's rules and return the unsaved entry."""
+        project_id = self.projects.get(row.get("project_title"))
+
+        try:
+            item = self.row_serializer.run_validation(
+                {column: row.get(column) for column in TimeTrackingImportRowSerializer.Meta.fields}
+            )
+        except ValidationError as exc:
+            errors = dict(exc.detail)
+        else:
+            errors = {}
+
+        if project_id is None:
+            errors["project_title"] = [f'Unknown project "{row.get("project_title")}".']
+
+        if errors:
+            self.report["invalid"] += 1
+            if len(self.report["errors"]) < self.max_reported_errors:
+                self.report["errors"].append({"line": line, "errors": errors})
+            return None
+
+        return TimeTrackingModel(
+            user=self.user,
+            project_id=project_id,
+            date_worked=item["date_worked"],
+            work_description=item["work_description"],
+            hours=item["hours"],
+        )
+
+    def flush(self, chunk: list) -> None:
+        """Insert the chunk, minus the entries the user already has."""
+        if not chunk:
+            return
+
+        existing = set(
+            TimeTrackingModel.objects.filter(
+                user=self.user, date_worked__in={entry.date_worked for entry in chunk}
+            ).values_list("project_id", "date_worked", "work_description", "hours")
+        )
+
+        entries = []
+        for entry in chunk:
+            key = (entry.project_id, entry.date_worked, entry.work_description, entry.hours)
+            if key in existing:
+                self.report["duplicates"] += 1
+                continue
+            # Also catches the same row repeated within the chunk.
+            existing.add(key)
+            entries.append(entry)
+
+        if entries:
+            bulk_insert_entries(entries)
+        self.report["created"] += len(entries)
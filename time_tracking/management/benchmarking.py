@@ -0,0 +1,15 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from django.db import transaction
+
+
+@contextmanager
+def rolled_back() -> Iterator[None]:
+    """
+    Runs the block in a transaction that is always rolled back, so the rows
+    a benchmark generates are never left in the database.
+    """
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
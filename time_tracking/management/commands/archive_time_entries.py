@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from time_tracking.archival import EntryArchiver
+
+
+class Command(BaseCommand):
+    help = (
+        "Move the time entries past the retention period, or of projects deleted past the "
+        "grace period, to the archive. Works in small batches and can be stopped and rerun "
+        "at any time."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            help="Archive entries older than this many months "
+            "(default settings.TIME_TRACKING_RETENTION_MONTHS).",
+        )
+        parser.add_argument(
+            "--grace-days",
+            type=int,
+            help="Archive entries of projects deleted this many days ago "
+            "(default settings.TIME_TRACKING_DELETED_PROJECT_GRACE_DAYS).",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000, help="Entries per batch.")
+        parser.add_argument(
+            "--pause", type=float, default=0.1, help="Seconds to wait between batches."
+        )
+        parser.add_argument("--max-batches", type=int, help="Stop after this many batches.")
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only count the entries due for archival."
+        )
+
+    def handle(self, *args, **options) -> None:
+        for option in ("retention_months", "grace_days"):
+            if options[option] is not None and options[option] < 0:
+                raise CommandError(f"--{option.replace('_', '-')} can't be negative.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        archiver = EntryArchiver(
+            retention_months=options["retention_months"],
+            grace_days=options["grace_days"],
+            batch_size=options["batch_size"],
+            pause=options["pause"],
+            write=self.stdout.write,
+        )
+        if options["dry_run"]:
+            for reason, count in archiver.count().items():
+                self.stdout.write(f"{count} entries due for archival ({reason}).")
+            return
+
+        archived = archiver.run(max_batches=options["max_batches"])
+        summary = ", ".join(f"{count} ({reason})" for reason, count in archived.items())
+        self.stdout.write(
+            self.style.SUCCESS(f"Archived {sum(archived.values())} entries: {summary}.")
+        )
@@ -0,0 +1,380 @@
+import datetime
+import gc
+import json
+import random
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from time_tracking.cache import invalidate_projects
+from time_tracking.management.benchmarking import rolled_back
+from time_tracking.models import ProjectsModel, TimeTrackingModel
+from time_tracking.rollups import rebuild_rollups
+
+BASELINE_PATH = Path(settings.BASE_DIR) / "benchmarks" / "api_baseline.json"
+PASSWORD = "Benchmark@123"
+# Monday, so the generated entries cover whole weeks.
+FIRST_DAY = datetime.datetime(2024, 1, 1, 9, tzinfo=datetime.timezone.utc)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the API endpoints in-process, through the URLs, middleware and "
+        "authentication of the project, on a generated dataset that is rolled back "
+        "afterwards. Reports p50/p95/p99 latency, throughput and SQL queries per "
+        "request per scenario and flags regressions against a baseline file."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--users", type=int, default=20, help="Users to create.")
+        parser.add_argument("--projects", type=int, default=50, help="Projects to create.")
+        parser.add_argument(
+            "--entries", type=int, default=1000, help="Time tracking entries per user."
+        )
+        parser.add_argument("--repeat", type=int, default=100, help="Requests per scenario.")
+        parser.add_argument(
+            "--password-repeat",
+            type=int,
+            default=10,
+            help="Requests of the scenarios hashing a password (login, register).",
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=3, help="Untimed requests before each scenario."
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            choices=sorted(SCENARIOS),
+            help="Scenario to run, repeatable; all by default.",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the random choices.")
+        parser.add_argument("--baseline", default=BASELINE_PATH, type=Path, help="Baseline file.")
+        parser.add_argument(
+            "--update-baseline",
+            action="store_true",
+            help="Write the results to the baseline file instead of comparing with it.",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.5,
+            help=(
+                "Allowed p50/p95 latency and throughput change against the baseline, as a "
+                "fraction. Query counts must not grow at all."
+            ),
+        )
+
+    def handle(self, *args, **options) -> None:
+        dataset = {
+            "users": options["users"],
+            "projects": options["projects"],
+            "entries": options["entries"],
+        }
+        # Options the results depend on besides the dataset, e.g. how many of
+        # the repeated requests hit a cache.
+        run = {
+            name: options[name] for name in ("repeat", "password_repeat", "warmup", "seed")
+        }
+        names = options["scenario"] or sorted(SCENARIOS)
+        # The generated rows are never committed, so replicas can't see them.
+        with override_settings(DATABASE_REPLICAS=[]):
+            try:
+                with rolled_back():
+                    results = self.benchmark(dataset, names, options)
+            finally:
+                # Drop the project responses cached with the rolled back projects.
+                invalidate_projects()
+
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name}: p50 {result['p50_ms']:.2f} ms, p95 {result['p95_ms']:.2f} ms, "
+                f"p99 {result['p99_ms']:.2f} ms, {result['throughput']:,.1f} req/s, "
+                f"{result['queries']:g} queries"
+            )
+
+        if options["update_baseline"]:
+            baseline = self.load_baseline(options["baseline"])
+            if baseline is None or (baseline["dataset"], baseline.get("run")) != (dataset, run):
+                baseline = {"dataset": dataset, "run": run}
+            baseline.setdefault("scenarios", {}).update(results)
+            options["baseline"].parent.mkdir(parents=True, exist_ok=True)
+            options["baseline"].write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+            self.stdout.write(self.style.SUCCESS(f"Wrote the baseline to {options['baseline']}."))
+            return
+
+        baseline = self.load_baseline(options["baseline"])
+        if baseline is None:
+            self.stdout.write(self.style.WARNING(f"No baseline at {options['baseline']}."))
+            return
+        if baseline["dataset"] != dataset:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"The baseline was measured on {baseline['dataset']}, not compared."
+                )
+            )
+            return
+        if baseline.get("run") != run:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"The baseline was measured with {baseline.get('run')} instead of {run}, "
+                    "not compared."
+                )
+            )
+            return
+
+        regressions = []
+        for name, result in results.items():
+            if name in baseline["scenarios"]:
+                regressions += compare(
+                    name, result, baseline["scenarios"][name], options["tolerance"]
+                )
+        for regression in regressions:
+            self.stdout.write(self.style.ERROR(f"REGRESSION {regression}"))
+        if regressions:
+            raise CommandError(f"{len(regressions)} regressions against the baseline.")
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline."))
+
+    def load_baseline(self, path: Path):
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def benchmark(self, dataset: dict, names: list, options: dict) -> dict:
+        context = BenchmarkContext(seed(**dataset), options["seed"])
+        results = {}
+        for name in names:
+            scenario = SCENARIOS[name]
+            repeat = options["password_repeat"] if scenario.hashes_password else options["repeat"]
+            results[name] = self.run_scenario(scenario, context, repeat, options["warmup"])
+        return results
+
+    def run_scenario(self, scenario, context, repeat: int, warmup: int) -> dict:
+        client = APIClient()
+        if scenario.authenticated:
+            token = RefreshToken.for_user(context.user).access_token
+            client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        requests = [scenario.build(context) for _ in range(warmup + repeat)]
+
+        for method, url, data in requests[:warmup]:
+            self.send(client, scenario, method, url, data)
+
+        # Don't let the garbage of the previous scenarios be collected during this one.
+        gc.collect()
+        timings = []
+        with CaptureQueriesContext(connection) as queries:
+            for method, url, data in requests[warmup:]:
+                started = time.perf_counter()
+                self.send(client, scenario, method, url, data)
+                timings.append(time.perf_counter() - started)
+
+        timings.sort()
+        return {
+            "p50_ms": round(percentile(timings, 0.50) * 1000, 3),
+            "p95_ms": round(percentile(timings, 0.95) * 1000, 3),
+            "p99_ms": round(percentile(timings, 0.99) * 1000, 3),
+            "throughput": round(len(timings) / sum(timings), 1),
+            "queries": round(len(queries) / len(timings), 2),
+        }
+
+    def send(self, client: APIClient, scenario, method: str, url: str, data) -> None:
+        if method == "get":
+            response = client.get(url, data)
+        else:
+            response = getattr(client, method)(url, data, format="json")
+        if response.status_code != scenario.status:
+            raise CommandError(
+                f"{scenario.name}: {method.upper()} {url} answered {response.status_code}, "
+                f"expected {scenario.status}."
+            )
+
+
+def percentile(timings: list, value: float) -> float:
+    return timings[min(int(len(timings) * value), len(timings) - 1)]
+
+
+def compare(name: str, result: dict, baseline: dict, tolerance: float) -> list:
+    """The regressions of a scenario's result against its baseline."""
+    regressions = []
+    # p99 is reported only: with a hundred requests it's the slowest one or two.
+    for key in ("p50_ms", "p95_ms"):
+        if result[key] > baseline[key] * (1 + tolerance):
+            regressions.append(f"{name} {key}: {result[key]:.2f} > {baseline[key]:.2f}")
+    if result["throughput"] < baseline["throughput"] / (1 + tolerance):
+        regressions.append(
+            f"{name} throughput: {result['throughput']:.1f} < {baseline['throughput']:.1f}"
+        )
+    # Query counts don't depend on the machine, any increase is a regression.
+    if result["queries"] > baseline["queries"]:
+        regressions.append(f"{name} queries: {result['queries']:g} > {baseline['queries']:g}")
+    return regressions
+
+
+def seed(users: int, projects: int, entries: int) -> dict:
+    """Creates the benchmark dataset, returning the users and projects."""
+    # Hashing is slow on purpose, so every user gets the same hash.
+    password = make_password(PASSWORD)
+    user_rows = User.objects.bulk_create(
+        User(username=f"benchmark-{index}@example.com", password=password)
+        for index in range(users)
+    )
+    project_rows = ProjectsModel.objects.bulk_create(
+        ProjectsModel(title=f"Benchmark project {index}") for index in range(projects)
+    )
+    # bulk_create sends no post_save, so the signal doesn't drop the cached responses.
+    invalidate_projects()
+    TimeTrackingModel.objects.bulk_create(
+        (
+            TimeTrackingModel(
+                user=user,
+                project=project_rows[(user_index + index) % len(project_rows)],
+                date_worked=FIRST_DAY + datetime.timedelta(hours=index * 5),
+                work_description=f"Benchmark entry {index}",
+                hours=index % 8 + 1,
+            )
+            for user_index, user in enumerate(user_rows)
+            for index in range(entries)
+        ),
+        batch_size=5000,
+    )
+    rebuild_rollups()
+    return {"users": user_rows, "projects": project_rows}
+
+
+class BenchmarkContext:
+    """The dataset and the state the scenarios build their requests from."""
+
+    def __init__(self, rows: dict, seed: int):
+        self.users = rows["users"]
+        self.projects = rows["projects"]
+        self.user = self.users[0]
+        self.random = random.Random(seed)
+        self.counter = 0
+
+    def next(self) -> int:
+        self.counter += 1
+        return self.counter
+
+    def project(self) -> ProjectsModel:
+        return self.random.choice(self.projects)
+
+
+class Scenario:
+    def __init__(
+        self,
+        name: str,
+        build,
+        status_code: int = status.HTTP_200_OK,
+        authenticated: bool = True,
+        hashes_password: bool = False,
+    ):
+        self.name = name
+        # Returns the (method, url, data) of the next request.
+        self.build = build
+        self.status = status_code
+        self.authenticated = authenticated
+        self.hashes_password = hashes_password
+
+
+def build_project_delete(context: BenchmarkContext):
+    project = ProjectsModel.objects.create(title=f"Benchmark deleted project {context.next()}")
+    return "delete", reverse("project-detail", kwargs={"pk": project.id}), None
+
+
+def build_time_tracking_filter(context: BenchmarkContext):
+    start = FIRST_DAY.date() + datetime.timedelta(weeks=context.random.randrange(4))
+    data = {
+        "project": context.project().id,
+        "start_date": start.isoformat(),
+        "end_date": (start + datetime.timedelta(weeks=4)).isoformat(),
+    }
+    return "get", reverse("time-tracking-list"), data
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario(
+            "login",
+            lambda context: (
+                "post",
+                reverse("login"),
+                {"username": context.random.choice(context.users).username, "password": PASSWORD},
+            ),
+            authenticated=False,
+            hashes_password=True,
+        ),
+        Scenario(
+            "register",
+            lambda context: (
+                "post",
+                reverse("register-list"),
+                {"username": f"benchmark-new-{context.next()}@example.com", "password": PASSWORD},
+            ),
+            status.HTTP_201_CREATED,
+            authenticated=False,
+            hashes_password=True,
+        ),
+        Scenario("project-list", lambda context: ("get", reverse("project-list"), None)),
+        Scenario(
+            "project-detail",
+            lambda context: (
+                "get",
+                reverse("project-detail", kwargs={"pk": context.project().id}),
+                None,
+            ),
+        ),
+        Scenario(
+            "project-create",
+            lambda context: (
+                "post",
+                reverse("project-list"),
+                {"title": f"Benchmark new project {context.next()}"},
+            ),
+            status.HTTP_201_CREATED,
+        ),
+        Scenario(
+            "project-update",
+            lambda context: (
+                "patch",
+                reverse("project-detail", kwargs={"pk": context.project().id}),
+                {"title": f"Benchmark renamed project {context.next()}"},
+            ),
+        ),
+        Scenario("project-delete", build_project_delete, status.HTTP_204_NO_CONTENT),
+        Scenario(
+            "time-tracking-list", lambda context: ("get", reverse("time-tracking-list"), None)
+        ),
+        Scenario(
+            "time-tracking-page",
+            lambda context: ("get", reverse("time-tracking-list"), {"page_size": 100}),
+        ),
+        Scenario("time-tracking-filter", build_time_tracking_filter),
+        Scenario(
+            "time-tracking-create",
+            lambda context: (
+                "post",
+                reverse("time-tracking-list"),
+                {
+                    "project": context.project().id,
+                    "date_worked": (
+                        FIRST_DAY + datetime.timedelta(minutes=context.next())
+                    ).isoformat(),
+                    "work_description": "Benchmark entry",
+                    "hours": 1,
+                },
+            ),
+            status.HTTP_201_CREATED,
+        ),
+    ]
+}
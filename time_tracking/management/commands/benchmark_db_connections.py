@@ -0,0 +1,77 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure per-request database latency with the configured connection "
+        "handling (persistent connections or pool) against opening a new "
+        "connection for every request."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=500, help="Requests per mode.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS, help="Database alias.")
+
+    def handle(self, *args, **options) -> None:
+        connection = connections[options["database"]]
+        settings_dict = connection.settings_dict
+        pool = settings_dict.get("OPTIONS", {}).get("pool")
+        self.stdout.write(
+            f"{connection.alias} ({connection.vendor}): "
+            f"CONN_MAX_AGE={settings_dict['CONN_MAX_AGE']}, "
+            f"CONN_HEALTH_CHECKS={settings_dict['CONN_HEALTH_CHECKS']}, pool={bool(pool)}"
+        )
+
+        def configured():
+            # What Django does around each request: close_old_connections()
+            # on request_started and request_finished.
+            close_old_connections()
+            self.query(connection)
+            close_old_connections()
+
+        def new_connection():
+            # A connection of its own, outside any pool.
+            raw = connection.Database.connect(**connection.get_connection_params())
+            try:
+                cursor = raw.cursor()
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            finally:
+                raw.close()
+
+        baseline = self.measure(new_connection, options["requests"])
+        current = self.measure(configured, options["requests"])
+        self.report("new connection per request", baseline)
+        self.report("configured", current)
+        self.stdout.write(
+            f"Saved per request: {(statistics.mean(baseline) - statistics.mean(current)) * 1000:.3f} ms"
+        )
+
+        pool_object = getattr(connection, "pool", None)
+        if pool_object is not None:
+            self.stdout.write(f"Pool stats: {pool_object.get_stats()}")
+
+    def query(self, connection) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+
+    def measure(self, request, requests: int) -> list:
+        request()  # Warm up.
+        timings = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            request()
+            timings.append(time.perf_counter() - started)
+        return timings
+
+    def report(self, name: str, timings: list) -> None:
+        timings = sorted(timings)
+        self.stdout.write(
+            f"{name}: mean {statistics.mean(timings) * 1000:.3f} ms, "
+            f"p95 {timings[int(len(timings) * 0.95)] * 1000:.3f} ms"
+        )
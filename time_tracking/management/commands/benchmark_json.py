@@ -0,0 +1,92 @@
+import datetime
+import io
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from time_tracking.renderers import FastJSONParser, FastJSONRenderer, orjson
+from time_tracking.serializers import TimeTrackingValuesSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare render/parse time and peak memory of DRF's JSON renderer and "
+        "parser with the orjson ones on a time tracking list payload."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=50000, help="Entries in the payload.")
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="Runs per step; the best time is reported."
+        )
+
+    def handle(self, *args, **options) -> None:
+        if orjson is None:
+            self.stderr.write("orjson isn't installed, the fast classes fall back to the stdlib.")
+
+        data = self.build_payload(options["rows"])
+        pairs = {
+            "stdlib": (JSONRenderer(), JSONParser()),
+            "orjson": (FastJSONRenderer(), FastJSONParser()),
+        }
+
+        rendered = {}
+        for name, (renderer, parser) in pairs.items():
+            body, render_time, render_peak = self.measure(
+                lambda: renderer.render(data), options["repeat"]
+            )
+            _, parse_time, parse_peak = self.measure(
+                lambda: parser.parse(io.BytesIO(body)), options["repeat"]
+            )
+            rendered[name] = body
+            self.stdout.write(
+                f"{name}: render {render_time * 1000:.1f} ms (peak {render_peak / 2**20:.1f} MiB), "
+                f"parse {parse_time * 1000:.1f} ms (peak {parse_peak / 2**20:.1f} MiB), "
+                f"{len(body) / 2**20:.1f} MiB body"
+            )
+
+        if len(set(rendered.values())) != 1:
+            raise CommandError("The renderers' outputs differ.")
+        self.stdout.write(self.style.SUCCESS("Both renderers produce identical output."))
+
+    def build_payload(self, rows: int) -> list:
+        """Rows shaped like the list endpoint's response, without a database."""
+        serializer = TimeTrackingValuesSerializer()
+        now = timezone.now()
+        return [
+            serializer.to_representation(
+                {
+                    "id": index,
+                    "project_id": index % 10 + 1,
+                    "user_id": 1,
+                    "date_worked": now - datetime.timedelta(hours=index),
+                    "work_description": f"Worked on ticket #{index}: review, fixes and tests",
+                    "hours": index % 8 + 1,
+                    "project__title": f"Project {index % 10 + 1}",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            for index in range(rows)
+        ]
+
+    def measure(self, step, repeat: int) -> tuple:
+        """Returns the step's result, its best time and its peak traced memory."""
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = step()
+            timings.append(time.perf_counter() - started)
+
+        # Traced separately, as tracemalloc slows the step down.
+        tracemalloc.start()
+        step()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return result, min(timings), peak
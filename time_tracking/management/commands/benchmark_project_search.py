@@ -0,0 +1,61 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import RequestFactory
+
+from rest_framework.test import force_authenticate
+
+from time_tracking.management.benchmarking import rolled_back
+from time_tracking.models import ProjectsModel
+from time_tracking.views import ProjectsViewSet
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the project search endpoint's latency with many projects. "
+        "The generated projects are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--projects", type=int, default=100000, help="Projects to create.")
+        parser.add_argument("--repeat", type=int, default=200, help="Searches per term.")
+        parser.add_argument(
+            "--terms", nargs="+", default=["a", "acm", "client 4", "zzz"], help="Terms to search."
+        )
+
+    def handle(self, *args, **options) -> None:
+        with rolled_back():
+            self.benchmark(options["projects"], options["repeat"], options["terms"])
+
+    def benchmark(self, projects: int, repeat: int, terms: list) -> None:
+        ProjectsModel.objects.bulk_create(
+            (
+                ProjectsModel(title=f"{('Acme', 'Globex', 'Initech')[index % 3]} client {index}")
+                for index in range(projects)
+            ),
+            batch_size=5000,
+        )
+        search = ProjectsViewSet.as_view({"get": "search"})
+        factory = RequestFactory()
+
+        for term in terms:
+            timings = []
+            for _ in range(repeat):
+                request = factory.get("/api/project/search", {"q": term, "limit": 10})
+                force_authenticate(request, user=_AnyUser())
+                started = time.perf_counter()
+                response = search(request)
+                timings.append(time.perf_counter() - started)
+            timings.sort()
+            self.stdout.write(
+                f"q={term!r}: {len(response.data)} results, "
+                f"p50 {timings[len(timings) // 2] * 1000:.2f} ms, "
+                f"p95 {timings[int(len(timings) * 0.95)] * 1000:.2f} ms"
+            )
+
+
+class _AnyUser:
+    """Authenticated stand-in user, so the benchmark needs no user rows."""
+
+    is_authenticated = True
+    is_active = True
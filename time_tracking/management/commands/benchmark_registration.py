@@ -0,0 +1,71 @@
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+from time_tracking.management.benchmarking import rolled_back
+from time_tracking.serializers import UserRegistrationSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure registrations/sec and username checks/sec with many existing "
+        "users. The generated users are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--existing", type=int, default=1_000_000, help="Users to create first."
+        )
+        parser.add_argument(
+            "--registrations", type=int, default=50, help="Registrations to time."
+        )
+        parser.add_argument(
+            "--checks", type=int, default=2000, help="Username checks to time."
+        )
+
+    def handle(self, *args, **options) -> None:
+        with rolled_back():
+            self.benchmark(options["existing"], options["registrations"], options["checks"])
+
+    def benchmark(self, existing: int, registrations: int, checks: int) -> None:
+        started = time.perf_counter()
+        # Hash once; every generated user shares it.
+        password = make_password("Benchmark@123")
+        for offset in range(0, existing, 10000):
+            User.objects.bulk_create(
+                User(
+                    username=f"existing{index}@example.com",
+                    email=f"existing{index}@example.com",
+                    password=password,
+                )
+                for index in range(offset, min(offset + 10000, existing))
+            )
+        self.stdout.write(f"Created {existing:,} users in {time.perf_counter() - started:.1f} s")
+
+        serializer = UserRegistrationSerializer()
+        lookup = User.objects.alias(
+            username_lower=Lower("username"), email_lower=Lower("email")
+        ).filter(Q(username_lower="existing0@example.com") | Q(email_lower="existing0@example.com"))
+        self.stdout.write(f"Username check plan:\n{lookup.explain()}")
+
+        started = time.perf_counter()
+        for index in range(checks):
+            serializer.validate_username(f"New{index}@Example.com")
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"Username checks: {checks / elapsed:,.0f}/s")
+
+        started = time.perf_counter()
+        for index in range(registrations):
+            registration = UserRegistrationSerializer(
+                data={"username": f"new{index}@example.com", "password": "Benchmark@123"}
+            )
+            registration.is_valid(raise_exception=True)
+            registration.save()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"Registrations: {registrations / elapsed:,.1f}/s (password hashing included)"
+        )
@@ -0,0 +1,75 @@
+import datetime
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone
+
+from rest_framework.renderers import JSONRenderer
+
+from time_tracking.management.benchmarking import rolled_back
+from time_tracking.models import ProjectsModel, TimeTrackingModel
+from time_tracking.serializers import TimeTrackingModelSerializer, TimeTrackingValuesSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rows/sec of TimeTrackingModelSerializer and TimeTrackingValuesSerializer "
+        "on generated entries. Nothing is left in the database."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=10000, help="Entries to serialize.")
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="Runs per path; the best one is reported."
+        )
+
+    def handle(self, *args, **options) -> None:
+        with rolled_back():
+            self.benchmark(options["rows"], options["repeat"])
+
+    def benchmark(self, rows: int, repeat: int) -> None:
+        user = User.objects.create(username="benchmark-serialization@example.com")
+        projects = ProjectsModel.objects.bulk_create(
+            ProjectsModel(title=f"Benchmark project {index}") for index in range(10)
+        )
+        start = timezone.now()
+        TimeTrackingModel.objects.bulk_create(
+            (
+                TimeTrackingModel(
+                    user=user,
+                    project=projects[index % len(projects)],
+                    date_worked=start - datetime.timedelta(hours=index),
+                    work_description=f"Benchmark entry {index}",
+                    hours=index % 8 + 1,
+                )
+                for index in range(rows)
+            ),
+            batch_size=500,
+        )
+        queryset = TimeTrackingModel.objects.filter(user=user).order_by("id")
+
+        paths = {
+            "TimeTrackingModelSerializer": lambda: TimeTrackingModelSerializer(
+                queryset.select_related("project"), many=True
+            ).data,
+            "TimeTrackingValuesSerializer": lambda: TimeTrackingValuesSerializer(
+                TimeTrackingValuesSerializer.values(queryset)
+            ).data,
+        }
+
+        rendered = {}
+        for name, serialize in paths.items():
+            timings = []
+            for _ in range(repeat):
+                # Querysets are re-evaluated on every run, so the fetch is timed too.
+                started = time.perf_counter()
+                data = serialize()
+                timings.append(time.perf_counter() - started)
+            rendered[name] = JSONRenderer().render(data)
+            best = min(timings)
+            self.stdout.write(f"{name}: {best * 1000:.1f} ms, {rows / best:,.0f} rows/s")
+
+        if len(set(rendered.values())) != 1:
+            raise CommandError("The serializers' outputs differ.")
+        self.stdout.write(self.style.SUCCESS("Both serializers render identical output."))
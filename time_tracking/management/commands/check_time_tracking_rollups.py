@@ -0,0 +1,43 @@
+import argparse
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from time_tracking.rollups import find_rollup_mismatches
+
+
+def parse_date(value: str) -> datetime.date:
+    """argparse type for YYYY-MM-DD dates."""
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date: {value}")
+
+
+class Command(BaseCommand):
+    help = "Compare the daily time tracking rollups against the raw entries."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--start-date", type=parse_date, help="First day to check (YYYY-MM-DD)."
+        )
+        parser.add_argument(
+            "--end-date", type=parse_date, help="Last day to check (YYYY-MM-DD)."
+        )
+
+    def handle(self, *args, **options) -> None:
+        mismatches = find_rollup_mismatches(options["start_date"], options["end_date"])
+
+        for (user_id, project_id, day), expected, actual in mismatches:
+            self.stdout.write(
+                f"user={user_id} project={project_id} day={day}: "
+                f"expected (hours, entries)={expected}, rollup={actual}"
+            )
+
+        if mismatches:
+            raise CommandError(
+                f"{len(mismatches)} daily rollup rows don't match the entries. "
+                "Run rebuild_time_tracking_rollups to fix them."
+            )
+
+        self.stdout.write(self.style.SUCCESS("Daily rollups match the entries."))
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from time_tracking.management.commands.check_time_tracking_rollups import parse_date
+from time_tracking.partitions import (
+    MONTHS_AHEAD,
+    add_months,
+    count_default_entries,
+    ensure_partitions,
+    is_partitioned,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the monthly partitions of the time entries table on PostgreSQL ahead of time. "
+        "Run it e.g. monthly from cron."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--months",
+            type=int,
+            default=MONTHS_AHEAD,
+            help="Months to create ahead of the current one.",
+        )
+        parser.add_argument(
+            "--start-date",
+            type=parse_date,
+            help="Also create the months from this day's (YYYY-MM-DD), e.g. before an import.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if not is_partitioned():
+            self.stdout.write("The time entries table isn't partitioned on this database.")
+            return
+
+        today = timezone.now().date()
+        last = add_months(today, options["months"])
+        created = ensure_partitions(options["start_date"] or today, last)
+        for name in created:
+            self.stdout.write(f"Created {name}.")
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {len(created)} partitions, up to {last:%Y-%m}.")
+        )
+
+        entries = count_default_entries()
+        if entries:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{entries} entries are in the default partition. Create their months "
+                    "with --start-date or --months."
+                )
+            )
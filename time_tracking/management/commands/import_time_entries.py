@@ -0,0 +1,42 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from rest_framework.exceptions import ValidationError
+
+from time_tracking.imports import TimeEntryCSVImporter
+
+
+class Command(BaseCommand):
+    help = (
+        "Import time entries for a user from a CSV file with the columns "
+        "project_title, date_worked, work_description and hours."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", help="CSV file to import.")
+        parser.add_argument("--user", required=True, help="Username the entries belong to.")
+        parser.add_argument(
+            "--chunk-size", type=int, default=500, help="Entries inserted per bulk_create."
+        )
+
+    def handle(self, *args, **options) -> None:
+        try:
+            user = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f'User "{options["user"]}" does not exist.')
+
+        importer = TimeEntryCSVImporter(user, chunk_size=options["chunk_size"])
+        try:
+            with open(options["path"], encoding="utf-8-sig", newline="") as lines:
+                report = importer.run(lines)
+        except ValidationError as exc:
+            raise CommandError(exc.detail["file"][0])
+
+        for error in report["errors"]:
+            self.stdout.write(f"Line {error['line']}: {error['errors']}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {report['created']} entries, skipped {report['duplicates']} "
+                f"duplicates and {report['invalid']} invalid rows."
+            )
+        )
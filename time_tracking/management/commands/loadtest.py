@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from rest_framework_simplejwt.tokens import RefreshToken
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class Command(BaseCommand):
+    help = (
+        "Send concurrent GET requests to running deployments and compare their "
+        "throughput and latency, e.g. a WSGI server on :8000 and an ASGI one on :8001:\n"
+        "  loadtest --user me@example.com "
+        "--target wsgi=http://localhost:8000/api/time-tracking "
+        "--target asgi=http://localhost:8001/api/async/time-tracking"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--target",
+            action="append",
+            required=True,
+            help="name=url of an endpoint to load, repeatable.",
+        )
+        parser.add_argument(
+            "--user", required=True, help="Username to sign the JWT access token for."
+        )
+        parser.add_argument("--requests", type=int, default=2000, help="Requests per target.")
+        parser.add_argument("--concurrency", type=int, default=50, help="Requests in flight.")
+
+    def handle(self, *args, **options) -> None:
+        if aiohttp is None:
+            raise CommandError("loadtest needs aiohttp installed.")
+
+        try:
+            user = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['user']} not found.")
+        token = str(RefreshToken.for_user(user).access_token)
+
+        for target in options["target"]:
+            name, _, url = target.partition("=")
+            if not url:
+                raise CommandError(f"Expected name=url, got {target}.")
+            results = asyncio.run(
+                self.load(url, token, options["requests"], options["concurrency"])
+            )
+            self.report(name, results)
+
+    async def load(self, url: str, token: str, requests: int, concurrency: int) -> dict:
+        latencies, errors = [], 0
+        pending = iter(range(requests))
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+
+            async def worker():
+                nonlocal errors
+                for _ in pending:
+                    started = time.perf_counter()
+                    try:
+                        async with session.get(url) as response:
+                            await response.read()
+                            if response.status != 200:
+                                errors += 1
+                    except aiohttp.ClientError:
+                        errors += 1
+                    latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+
+        return {"latencies": sorted(latencies), "errors": errors, "elapsed": elapsed}
+
+    def report(self, name: str, results: dict) -> None:
+        latencies = results["latencies"]
+
+        def percentile(value: float) -> float:
+            return latencies[min(int(len(latencies) * value), len(latencies) - 1)] * 1000
+
+        self.stdout.write(
+            f"{name}: {len(latencies) / results['elapsed']:,.0f} req/s, "
+            f"p50 {percentile(0.50):.1f} ms, p95 {percentile(0.95):.1f} ms, "
+            f"p99 {percentile(0.99):.1f} ms, {results['errors']} errors"
+        )
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from time_tracking.management.commands.check_time_tracking_rollups import parse_date
+from time_tracking.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily time tracking rollups from the raw entries."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--start-date", type=parse_date, help="First day to rebuild (YYYY-MM-DD)."
+        )
+        parser.add_argument(
+            "--end-date", type=parse_date, help="Last day to rebuild (YYYY-MM-DD)."
+        )
+
+    def handle(self, *args, **options) -> None:
+        rows = rebuild_rollups(options["start_date"], options["end_date"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} daily rollup rows."))
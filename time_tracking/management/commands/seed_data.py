@@ -0,0 +1,107 @@
+import datetime
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from time_tracking.management.commands.check_time_tracking_rollups import parse_date
+from time_tracking.models import ProjectsModel
+from time_tracking.seeding import DATE_DISTRIBUTIONS, ENTRY_DISTRIBUTIONS, DataSeeder
+
+# A fixed default, so the same options generate the same dataset on any day.
+DEFAULT_START_DATE = datetime.date(2024, 1, 1)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a deterministic synthetic dataset of users, projects and time entries, "
+        "e.g. to reproduce production-scale performance locally:\n"
+        "  seed_data --users 10000 --projects 1000 --entries 50000000 "
+        "--entry-distribution pareto --date-distribution weekdays"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--users", type=int, default=100, help="Users to create.")
+        parser.add_argument("--projects", type=int, default=20, help="Projects to create.")
+        parser.add_argument("--entries", type=int, default=10000, help="Entries in total.")
+        parser.add_argument(
+            "--entry-distribution",
+            choices=ENTRY_DISTRIBUTIONS,
+            default="uniform",
+            help="How entries are split between users.",
+        )
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=1.2,
+            help="Exponent of the pareto distribution, higher for fewer heavy users.",
+        )
+        parser.add_argument(
+            "--projects-per-user", type=int, default=5, help="Projects each user works on."
+        )
+        parser.add_argument(
+            "--start-date",
+            type=parse_date,
+            default=DEFAULT_START_DATE,
+            help=f"First day of entries (YYYY-MM-DD, default {DEFAULT_START_DATE}).",
+        )
+        parser.add_argument("--days", type=int, default=365, help="Days the entries span.")
+        parser.add_argument(
+            "--date-distribution",
+            choices=DATE_DISTRIBUTIONS,
+            default="uniform",
+            help="How entries are spread over the days.",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the generator.")
+        parser.add_argument(
+            "--prefix", default="seed", help="Prefix of the generated usernames and titles."
+        )
+        parser.add_argument(
+            "--password", default="Seed@123", help="Password of every generated user."
+        )
+        parser.add_argument("--batch-size", type=int, default=10000, help="Rows per batch.")
+        parser.add_argument(
+            "--no-copy",
+            action="store_true",
+            help="Insert entries with bulk_create even on PostgreSQL.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if min(options["users"], options["projects"], options["days"]) < 1:
+            raise CommandError("--users, --projects and --days must be at least 1.")
+        prefix = options["prefix"]
+        if (
+            User.objects.filter(username__startswith=f"{prefix}-user-").exists()
+            or ProjectsModel.objects.filter(title__startswith=f"{prefix} project ").exists()
+        ):
+            raise CommandError(f"Data prefixed {prefix} exists already, choose another --prefix.")
+
+        seeder = DataSeeder(
+            prefix=prefix,
+            seed=options["seed"],
+            password=options["password"],
+            batch_size=options["batch_size"],
+            use_copy=not options["no_copy"],
+            write=self.stdout.write,
+        )
+        started = time.perf_counter()
+        result = seeder.seed(
+            users=options["users"],
+            projects=options["projects"],
+            entries=options["entries"],
+            start=options["start_date"],
+            days=options["days"],
+            entry_distribution=options["entry_distribution"],
+            skew=options["skew"],
+            date_distribution=options["date_distribution"],
+            projects_per_user=options["projects_per_user"],
+        )
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {result['users']} users, {result['projects']} projects and "
+                f"{result['entries']} entries ({'COPY' if seeder.use_copy else 'bulk_create'}, "
+                f"{result['entries'] / elapsed:,.0f} entries/s overall) in {elapsed:.1f} s."
+            )
+        )
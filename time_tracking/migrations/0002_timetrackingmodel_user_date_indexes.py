@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-18 08:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('time_tracking', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='timetrackingmodel',
+            index=models.Index(fields=['user', 'date_worked'], name='tt_user_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timetrackingmodel',
+            index=models.Index(fields=['user', 'project', 'date_worked'], name='tt_user_project_date_idx'),
+        ),
+    ]
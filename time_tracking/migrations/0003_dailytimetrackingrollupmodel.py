@@ -0,0 +1,58 @@
+# Generated by Django 5.1.7 on 2026-10-18 08:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+def populate_rollups(apps, schema_editor):
+    """Roll up the entries that exist before the rollup table does."""
+    TimeTrackingModel = apps.get_model("time_tracking", "TimeTrackingModel")
+    DailyTimeTrackingRollupModel = apps.get_model("time_tracking", "DailyTimeTrackingRollupModel")
+
+    rows = (
+        TimeTrackingModel.objects.using(schema_editor.connection.alias)
+        .order_by()
+        .annotate(day=TruncDate("date_worked", tzinfo=timezone.get_default_timezone()))
+        .values_list("user_id", "project_id", "day")
+        .annotate(total_hours=Sum("hours"), total_entries=Count("id"))
+    )
+    DailyTimeTrackingRollupModel.objects.using(schema_editor.connection.alias).bulk_create(
+        (
+            DailyTimeTrackingRollupModel(
+                user_id=user_id, project_id=project_id, day=day, hours=hours, entries=entries
+            )
+            for user_id, project_id, day, hours, entries in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('time_tracking', '0002_timetrackingmodel_user_date_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyTimeTrackingRollupModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('hours', models.IntegerField(default=0)),
+                ('entries', models.IntegerField(default=0)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to='time_tracking.projectsmodel')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'day'], name='tt_rollup_user_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'project', 'day'), name='tt_rollup_user_project_day_uniq')],
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_username_duplicates(apps, schema_editor):
+    """
+    Fails with the usernames the unique index would reject, instead of an
+    IntegrityError, when some differ only by case (possible through the
+    admin or createsuperuser). Rename or remove them, then migrate again.
+    """
+    User = apps.get_model("auth", "User")
+    duplicates = (
+        User.objects.using(schema_editor.connection.alias)
+        .values(lowered=Lower("username"))
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .values_list("lowered", flat=True)
+    )
+    if not duplicates:
+        return
+    usernames = (
+        User.objects.using(schema_editor.connection.alias)
+        .annotate(lowered=Lower("username"))
+        .filter(lowered__in=list(duplicates))
+        .order_by("lowered", "id")
+        .values_list("id", "username")
+    )
+    listed = "\n".join(f"  id={pk} username={username!r}" for pk, username in usernames)
+    raise RuntimeError(
+        "auth_user has usernames differing only by case, which the unique "
+        f"LOWER(username) index can't hold. Rename or remove all but one of each:\n{listed}"
+    )
+
+
+class Migration(migrations.Migration):
+    """
+    Functional lower() indexes on auth_user for the registration's
+    case-insensitive username/email check. The username one is unique, so
+    two concurrent registrations of the same address can't both succeed.
+    """
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('time_tracking', '0003_dailytimetrackingrollupmodel'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_username_duplicates, migrations.RunPython.noop),
+        migrations.RunSQL(
+            sql='CREATE UNIQUE INDEX auth_user_username_lower_uniq ON auth_user (LOWER(username));',
+            reverse_sql='DROP INDEX IF EXISTS auth_user_username_lower_uniq;',
+        ),
+        migrations.RunSQL(
+            sql='CREATE INDEX auth_user_email_lower_idx ON auth_user (LOWER(email));',
+            reverse_sql='DROP INDEX IF EXISTS auth_user_email_lower_idx;',
+        ),
+    ]
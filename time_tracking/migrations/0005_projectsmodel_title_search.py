@@ -0,0 +1,89 @@
+# Generated by Django 5.1.7 on 2026-10-18 08:46
+
+from django.db import migrations, models
+from django.db.models import Count
+
+# Indexes serving the project search, per database vendor. The lookups it
+# runs are title__istartswith and title__icontains on live projects.
+SEARCH_INDEXES = {
+    "postgresql": [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm;",
+        # icontains and istartswith compile to UPPER("title"::text) LIKE UPPER(...).
+        "CREATE INDEX project_title_trgm_idx ON time_tracking_projectsmodel "
+        "USING gin (UPPER(title) gin_trgm_ops) WHERE NOT is_deleted;",
+        # Prefixes too short for trigrams.
+        "CREATE INDEX project_title_prefix_idx ON time_tracking_projectsmodel "
+        "(UPPER(title) text_pattern_ops) WHERE NOT is_deleted;",
+    ],
+    # SQLite's LIKE is case-insensitive, so a NOCASE index serves prefixes.
+    "sqlite": [
+        "CREATE INDEX project_title_prefix_idx ON time_tracking_projectsmodel "
+        "(title COLLATE NOCASE) WHERE NOT is_deleted;",
+    ],
+}
+SEARCH_INDEX_NAMES = ["project_title_trgm_idx", "project_title_prefix_idx"]
+
+
+def check_title_duplicates(apps, schema_editor):
+    """
+    Fails with the live project titles the unique constraint would reject,
+    instead of an IntegrityError. Rename or delete all but one project of
+    each title, then migrate again.
+    """
+    Project = apps.get_model("time_tracking", "ProjectsModel")
+    live = Project.objects.using(schema_editor.connection.alias).filter(is_deleted=False)
+    duplicates = (
+        live.values("title")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .values_list("title", flat=True)
+    )
+    if not duplicates:
+        return
+    projects = (
+        live.filter(title__in=list(duplicates))
+        .order_by("title", "id")
+        .values_list("id", "title")
+    )
+    listed = "\n".join(f"  id={pk} title={title!r}" for pk, title in projects)
+    raise RuntimeError(
+        "time_tracking_projectsmodel has live projects sharing a title, which the "
+        "project_title_active_uniq constraint can't hold. Rename or delete all but "
+        f"one of each:\n{listed}"
+    )
+
+
+def create_search_indexes(apps, schema_editor):
+    statements = SEARCH_INDEXES.get(
+        schema_editor.connection.vendor,
+        ["CREATE INDEX project_title_prefix_idx ON time_tracking_projectsmodel (title);"],
+    )
+    if schema_editor.connection.vendor == "postgresql":
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+            if cursor.fetchone() is None:
+                # Servers without the contrib extensions: substring search scans.
+                statements = [statement for statement in statements if "trgm" not in statement]
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def drop_search_indexes(apps, schema_editor):
+    for name in SEARCH_INDEX_NAMES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name};")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('time_tracking', '0004_auth_user_lower_username_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_title_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='projectsmodel',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('title',), name='project_title_active_uniq'),
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
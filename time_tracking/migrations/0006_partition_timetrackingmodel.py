@@ -0,0 +1,118 @@
+
+from django.db import migrations
+from django.utils import timezone
+
+from time_tracking.partitions import (
+    DEFAULT_PARTITION,
+    MONTHS_AHEAD,
+    TABLE,
+    add_months,
+    create_partition,
+    month_range,
+)
+
+SEQUENCE = f"{TABLE}_id_seq"
+
+
+def table_definition(cursor) -> tuple:
+    """The secondary index and foreign key statements of the table, and its id sequence state."""
+    cursor.execute(
+        """
+        SELECT pg_get_indexdef(indexrelid) FROM pg_index
+        WHERE indrelid = to_regclass(%s) AND NOT indisprimary
+        """,
+        [TABLE],
+    )
+    # A partitioned table's are "ON ONLY" it, which wouldn't index the partitions.
+    indexes = [definition.replace(" ON ONLY ", " ON ") for definition, in cursor.fetchall()]
+    cursor.execute(
+        """
+        SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+        WHERE conrelid = to_regclass(%s) AND contype = 'f'
+        """,
+        [TABLE],
+    )
+    foreign_keys = [
+        f"ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}"
+        for name, definition in cursor.fetchall()
+    ]
+    cursor.execute(f"SELECT last_value, is_called FROM {SEQUENCE}")
+    return indexes + foreign_keys, cursor.fetchone()
+
+
+def rebuild_table(schema_editor, partitioned: bool) -> None:
+    """
+    Copies the entries into a new table, partitioned by month or plain, with
+    the same indexes, foreign keys and next id.
+    """
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        statements, (last_value, is_called) = table_definition(cursor)
+        cursor.execute(f"SELECT min(date_worked) FROM {TABLE}")
+        first_worked = cursor.fetchone()[0]
+
+    old = f"{TABLE}_old"
+    schema_editor.execute(f"ALTER TABLE {TABLE} RENAME TO {old}")
+    # Frees the sequence's name: an identity sequence on the plain table, an
+    # owned one on the partitioned table, which PostgreSQL 16 can't give an
+    # identity column.
+    if partitioned:
+        schema_editor.execute(f"ALTER TABLE {old} ALTER COLUMN id DROP IDENTITY")
+    else:
+        schema_editor.execute(f"ALTER TABLE {old} ALTER COLUMN id DROP DEFAULT")
+        schema_editor.execute(f"DROP SEQUENCE {SEQUENCE}")
+
+    if partitioned:
+        schema_editor.execute(
+            f"CREATE TABLE {TABLE} (LIKE {old}) PARTITION BY RANGE (date_worked)"
+        )
+        schema_editor.execute(f"CREATE SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id")
+        schema_editor.execute(
+            f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{SEQUENCE}')"
+        )
+        schema_editor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT")
+        today = timezone.now().date()
+        first = first_worked.date() if first_worked else today
+        for month in month_range(first, add_months(today, MONTHS_AHEAD)):
+            create_partition(month, connection.alias)
+    else:
+        schema_editor.execute(f"CREATE TABLE {TABLE} (LIKE {old})")
+        schema_editor.execute(
+            f"ALTER TABLE {TABLE} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY"
+        )
+    schema_editor.execute(f"SELECT setval('{SEQUENCE}', %s, %s)", [last_value, is_called])
+
+    schema_editor.execute(f"INSERT INTO {TABLE} SELECT * FROM {old}")
+    schema_editor.execute(f"DROP TABLE {old}")
+    primary_key = "id, date_worked" if partitioned else "id"
+    schema_editor.execute(f"ALTER TABLE {TABLE} ADD PRIMARY KEY ({primary_key})")
+    for statement in statements:
+        schema_editor.execute(statement)
+    schema_editor.execute(f"ANALYZE {TABLE}")
+
+
+def partition_entries(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        rebuild_table(schema_editor, partitioned=True)
+
+
+def unpartition_entries(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        rebuild_table(schema_editor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+    """
+    Partitions the time entries by month of date_worked on PostgreSQL, see
+    time_tracking.partitions. The entries are copied over in the
+    migration's transaction, so writes to them wait until it's done. Other
+    databases keep the plain table.
+    """
+
+    dependencies = [
+        ('time_tracking', '0005_projectsmodel_title_search'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_entries, unpartition_entries),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.7 on 2026-10-18 09:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('time_tracking', '0006_partition_timetrackingmodel'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimeTrackingArchiveModel',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('date_worked', models.DateTimeField()),
+                ('work_description', models.CharField(max_length=200)),
+                ('hours', models.IntegerField()),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('is_active', models.BooleanField(default=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('reason', models.CharField(choices=[('retention', 'Older than the retention period'), ('deleted_project', 'Project deleted past the grace period')], max_length=20)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_records', to='time_tracking.projectsmodel')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_records', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'date_worked'], name='tt_archive_user_date_idx')],
+            },
+        ),
+    ]
@@ -18,8 +18,23 @@ class ProjectsModel(BaseModel):
     title = models.CharField(max_length=200)
     is_deleted = models.BooleanField(default=False)
 
+    class Meta:
+        constraints = [
+            # Titles are unique among live projects; a soft-deleted project's
+            # title can be reused.
+            models.UniqueConstraint(
+                fields=["title"],
+                condition=models.Q(is_deleted=False),
+                name="project_title_active_uniq",
+            ),
+        ]
+
 
 class TimeTrackingModel(BaseModel):
+    """
+    A time entry. On PostgreSQL the table is partitioned by month of
+    date_worked, see time_tracking.partitions.
+    """
 
     project = models.ForeignKey(
         ProjectsModel,
@@ -31,7 +46,79 @@ class TimeTrackingModel(BaseModel):
     work_description = models.CharField(max_length=200)
     hours = models.IntegerField()
 
+    class Meta:
+        indexes = [
+            # Serve "my entries in this date range (for project X)" as an index range scan.
+            models.Index(fields=["user", "date_worked"], name="tt_user_date_idx"),
+            models.Index(
+                fields=["user", "project", "date_worked"],
+                name="tt_user_project_date_idx",
+            ),
+        ]
+
     @property
     def project_title(self):
         """Returns the title of the project"""
         return self.project.title
+
+
+class DailyTimeTrackingRollupModel(models.Model):
+    """
+    Hours and entry count of TimeTrackingModel per user, project and day.
+    Kept exact on every write through time_tracking.rollups so summary reads
+    don't have to scan the raw entries.
+    """
+
+    user = models.ForeignKey(User, related_name="daily_rollups", on_delete=models.CASCADE)
+    project = models.ForeignKey(
+        ProjectsModel,
+        related_name="daily_rollups",
+        on_delete=models.CASCADE,
+    )
+    day = models.DateField()
+    hours = models.IntegerField(default=0)
+    entries = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "project", "day"], name="tt_rollup_user_project_day_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["user", "day"], name="tt_rollup_user_day_idx"),
+        ]
+
+
+class TimeTrackingArchiveModel(models.Model):
+    """
+    Time entries moved out of TimeTrackingModel by time_tracking.archival,
+    with their original ids. They are only read when explicitly asked for
+    and aren't counted in the daily rollups.
+    """
+
+    REASONS = [
+        ("retention", "Older than the retention period"),
+        ("deleted_project", "Project deleted past the grace period"),
+    ]
+
+    id = models.BigIntegerField(primary_key=True)
+    project = models.ForeignKey(
+        ProjectsModel,
+        related_name="archived_records",
+        on_delete=models.CASCADE,
+    )
+    user = models.ForeignKey(User, related_name="archived_records", on_delete=models.CASCADE)
+    date_worked = models.DateTimeField()
+    work_description = models.CharField(max_length=200)
+    hours = models.IntegerField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    is_active = models.BooleanField(default=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    reason = models.CharField(max_length=20, choices=REASONS)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "date_worked"], name="tt_archive_user_date_idx"),
+        ]
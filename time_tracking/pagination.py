@@ -0,0 +1,189 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class TimeTrackingCursorPagination(BasePagination):
+    """
+    Keyset pagination for time tracking entries ordered by ``(date_worked, id)``.
+
+    Each page seeks past the last seen ``(date_worked, id)`` pair instead of
+    using an OFFSET, so page N costs the same as page 1 and no COUNT(*) is run.
+    Pagination is opt-in: it only applies when the client sends a ``cursor`` or
+    ``page_size`` query parameter, otherwise the full list is returned as before.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    ordering = ("date_worked", "id")
+    invalid_cursor_message = "Invalid cursor"
+
+    @property
+    def page_size(self) -> int:
+        return getattr(settings, "TIME_TRACKING_PAGE_SIZE", 100)
+
+    @property
+    def max_page_size(self) -> int:
+        return getattr(settings, "TIME_TRACKING_MAX_PAGE_SIZE", 1000)
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None):
+        queryset = self.get_page_queryset(queryset, request)
+        if queryset is None:
+            return None
+
+        return self.set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request):
+        """paginate_queryset for async views, fetching the page with the async ORM."""
+        queryset = self.get_page_queryset(queryset, request)
+        if queryset is None:
+            return None
+
+        return self.set_page([row async for row in queryset])
+
+    def get_page_queryset(self, queryset: QuerySet, request: Request):
+        """Returns the queryset of the requested page, or None if not paginating."""
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.page_size_value = self.get_page_size(request)
+        self.position, self.reverse = self.decode_cursor(request)
+
+        if self.position is not None:
+            date_worked, pk = self.position
+            if self.reverse:
+                queryset = queryset.filter(date_worked__lte=date_worked).filter(
+                    Q(date_worked__lt=date_worked) | Q(id__lt=pk)
+                )
+            else:
+                queryset = queryset.filter(date_worked__gte=date_worked).filter(
+                    Q(date_worked__gt=date_worked) | Q(id__gt=pk)
+                )
+
+        if self.reverse:
+            queryset = queryset.order_by(*[f"-{field}" for field in self.ordering])
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        # Fetch one extra row to know whether there is a further page.
+        return queryset[: self.page_size_value + 1]
+
+    def set_page(self, rows: list) -> list:
+        """Keep the page out of the fetched rows and work out its links."""
+        has_more = len(rows) > self.page_size_value
+        self.page = rows[: self.page_size_value]
+
+        if self.reverse:
+            self.page.reverse()
+            self.has_next = self.position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.position is not None
+
+        return self.page
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_paginated_response(self, data) -> Response:
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data) -> dict:
+        return {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, row, reverse: bool) -> str:
+        """Build the url for the page after (or before) the given entry or .values() row."""
+        if isinstance(row, dict):
+            date_worked, pk = row["date_worked"], row["id"]
+        else:
+            date_worked, pk = row.date_worked, row.id
+        payload = {"d": date_worked.isoformat(), "i": pk}
+        if reverse:
+            payload["r"] = 1
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(",", ":")).encode("ascii")
+        ).decode("ascii")
+        url = replace_query_param(self.base_url, self.cursor_query_param, encoded)
+        return replace_query_param(url, self.page_size_query_param, self.page_size_value)
+
+    def decode_cursor(self, request: Request):
+        """Return the ``((date_worked, id), reverse)`` position in the cursor."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            date_worked = parse_datetime(payload["d"])
+            pk = int(payload["i"])
+            reverse = bool(payload.get("r"))
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+        if date_worked is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return (date_worked, pk), reverse
@@ -0,0 +1,134 @@
+"""
+Monthly range partitions of the time entries table on PostgreSQL.
+
+Migration 0006 turns time_tracking_timetrackingmodel into a table
+partitioned by date_worked: one partition per calendar month (in UTC) and
+a default partition for the entries of months without one. PostgreSQL
+requires the partition key in the primary key, so it becomes
+(id, date_worked); ids still all come from one sequence. Nothing changes
+for the ORM, and date range filters on date_worked (as
+TimeTrackingModelFilter's) only scan the partitions of their months.
+
+create_time_tracking_partitions creates the partitions of the coming
+months ahead of time, e.g. monthly from cron. A partition created for a
+month the default partition has entries of takes them over.
+
+Other databases keep the plain table and these helpers do nothing.
+"""
+
+import datetime
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+TABLE = "time_tracking_timetrackingmodel"
+DEFAULT_PARTITION = f"{TABLE}_default"
+# Months created ahead of the current one.
+MONTHS_AHEAD = 3
+
+
+def month_start(value: datetime.date) -> datetime.date:
+    return datetime.date(value.year, value.month, 1)
+
+
+def add_months(month: datetime.date, count: int) -> datetime.date:
+    index = month.year * 12 + month.month - 1 + count
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def month_range(first: datetime.date, last: datetime.date):
+    """The first day of every month from first's to last's, both included."""
+    month = month_start(first)
+    while month <= last:
+        yield month
+        month = add_months(month, 1)
+
+
+def partition_name(month: datetime.date) -> str:
+    return f"{TABLE}_p{month:%Y_%m}"
+
+
+def month_bounds(month: datetime.date) -> tuple:
+    """The UTC datetimes at which the month starts and the next one starts."""
+    start = datetime.datetime.combine(month, datetime.time.min, datetime.timezone.utc)
+    end = datetime.datetime.combine(add_months(month, 1), datetime.time.min, datetime.timezone.utc)
+    return start, end
+
+
+def is_partitioned(using: str = DEFAULT_DB_ALIAS) -> bool:
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)", [TABLE]
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions(using: str = DEFAULT_DB_ALIAS) -> list:
+    """The (name, bounds) of the table's partitions, by name."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+            ORDER BY child.relname
+            """,
+            [TABLE],
+        )
+        return cursor.fetchall()
+
+
+def create_partition(month: datetime.date, using: str = DEFAULT_DB_ALIAS) -> bool:
+    """
+    Creates the partition of the month unless it exists, moving the month's
+    entries out of the default partition. Returns whether it was created.
+    """
+    connection = connections[using]
+    name = partition_name(month)
+    start, end = month_bounds(month)
+    bounds = f"FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [name])
+        if cursor.fetchone()[0] is not None:
+            return False
+        # Created apart then attached, which locks the parent table less
+        # than CREATE TABLE ... PARTITION OF. Attaching checks the default
+        # partition holds no entries of the month, so they move first.
+        cursor.execute(f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)")
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {DEFAULT_PARTITION}
+                WHERE date_worked >= %s AND date_worked < %s
+                RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved
+            """,
+            [start, end],
+        )
+        cursor.execute(f"ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES {bounds}")
+    return True
+
+
+def ensure_partitions(
+    first: datetime.date, last: datetime.date, using: str = DEFAULT_DB_ALIAS
+) -> list:
+    """Creates the missing partitions of the months first to last, returns their names."""
+    if not is_partitioned(using):
+        return []
+    return [
+        partition_name(month)
+        for month in month_range(first, last)
+        if create_partition(month, using)
+    ]
+
+
+def count_default_entries(using: str = DEFAULT_DB_ALIAS) -> int:
+    """The entries in the default partition, which should get partitions of their own."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {DEFAULT_PARTITION}")
+        return cursor.fetchone()[0]
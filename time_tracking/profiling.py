@@ -0,0 +1,161 @@
+"""
+On-demand profiling of single requests.
+
+Staff get a signed token from POST /api/diagnostics/profiles/token and send it
+in the X-Profile header of the request to profile. ProfilingMiddleware then
+runs that request under cProfile and saves the stats (pstats format) in
+settings.PROFILING_DIR, keeping the newest settings.PROFILING_MAX_FILES
+files. The response names the file in X-Profile-Id; the admin endpoints
+under /api/diagnostics/profiles list and download the files.
+
+Tokens expire after settings.PROFILING_TOKEN_MAX_AGE seconds, can be
+limited to a path prefix, and stop working when their issuer stops being
+active staff. At most settings.PROFILING_MAX_CONCURRENT requests are
+profiled at once; others are served unprofiled, and so are requests served
+under ASGI, where a request's work is interleaved with other requests' on
+the event loop. X-Profile-Skipped tells why a request wasn't profiled.
+"""
+
+import cProfile
+import datetime
+import re
+import threading
+import uuid
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import signing
+from django.core.exceptions import MiddlewareNotUsed
+
+TOKEN_SALT = "time_tracking.profiling"
+PROFILE_HEADER = "HTTP_X_PROFILE"
+# Names of the saved profiles, also what downloads are checked against.
+PROFILE_NAME_RE = re.compile(r"^[\w-]+\.prof$")
+
+
+def get_profiles_dir() -> Path:
+    return Path(settings.PROFILING_DIR)
+
+
+def make_token(user: User, path: str = None) -> str:
+    """A token profiling the requests to path (any when None) on behalf of the staff user."""
+    return signing.dumps({"by": user.pk, "path": path}, salt=TOKEN_SALT)
+
+
+def check_token(token: str, path: str):
+    """Returns why the token doesn't allow profiling a request to path, None if it does."""
+    try:
+        payload = signing.loads(
+            token, salt=TOKEN_SALT, max_age=getattr(settings, "PROFILING_TOKEN_MAX_AGE", 900)
+        )
+    except signing.SignatureExpired:
+        return "expired"
+    except signing.BadSignature:
+        return "invalid"
+    if payload["path"] and not path.startswith(payload["path"]):
+        return "path"
+    if not User.objects.filter(pk=payload["by"], is_staff=True, is_active=True).exists():
+        return "revoked"
+    return None
+
+
+def profile_name(request) -> str:
+    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S")
+    path = re.sub(r"[^\w]+", "-", request.path).strip("-")[:60]
+    return f"{timestamp}-{request.method.lower()}-{path}-{uuid.uuid4().hex[:8]}.prof"
+
+
+def save_profile(profiler: cProfile.Profile, request) -> str:
+    """Saves the profile of the request, drops the oldest ones over the limit, returns its name."""
+    directory = get_profiles_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    name = profile_name(request)
+    profiler.dump_stats(directory / name)
+
+    for old in list_profiles()[getattr(settings, "PROFILING_MAX_FILES", 50) :]:
+        (directory / old["name"]).unlink(missing_ok=True)
+    return name
+
+
+def list_profiles() -> list:
+    """The saved profiles, newest first."""
+    directory = get_profiles_dir()
+    if not directory.is_dir():
+        return []
+    profiles = []
+    for path in directory.iterdir():
+        if not PROFILE_NAME_RE.match(path.name):
+            continue
+        stat = path.stat()
+        profiles.append(
+            {
+                "name": path.name,
+                "size": stat.st_size,
+                "created_at": datetime.datetime.fromtimestamp(
+                    stat.st_mtime, datetime.timezone.utc
+                ),
+            }
+        )
+    profiles.sort(key=lambda profile: (profile["created_at"], profile["name"]), reverse=True)
+    return profiles
+
+
+def get_profile_path(name: str):
+    """The path of the saved profile called name, None if there is none."""
+    if not PROFILE_NAME_RE.match(name):
+        return None
+    path = get_profiles_dir() / name
+    return path if path.is_file() else None
+
+
+class ProfilingMiddleware:
+    """Profiles the requests carrying a valid X-Profile token, see the module docstring."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PROFILING_DIR", None):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slots = threading.BoundedSemaphore(getattr(settings, "PROFILING_MAX_CONCURRENT", 1))
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = request.META.get(PROFILE_HEADER)
+        if token is None:
+            return self.get_response(request)
+
+        skipped = check_token(token, request.path)
+        if skipped is not None:
+            return self.skipped(self.get_response(request), skipped)
+        if not self.slots.acquire(blocking=False):
+            return self.skipped(self.get_response(request), "busy")
+
+        try:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+            response["X-Profile-Id"] = save_profile(profiler, request)
+        finally:
+            self.slots.release()
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if PROFILE_HEADER in request.META:
+            self.skipped(response, "async")
+        return response
+
+    def skipped(self, response, reason: str):
+        response["X-Profile-Skipped"] = reason
+        return response
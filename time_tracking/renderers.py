@@ -0,0 +1,73 @@
+"""
+orjson based JSON renderer and parser, configured in REST_FRAMEWORK.
+
+They produce and accept the same JSON as DRF's JSONRenderer/JSONParser, and
+fall back to them when orjson isn't installed or for the options orjson
+doesn't cover (indented output, ASCII-only output, non-strict parsing).
+"""
+
+from django.conf import settings
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from time_tracking.timing import timed
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer using orjson. Datetimes, dates and UUIDs are serialized
+    natively in the same format as DRF's encoder; anything else orjson
+    doesn't know, e.g. Decimal or lazy strings, goes through encoder_class.
+    The time spent rendering goes to the request's render phase (see
+    time_tracking.timing).
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with timed("render"):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type, renderer_context):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if orjson is None or indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers over 64 bits, which the stdlib encoder can handle.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escape U+2028/U+2029 like JSONRenderer, so the output stays a strict
+        # JavaScript subset.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser using orjson for UTF-8 request bodies."""
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or encoding.lower().replace("_", "-") != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            # orjson always rejects NaN and Infinity, as the strict parser does.
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
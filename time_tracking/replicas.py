@@ -0,0 +1,191 @@
+"""
+Read-replica routing.
+
+The replicas are the database aliases in settings.DATABASE_REPLICAS. Reads
+go to one of them only while ReplicaRoutingMiddleware serves a safe (GET,
+HEAD, OPTIONS) request; writes, the reads of unsafe requests, management
+commands and the shell all use the primary.
+
+For read-your-writes, a user's reads stay on the primary for
+settings.DATABASE_REPLICA_PIN_SECONDS after each unsafe request of theirs.
+The pins are kept in the cache named by settings.DATABASE_REPLICA_PIN_CACHE_ALIAS,
+so several workers need a shared backend for a pin to reach all of them.
+
+A replica that fails to connect is left out for
+settings.DATABASE_REPLICA_RETRY_SECONDS; with no replica available reads
+fall back to the primary.
+"""
+
+import logging
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, TokenError
+
+from time_tracking.authentication import CachedJWTAuthentication
+
+logger = logging.getLogger(__name__)
+
+# The replica the current request reads from, None for the primary.
+_read_alias: ContextVar = ContextVar("read_alias", default=None)
+# Replica alias -> time.monotonic() until which it's left out.
+_unavailable = {}
+
+
+def get_replicas() -> list:
+    return list(getattr(settings, "DATABASE_REPLICAS", []))
+
+
+def get_pin_cache():
+    return caches[getattr(settings, "DATABASE_REPLICA_PIN_CACHE_ALIAS", "default")]
+
+
+def pin_cache_key(user_id) -> str:
+    return f"db:pinned:{user_id}"
+
+
+def pin_user(user_id) -> None:
+    """Keep the user's reads on the primary until their writes reached the replicas."""
+    timeout = getattr(settings, "DATABASE_REPLICA_PIN_SECONDS", 10)
+    get_pin_cache().set(pin_cache_key(user_id), True, timeout=timeout)
+
+
+def is_pinned(user_id) -> bool:
+    return get_pin_cache().get(pin_cache_key(user_id), False)
+
+
+def is_available(alias: str) -> bool:
+    """Whether the replica connects, leaving it out for a while if it doesn't."""
+    if _unavailable.get(alias, 0) > time.monotonic():
+        return False
+    connection = connections[alias]
+    try:
+        # A persistent connection may have been dropped since its last use.
+        connection.close_if_health_check_failed()
+        connection.ensure_connection()
+    except DatabaseError:
+        logger.warning("Database replica %s is unavailable, reading from the primary.", alias)
+        retry = getattr(settings, "DATABASE_REPLICA_RETRY_SECONDS", 30)
+        _unavailable[alias] = time.monotonic() + retry
+        return False
+
+    _unavailable.pop(alias, None)
+    return True
+
+
+def get_replica():
+    """A random available replica, None when there is none."""
+    replicas = get_replicas()
+    random.shuffle(replicas)
+    for alias in replicas:
+        if is_available(alias):
+            return alias
+    return None
+
+
+def get_read_alias() -> str:
+    """The database the current request reads from."""
+    return _read_alias.get() or DEFAULT_DB_ALIAS
+
+
+class ReplicaRouter:
+    """Sends the reads of safe requests to their replica, everything else to the primary."""
+
+    def db_for_read(self, model, **hints):
+        return get_read_alias()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replicas hold the same rows as the primary.
+        databases = {DEFAULT_DB_ALIAS, *get_replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema from the primary.
+        if db in get_replicas():
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Picks the database each request reads from: a replica for safe requests
+    of users who aren't pinned to the primary, the primary otherwise. Pins
+    the user after an unsafe request.
+    """
+
+    sync_capable = True
+    async_capable = True
+    authenticator = CachedJWTAuthentication()
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = _read_alias.set(self.route(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _read_alias.reset(token)
+        self.process_response(request)
+        return response
+
+    async def __acall__(self, request):
+        token = _read_alias.set(await sync_to_async(self.route)(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _read_alias.reset(token)
+        await sync_to_async(self.process_response)(request)
+        return response
+
+    def route(self, request):
+        """The replica the request reads from, None for the primary."""
+        if request.method not in SAFE_METHODS or not get_replicas():
+            return None
+        user_id = self.get_user_id(request)
+        if user_id is not None and is_pinned(user_id):
+            return None
+        return get_replica()
+
+    def process_response(self, request) -> None:
+        if request.method in SAFE_METHODS or not get_replicas():
+            return
+        user_id = self.get_user_id(request)
+        if user_id is not None:
+            pin_user(user_id)
+
+    def get_user_id(self, request):
+        """The id of the JWT's or session's user, without loading the user."""
+        header = self.authenticator.get_header(request)
+        if header is not None:
+            try:
+                raw_token = self.authenticator.get_raw_token(header)
+                if raw_token is None:
+                    return None
+                validated_token = self.authenticator.get_validated_token(raw_token)
+                return self.authenticator.get_user_id(validated_token)
+            except (AuthenticationFailed, TokenError):
+                # The view rejects the request.
+                return None
+
+        # Admin users are logged in with a session.
+        session = getattr(request, "session", None)
+        return session.get(SESSION_KEY) if session is not None else None
@@ -0,0 +1,59 @@
+from django.db.models import Count, QuerySet, Sum
+from django.db.models.functions import TruncDate, TruncMonth, TruncWeek
+
+from time_tracking.models import DailyTimeTrackingRollupModel
+
+# Supported report groupings, in the order they are output and sorted by.
+REPORT_GROUPINGS = ("project", "month", "week", "day")
+
+
+def build_hours_report(queryset: QuerySet, group_by: list) -> dict:
+    """
+    Sum the hours of the given queryset in the database, grouped by any
+    combination of project, day, week and month. The queryset is either raw
+    TimeTrackingModel entries or their DailyTimeTrackingRollupModel rows.
+    """
+    groups = [grouping for grouping in REPORT_GROUPINGS if grouping in group_by]
+
+    if queryset.model is DailyTimeTrackingRollupModel:
+        day = "day"
+        totals = {"total_hours": Sum("hours"), "entries": Sum("entries")}
+        date_groupings = {"week": TruncWeek(day), "month": TruncMonth(day)}
+    else:
+        day = TruncDate("date_worked")
+        totals = {"total_hours": Sum("hours"), "entries": Count("id")}
+        # TruncWeek truncates to the Monday of the ISO week.
+        date_groupings = {"day": day, "week": TruncWeek(day), "month": TruncMonth(day)}
+
+    annotations = {
+        grouping: date_groupings[grouping] for grouping in groups if grouping in date_groupings
+    }
+    keys = list(groups)
+    if "project" in groups:
+        keys.insert(keys.index("project") + 1, "project__title")
+
+    rows = (
+        queryset.order_by()
+        .annotate(**annotations)
+        .values(*keys)
+        .annotate(**totals)
+        .order_by(*keys)
+    )
+
+    results = []
+    for row in rows:
+        result = {}
+        for grouping in groups:
+            result[grouping] = row[grouping]
+            if grouping == "project":
+                result["project_title"] = row["project__title"]
+        result["total_hours"] = row["total_hours"]
+        result["entries"] = row["entries"]
+        results.append(result)
+
+    return {
+        "group_by": groups,
+        "total_hours": sum(row["total_hours"] for row in results),
+        "entries": sum(row["entries"] for row in results),
+        "results": results,
+    }
@@ -0,0 +1,165 @@
+"""
+Maintenance of DailyTimeTrackingRollupModel.
+
+Every write to TimeTrackingModel turns into a dict of deltas keyed by
+``(user_id, project_id, day)`` with ``(hours, entries)`` values, which
+``apply_deltas`` adds to the rollup table with a single upsert statement.
+Days are taken in the default timezone (settings.TIME_ZONE) so the rollups
+don't depend on the timezone active while handling a request.
+"""
+
+import datetime
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.db.models import Count, QuerySet, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from time_tracking.models import DailyTimeTrackingRollupModel, TimeTrackingModel
+
+
+def entry_day(date_worked: datetime.datetime) -> datetime.date:
+    """Returns the rollup day of an entry's date_worked."""
+    return timezone.localtime(date_worked, timezone.get_default_timezone()).date()
+
+
+def day_range(start: datetime.date = None, end: datetime.date = None) -> dict:
+    """Returns the date_worked lookups of entries rolled up between start and end."""
+    tzinfo = timezone.get_default_timezone()
+    lookups = {}
+    if start:
+        lookups["date_worked__gte"] = datetime.datetime.combine(
+            start, datetime.time.min, tzinfo=tzinfo
+        )
+    if end:
+        lookups["date_worked__lt"] = datetime.datetime.combine(
+            end + datetime.timedelta(days=1), datetime.time.min, tzinfo=tzinfo
+        )
+    return lookups
+
+
+def entry_delta(entry: TimeTrackingModel, sign: int = 1) -> dict:
+    """Returns the rollup deltas of adding (or with sign=-1 removing) an entry."""
+    key = (entry.user_id, entry.project_id, entry_day(entry.date_worked))
+    return {key: (sign * entry.hours, sign)}
+
+
+def queryset_delta(queryset: QuerySet, sign: int = 1) -> dict:
+    """Returns the rollup deltas of adding (or removing) all entries of a queryset."""
+    rows = (
+        queryset.order_by()
+        .annotate(day=TruncDate("date_worked", tzinfo=timezone.get_default_timezone()))
+        .values_list("user_id", "project_id", "day")
+        .annotate(total_hours=Sum("hours"), total_entries=Count("id"))
+    )
+    return {
+        (user_id, project_id, day): (sign * hours, sign * entries)
+        for user_id, project_id, day, hours, entries in rows
+    }
+
+
+def merge_deltas(*deltas: dict) -> dict:
+    """Sum several delta dicts into one."""
+    merged = defaultdict(lambda: (0, 0))
+    for delta in deltas:
+        for key, (hours, entries) in delta.items():
+            merged_hours, merged_entries = merged[key]
+            merged[key] = (merged_hours + hours, merged_entries + entries)
+    return dict(merged)
+
+
+def _upsert_sql(rows: int) -> str:
+    table = connection.ops.quote_name(DailyTimeTrackingRollupModel._meta.db_table)
+    values = ", ".join(["(%s, %s, %s, %s, %s)"] * rows)
+    # INSERT .. ON CONFLICT DO UPDATE is supported by both PostgreSQL and SQLite.
+    # Incrementing in the statement itself keeps concurrent writers from losing
+    # each other's updates without locking the rows first.
+    return (
+        f"INSERT INTO {table} (user_id, project_id, day, hours, entries) VALUES {values} "
+        f"ON CONFLICT (user_id, project_id, day) DO UPDATE SET "
+        f"hours = {table}.hours + EXCLUDED.hours, "
+        f"entries = {table}.entries + EXCLUDED.entries"
+    )
+
+
+def apply_deltas(deltas: dict, batch_size: int = 500) -> None:
+    """
+    Add the given deltas to the rollup table and drop the rows left without
+    entries. Call it in the same transaction as the entry writes.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta != (0, 0)}
+    if not deltas:
+        return
+
+    items = list(deltas.items())
+    if connection.features.max_query_params:
+        batch_size = min(batch_size, connection.features.max_query_params // 5)
+    with transaction.atomic(savepoint=False), connection.cursor() as cursor:
+        for offset in range(0, len(items), batch_size):
+            batch = items[offset : offset + batch_size]
+            params = []
+            for (user_id, project_id, day), (hours, entries) in batch:
+                params += [
+                    user_id,
+                    project_id,
+                    connection.ops.adapt_datefield_value(day),
+                    hours,
+                    entries,
+                ]
+            cursor.execute(_upsert_sql(len(batch)), params)
+
+        if any(entries < 0 for _, entries in deltas.values()):
+            users, projects, days = zip(*deltas)
+            DailyTimeTrackingRollupModel.objects.filter(
+                user_id__in=set(users),
+                project_id__in=set(projects),
+                day__in=set(days),
+                entries__lte=0,
+            ).delete()
+
+
+def rebuild_rollups(start: datetime.date = None, end: datetime.date = None) -> int:
+    """
+    Recompute the rollups from the raw entries, for all days or only for the
+    days between start and end (inclusive). Returns the number of rollup rows.
+    """
+    rollups = DailyTimeTrackingRollupModel.objects.all()
+    if start:
+        rollups = rollups.filter(day__gte=start)
+    if end:
+        rollups = rollups.filter(day__lte=end)
+
+    with transaction.atomic():
+        rollups.delete()
+        deltas = queryset_delta(TimeTrackingModel.objects.filter(**day_range(start, end)))
+        apply_deltas(deltas)
+
+    return len(deltas)
+
+
+def find_rollup_mismatches(start: datetime.date = None, end: datetime.date = None) -> list:
+    """
+    Compare the rollups against the raw entries. Returns a list of
+    ``(key, expected, actual)`` tuples where ``expected``/``actual`` are
+    ``(hours, entries)`` from the raw table and the rollup table.
+    """
+    expected = queryset_delta(TimeTrackingModel.objects.filter(**day_range(start, end)))
+
+    rollups = DailyTimeTrackingRollupModel.objects.all()
+    if start:
+        rollups = rollups.filter(day__gte=start)
+    if end:
+        rollups = rollups.filter(day__lte=end)
+    actual = {
+        (user_id, project_id, day): (hours, entries)
+        for user_id, project_id, day, hours, entries in rollups.values_list(
+            "user_id", "project_id", "day", "hours", "entries"
+        ).iterator()
+    }
+
+    return [
+        (key, expected.get(key, (0, 0)), actual.get(key, (0, 0)))
+        for key in sorted(expected.keys() | actual.keys())
+        if expected.get(key) != actual.get(key)
+    ]
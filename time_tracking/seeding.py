@@ -0,0 +1,273 @@
+"""
+Generation of large synthetic datasets, for reproducing production-scale
+performance locally.
+
+The same options and seed always generate the same rows. Users share one
+password hash, users and projects are inserted with bulk_create, and time
+entries are streamed in batches: with PostgreSQL COPY when the connection
+supports it, with bulk_create otherwise. Each batch commits on its own, so
+memory stays flat however many entries are generated.
+"""
+
+import datetime
+import io
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.utils import timezone
+
+from time_tracking.cache import invalidate_projects
+from time_tracking.models import ProjectsModel, TimeTrackingModel
+from time_tracking.partitions import ensure_partitions
+from time_tracking.rollups import rebuild_rollups
+
+ENTRY_DISTRIBUTIONS = ("uniform", "pareto")
+DATE_DISTRIBUTIONS = ("uniform", "weekdays", "recent")
+WORDS = (
+    "review", "meeting", "planning", "bugfix", "deploy", "design", "support",
+    "testing", "research", "docs", "refactor", "standup", "client", "release",
+)
+# The columns COPY fills, which includes the ones Django would default.
+ENTRY_COLUMNS = (
+    "created_at",
+    "updated_at",
+    "is_active",
+    "user_id",
+    "project_id",
+    "date_worked",
+    "work_description",
+    "hours",
+)
+
+
+def entry_counts(
+    total: int, users: int, distribution: str, skew: float, rng: random.Random
+) -> list:
+    """
+    Splits total entries between users: evenly, or with "pareto" following
+    a power law where skew (>0) controls how few users hold most entries.
+    """
+    if distribution == "pareto":
+        weights = [1 / (rank + 1) ** skew for rank in range(users)]
+        # Heavy users aren't always the first ones created.
+        rng.shuffle(weights)
+    else:
+        weights = [1] * users
+    scale = total / sum(weights)
+    counts = [int(weight * scale) for weight in weights]
+    # Hand out what rounding down left, largest remainders first.
+    remainders = sorted(range(users), key=lambda index: counts[index] - weights[index] * scale)
+    for index in remainders[: total - sum(counts)]:
+        counts[index] += 1
+    return counts
+
+
+class DateSampler:
+    """Picks the days entries are worked on, between start and start + days."""
+
+    def __init__(self, start: datetime.date, days: int, distribution: str, rng: random.Random):
+        self.start = start
+        self.days = days
+        self.distribution = distribution
+        self.rng = rng
+        self.weekdays = [
+            offset
+            for offset in range(days)
+            if (start + datetime.timedelta(days=offset)).weekday() < 5
+        ] or list(range(days))
+        self.tzinfo = timezone.get_default_timezone()
+
+    def __call__(self) -> datetime.datetime:
+        if self.distribution == "weekdays":
+            offset = self.rng.choice(self.weekdays)
+        elif self.distribution == "recent":
+            # The density grows linearly towards the last day.
+            offset = min(int(self.rng.triangular(0, self.days, self.days)), self.days - 1)
+        else:
+            offset = self.rng.randrange(self.days)
+        # During working hours, to the minute.
+        minutes = self.rng.randrange(8 * 60, 18 * 60)
+        day = self.start + datetime.timedelta(days=offset)
+        return datetime.datetime.combine(
+            day, datetime.time.min, tzinfo=self.tzinfo
+        ) + datetime.timedelta(minutes=minutes)
+
+
+class DataSeeder:
+    """
+    Generates prefixed users, projects and their time entries. write is
+    called with a progress message after each committed batch.
+    """
+
+    def __init__(
+        self,
+        prefix: str = "seed",
+        seed: int = 0,
+        password: str = "Seed@123",
+        batch_size: int = 10000,
+        use_copy: bool = True,
+        write=None,
+    ):
+        self.prefix = prefix
+        self.rng = random.Random(seed)
+        self.password = password
+        self.batch_size = batch_size
+        # COPY works on both psycopg 2 and 3.
+        self.use_copy = use_copy and connection.vendor == "postgresql"
+        self.write = write or (lambda message: None)
+
+    def username(self, index: int) -> str:
+        return f"{self.prefix}-user-{index}@example.com"
+
+    def project_title(self, index: int) -> str:
+        return f"{self.prefix} project {index}"
+
+    def create_users(self, count: int) -> list:
+        """Creates the users and returns their ids, in creation order."""
+        # One hash for every user: hashing is slow on purpose.
+        password = make_password(self.password)
+        for offset in range(0, count, self.batch_size):
+            with transaction.atomic():
+                User.objects.bulk_create(
+                    User(username=self.username(index), password=password)
+                    for index in range(offset, min(offset + self.batch_size, count))
+                )
+        return list(
+            User.objects.filter(username__startswith=f"{self.prefix}-user-")
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    def create_projects(self, count: int) -> list:
+        """Creates the projects and returns their ids, in creation order."""
+        with transaction.atomic():
+            ProjectsModel.objects.bulk_create(
+                (ProjectsModel(title=self.project_title(index)) for index in range(count)),
+                batch_size=self.batch_size,
+            )
+        # bulk_create sends no post_save, so the signal doesn't drop the cached responses.
+        invalidate_projects()
+        return list(
+            ProjectsModel.objects.filter(title__startswith=f"{self.prefix} project ")
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    def entry_rows(
+        self,
+        user_ids: list,
+        project_ids: list,
+        counts: list,
+        dates: DateSampler,
+        projects_per_user: int,
+    ):
+        """Yields the ENTRY_COLUMNS values of every entry, user after user."""
+        now = timezone.now()
+        for user_id, count in zip(user_ids, counts):
+            # Users work on a few projects each.
+            projects = self.rng.sample(project_ids, min(projects_per_user, len(project_ids)))
+            for _ in range(count):
+                description = " ".join(self.rng.choices(WORDS, k=3))
+                hours = self.rng.randint(1, 8)
+                project_id = self.rng.choice(projects)
+                yield (now, now, True, user_id, project_id, dates(), description, hours)
+
+    def insert_entries(self, rows) -> int:
+        """Inserts the entry rows in committed batches, returns their number."""
+        inserted = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == self.batch_size:
+                inserted += self.insert_batch(batch)
+                self.write(f"Inserted {inserted} entries.")
+                batch = []
+        if batch:
+            inserted += self.insert_batch(batch)
+            self.write(f"Inserted {inserted} entries.")
+        return inserted
+
+    def insert_batch(self, batch: list) -> int:
+        with transaction.atomic():
+            if self.use_copy:
+                copy_rows(TimeTrackingModel._meta.db_table, ENTRY_COLUMNS, batch)
+            else:
+                TimeTrackingModel.objects.bulk_create(
+                    TimeTrackingModel(**dict(zip(ENTRY_COLUMNS, row))) for row in batch
+                )
+        return len(batch)
+
+    def seed(
+        self,
+        users: int,
+        projects: int,
+        entries: int,
+        start: datetime.date,
+        days: int,
+        entry_distribution: str = "uniform",
+        skew: float = 1.2,
+        date_distribution: str = "uniform",
+        projects_per_user: int = 5,
+    ) -> dict:
+        """Generates the whole dataset, rebuilding the rollups of its days."""
+        user_ids = self.create_users(users)
+        self.write(f"Created {len(user_ids)} users.")
+        project_ids = self.create_projects(projects)
+        self.write(f"Created {len(project_ids)} projects.")
+
+        # Entries of months without a partition would all pile up in the default one.
+        partitions = ensure_partitions(start, start + datetime.timedelta(days=days - 1))
+        if partitions:
+            self.write(f"Created {len(partitions)} partitions.")
+        counts = entry_counts(entries, len(user_ids), entry_distribution, skew, self.rng)
+        dates = DateSampler(start, days, date_distribution, self.rng)
+        rows = self.entry_rows(user_ids, project_ids, counts, dates, projects_per_user)
+        inserted = self.insert_entries(rows)
+
+        # A week at a time, so the deltas of one window fit in memory.
+        rollups = 0
+        for offset in range(0, days, 7):
+            window_end = start + datetime.timedelta(days=min(offset + 7, days) - 1)
+            rollups += rebuild_rollups(start + datetime.timedelta(days=offset), window_end)
+        self.write(f"Rebuilt {rollups} daily rollup rows.")
+        if connection.vendor == "postgresql":
+            # Plan the next queries with the new row counts.
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {TimeTrackingModel._meta.db_table}")
+
+        return {
+            "users": len(user_ids),
+            "projects": len(project_ids),
+            "entries": inserted,
+            "rollups": rollups,
+        }
+
+
+def copy_rows(table: str, columns: tuple, rows: list) -> None:
+    """Loads rows into the table with COPY FROM STDIN."""
+    statement = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    with connection.cursor() as cursor:
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, "copy"):
+            # psycopg 3
+            with raw_cursor.copy(statement) as copy:
+                for row in rows:
+                    copy.write_row(row)
+        else:
+            # psycopg2, from the text format.
+            buffer = io.StringIO()
+            for row in rows:
+                buffer.write("\t".join(copy_value(value) for value in row) + "\n")
+            buffer.seek(0)
+            raw_cursor.copy_expert(statement, buffer)
+
+
+def copy_value(value) -> str:
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    # The generated descriptions have no tabs, newlines or backslashes to escape.
+    return str(value)
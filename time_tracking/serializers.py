@@ -1,12 +1,39 @@
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth.models import User
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.db.models import Q
+from django.db.models.functions import Lower
 from django.utils import timezone
 
-from rest_framework import serializers
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
 
 from time_tracking.models import ProjectsModel, TimeTrackingModel
+from time_tracking.reports import REPORT_GROUPINGS
+from time_tracking.timing import timed
+
+
+class TimedListSerializer(serializers.ListSerializer):
+    """ListSerializer adding the time spent producing .data to the request's serialize phase."""
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+
+class TimedSerializerMixin:
+    """
+    Adds the time spent producing .data to the request's serialize phase
+    (see time_tracking.timing). Mixed into the serializers of response
+    bodies, whose Meta sets list_serializer_class = TimedListSerializer for
+    many=True.
+    """
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -37,9 +64,12 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     def validate_username(self, value):
         """Validate the username if the given value is already taken."""
         lower_email = value.lower()
-        if User.objects.filter(
-            Q(email__iexact=lower_email) | Q(username__iexact=lower_email)
-        ).exists():
+        # Compare lower() of the columns so the functional indexes are used.
+        if (
+            User.objects.alias(username_lower=Lower("username"), email_lower=Lower("email"))
+            .filter(Q(username_lower=lower_email) | Q(email_lower=lower_email))
+            .exists()
+        ):
             raise serializers.ValidationError(
                 "This email/username has already been taken."
             )
@@ -67,35 +97,81 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         """Finalize Registration of Customer user"""
-        with transaction.atomic():
-            password = validated_data.pop("password")
-            username = validated_data.pop("username")
-            # user = self.context.get("user")
-            user = User.objects.create_user(
-                username=username,
-                email=username,
+        username = validated_data["username"]
+        user = User(username=username, email=User.objects.normalize_email(username))
+        # Hash once and INSERT once, instead of create_user() followed by save().
+        user.set_password(validated_data["password"])
+
+        try:
+            with transaction.atomic():
+                user.save()
+        except IntegrityError:
+            # Lost a race with a registration of the same username, caught by
+            # the unique lower(username) index.
+            raise serializers.ValidationError(
+                {"username": ["This email/username has already been taken."]}
             )
-            user.set_password(password)
-            user.save()
 
-            return user
+        return user
 
 
-class ProjectsSerializer(serializers.ModelSerializer):
+class ProjectsSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+
+    title_taken_message = "Project title is already taken."
 
     class Meta:
         model = ProjectsModel
         fields = ["id", "title"]
+        list_serializer_class = TimedListSerializer
+        # validate_title checks the project_title_active_uniq constraint itself.
+        extra_kwargs = {"title": {"validators": []}}
 
     def validate_title(self, value):
-        """Validate the title if it already exists."""
-        if ProjectsModel.objects.filter(title__exact=value).exists():
-            raise serializers.ValidationError("Project title is already taken.")
+        """Validate the title if another live project already has it."""
+        queryset = ProjectsModel.objects.filter(title__exact=value, is_deleted=False)
+        if self.instance is not None:
+            queryset = queryset.exclude(pk=self.instance.pk)
+        if queryset.exists():
+            raise serializers.ValidationError(self.title_taken_message)
 
         return value
 
+    def save(self, **kwargs):
+        try:
+            with transaction.atomic():
+                return super().save(**kwargs)
+        except IntegrityError:
+            # Another request took the title after validate_title checked it.
+            raise serializers.ValidationError({"title": [self.title_taken_message]})
+
+
+class ProjectSearchSerializer(serializers.Serializer):
+    """Validates the query params of the project search."""
+
+    q = serializers.CharField(max_length=200)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
+
+
+class ProfileTokenSerializer(serializers.Serializer):
+    """Validates the request for a profiling token."""
+
+    path = serializers.CharField(max_length=500, required=False, default=None)
+
+    def validate_path(self, value: str) -> str:
+        """Profiled paths are matched by prefix against request paths."""
+        if value is not None and not value.startswith("/"):
+            raise serializers.ValidationError("Must start with a /.")
+        return value
+
+
+class ProfileStatsSerializer(serializers.Serializer):
+    """Validates the query params of a profile's text summary."""
 
-class TimeTrackingModelSerializer(serializers.ModelSerializer):
+    sort = serializers.ChoiceField(choices=["cumulative", "tottime", "calls"])
+    limit = serializers.IntegerField(min_value=1, max_value=500, default=50)
+
+
+class TimeTrackingModelSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = TimeTrackingModel
         fields = [
@@ -109,3 +185,152 @@ class TimeTrackingModelSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        read_only_fields = ["user"]
+        list_serializer_class = TimedListSerializer
+
+
+def datetime_formatter():
+    """
+    Returns a function formatting datetimes the same as
+    serializers.DateTimeField, with the output format and timezone looked up
+    once instead of for every value.
+    """
+    field = serializers.DateTimeField()
+    output_format = api_settings.DATETIME_FORMAT
+    field_timezone = field.default_timezone()
+    if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+        return field.to_representation
+
+    def format_datetime(value):
+        if not value:
+            return None
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return format_datetime
+
+
+class TimeTrackingValuesSerializer:
+    """
+    Read-only fast path of TimeTrackingModelSerializer for listing many
+    entries. Rows come straight from ``.values()`` with the project title
+    joined in, skipping the model instances and the per-field serializer
+    machinery, and render to exactly the same output.
+
+    Usage: ``TimeTrackingValuesSerializer(TimeTrackingValuesSerializer.values(queryset)).data``
+    """
+
+    fields = tuple(TimeTrackingModelSerializer.Meta.fields)
+    # Database column (or join) each field is read from, when not the field itself.
+    sources = {
+        "project": "project_id",
+        "user": "user_id",
+        "project_title": "project__title",
+    }
+    datetime_fields = ("date_worked", "created_at", "updated_at")
+
+    def __init__(self, rows=None):
+        self.rows = rows
+        self.format_datetime = datetime_formatter()
+        self._fields = [
+            (field, self.sources.get(field, field), field in self.datetime_fields)
+            for field in self.fields
+        ]
+
+    @classmethod
+    def values(cls, queryset):
+        """Returns the queryset as the .values() rows the serializer reads."""
+        return queryset.values(*(cls.sources.get(field, field) for field in cls.fields))
+
+    def to_representation(self, row: dict) -> dict:
+        format_datetime = self.format_datetime
+        return {
+            field: format_datetime(row[source]) if is_datetime else row[source]
+            for field, source, is_datetime in self._fields
+        }
+
+    @property
+    def data(self) -> list:
+        with timed("serialize"):
+            return [self.to_representation(row) for row in self.rows]
+
+
+class TimeTrackingArchiveValuesSerializer(TimeTrackingValuesSerializer):
+    """TimeTrackingValuesSerializer of archived entries, with when they were archived and why."""
+
+    fields = TimeTrackingValuesSerializer.fields + ("archived_at", "reason")
+    datetime_fields = TimeTrackingValuesSerializer.datetime_fields + ("archived_at",)
+
+
+class TimeTrackingBatchItemSerializer(serializers.ModelSerializer):
+    """
+    Validates one entry of a batch create. The project is only checked to be
+    an integer here; the batch looks up all the projects at once.
+    """
+
+    project = serializers.IntegerField()
+
+    class Meta:
+        model = TimeTrackingModel
+        fields = ["project", "date_worked", "work_description", "hours"]
+
+
+class TimeTrackingBulkSelectionSerializer(serializers.Serializer):
+    """Entries picked by id for a bulk operation, instead of by the list filters."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, allow_empty=False
+    )
+
+
+class TimeTrackingBulkChangesSerializer(serializers.ModelSerializer):
+    """The fields a bulk update sets on every selected entry."""
+
+    class Meta:
+        model = TimeTrackingModel
+        fields = ["project", "date_worked", "work_description", "hours"]
+        extra_kwargs = {field: {"required": False} for field in fields}
+
+    def validate(self, attrs):
+        """Require at least one field to change."""
+        if not attrs:
+            raise serializers.ValidationError("Provide at least one field to change.")
+
+        return attrs
+
+
+class TimeTrackingBulkUpdateSerializer(TimeTrackingBulkSelectionSerializer):
+    changes = TimeTrackingBulkChangesSerializer()
+
+
+class TimeTrackingImportRowSerializer(serializers.ModelSerializer):
+    """Validates one row of a CSV import; the importer resolves the project title."""
+
+    class Meta:
+        model = TimeTrackingModel
+        fields = ["date_worked", "work_description", "hours"]
+
+
+class TimeTrackingReportSerializer(serializers.Serializer):
+    """Validates the query params of the hours report."""
+
+    group_by = serializers.CharField(required=False, default="project")
+
+    def validate_group_by(self, value):
+        """Split the comma separated groupings and check they are supported."""
+        groups = [group.strip() for group in value.split(",") if group.strip()]
+        invalid = [group for group in groups if group not in REPORT_GROUPINGS]
+        if not groups or invalid:
+            raise serializers.ValidationError(
+                f"Choose one or more of: {', '.join(REPORT_GROUPINGS)}."
+            )
+
+        return groups
+
+
+class TimeTrackingExportSerializer(serializers.Serializer):
+    """Validates the query params of the entries export."""
+
+    file_format = serializers.ChoiceField(choices=["csv", "ndjson"], default="csv")
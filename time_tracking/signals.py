@@ -0,0 +1,25 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from time_tracking.authentication import invalidate_user
+from time_tracking.cache import invalidate_projects
+from time_tracking.models import ProjectsModel
+
+
+@receiver(post_save, sender=ProjectsModel)
+@receiver(post_delete, sender=ProjectsModel)
+def invalidate_projects_cache(sender, **kwargs):
+    """Drop the cached project responses on any project write, e.g. from the API or admin."""
+    invalidate_projects()
+    # Again once committed, in case a read cached the old rows in between.
+    transaction.on_commit(invalidate_projects)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance: User, **kwargs):
+    """Drop the user's cached authentication state when the user changes."""
+    invalidate_user(instance.pk)
+    transaction.on_commit(lambda: invalidate_user(instance.pk))
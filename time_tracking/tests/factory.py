@@ -4,6 +4,7 @@ from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 
 from time_tracking.models import ProjectsModel, TimeTrackingModel
+from time_tracking.rollups import apply_deltas, entry_delta
 
 
 class UserFactory(factory.django.DjangoModelFactory):
@@ -36,3 +37,11 @@ class TimeTrackingModelFactory(factory.django.DjangoModelFactory):
         model = TimeTrackingModel
 
     work_description = factory.Faker("sentence")
+
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        """Override to keep the daily rollups in sync like the API does"""
+        entry = super()._create(model_class, *args, **kwargs)
+        apply_deltas(entry_delta(entry))
+
+        return entry
@@ -0,0 +1,112 @@
+import datetime
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from time_tracking.archival import EntryArchiver, retention_cutoff
+from time_tracking.models import ProjectsModel, TimeTrackingArchiveModel, TimeTrackingModel
+from time_tracking.rollups import find_rollup_mismatches
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+def utc(*args) -> datetime.datetime:
+    return datetime.datetime(*args, tzinfo=datetime.timezone.utc)
+
+
+class ArchivalTestCase(TestCase):
+    """Class for the time entry archival test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory(title="Alpha")
+        cls.deleted_project = ProjectFactory(title="Deleted")
+        cls.recently_deleted_project = ProjectFactory(title="Recently deleted")
+        now = timezone.now()
+        cls.old_entries = [
+            TimeTrackingModelFactory(
+                user=cls.user, project=cls.project, date_worked=utc(2001, 1, day), hours=day
+            )
+            for day in (1, 2, 3)
+        ]
+        cls.entry = TimeTrackingModelFactory(
+            user=cls.user, project=cls.project, date_worked=now, hours=2
+        )
+        cls.deleted_project_entry = TimeTrackingModelFactory(
+            user=cls.user, project=cls.deleted_project, date_worked=now, hours=3
+        )
+        TimeTrackingModelFactory(
+            user=cls.user, project=cls.recently_deleted_project, date_worked=now, hours=4
+        )
+        # Soft-deleted like ProjectsViewSet.destroy does, at some point in the past.
+        ProjectsModel.objects.filter(pk=cls.deleted_project.pk).update(
+            is_deleted=True, updated_at=now - datetime.timedelta(days=40)
+        )
+        ProjectsModel.objects.filter(pk=cls.recently_deleted_project.pk).update(
+            is_deleted=True, updated_at=now - datetime.timedelta(days=5)
+        )
+
+    def test_archive(self):
+        """Test the due entries move to the archive and leave the rollups."""
+        archived = EntryArchiver(retention_months=24, grace_days=30).run()
+
+        self.assertEqual(archived, {"retention": 3, "deleted_project": 1})
+        self.assertEqual(TimeTrackingModel.objects.count(), 2)
+        self.assertFalse(TimeTrackingModel.objects.filter(project=self.deleted_project).exists())
+        archive = TimeTrackingArchiveModel.objects.get(pk=self.deleted_project_entry.pk)
+        self.assertEqual(archive.reason, "deleted_project")
+        self.assertEqual(archive.hours, 3)
+        self.assertEqual(archive.date_worked, self.deleted_project_entry.date_worked)
+        self.assertEqual(archive.created_at, self.deleted_project_entry.created_at)
+        retention = TimeTrackingArchiveModel.objects.filter(reason="retention")
+        self.assertEqual(
+            set(retention.values_list("id", flat=True)), {entry.id for entry in self.old_entries}
+        )
+        self.assertEqual(find_rollup_mismatches(), [])
+
+    def test_resume(self):
+        """Test a run stopped after some batches is carried on by the next one."""
+        archiver = EntryArchiver(retention_months=24, grace_days=30, batch_size=2)
+
+        self.assertEqual(archiver.run(max_batches=1), {"retention": 2, "deleted_project": 0})
+        self.assertEqual(archiver.run(), {"retention": 1, "deleted_project": 1})
+        self.assertEqual(archiver.run(), {"retention": 0, "deleted_project": 0})
+        self.assertEqual(TimeTrackingArchiveModel.objects.count(), 4)
+
+    def test_command(self):
+        """Test the command counts the due entries on a dry run and archives them otherwise."""
+        stdout = StringIO()
+        call_command("archive_time_entries", dry_run=True, grace_days=1, stdout=stdout)
+
+        self.assertIn("3 entries due for archival (retention).", stdout.getvalue())
+        self.assertIn("2 entries due for archival (deleted_project).", stdout.getvalue())
+        self.assertFalse(TimeTrackingArchiveModel.objects.exists())
+
+        stdout = StringIO()
+        call_command("archive_time_entries", batch_size=2, pause=0, stdout=stdout)
+
+        self.assertIn("Archived 2 entries (retention), up to id", stdout.getvalue())
+        self.assertIn("Archived 4 entries: 3 (retention), 1 (deleted_project).", stdout.getvalue())
+
+        with self.assertRaisesMessage(CommandError, "--batch-size must be at least 1."):
+            call_command("archive_time_entries", batch_size=0)
+
+
+class RetentionCutoffTestCase(SimpleTestCase):
+    """Class for the retention cutoff test cases."""
+
+    def test_cutoff(self):
+        """Test the cutoff is the start of the month the retention period ago, in UTC."""
+        self.assertEqual(retention_cutoff(24, utc(2026, 10, 18, 9)), utc(2024, 10, 1))
+        self.assertEqual(retention_cutoff(1, utc(2026, 1, 31, 23)), utc(2025, 12, 1))
+        self.assertEqual(retention_cutoff(0, utc(2026, 1, 31, 23)), utc(2026, 1, 1))
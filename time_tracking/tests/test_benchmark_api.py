@@ -0,0 +1,79 @@
+import io
+import json
+import tempfile
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from time_tracking.models import ProjectsModel, TimeTrackingModel
+
+
+class BenchmarkAPITestCase(TestCase):
+    """Class for the benchmark_api command test cases."""
+
+    options = {"users": 2, "projects": 3, "entries": 5, "repeat": 3, "warmup": 1}
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.baseline = Path(directory.name) / "baseline.json"
+
+    def benchmark(self, *args, **options) -> str:
+        stdout = io.StringIO()
+        options = {**self.options, **options}
+        call_command("benchmark_api", *args, baseline=self.baseline, stdout=stdout, **options)
+        return stdout.getvalue()
+
+    def test_all_scenarios(self):
+        """Test every scenario runs and the generated data is rolled back."""
+        output = self.benchmark(password_repeat=1, warmup=0)
+
+        for name in ("login", "register", "project-delete", "time-tracking-create"):
+            self.assertIn(f"{name}: p50 ", output)
+        self.assertIn("No baseline", output)
+        self.assertFalse(ProjectsModel.objects.exists())
+        self.assertFalse(TimeTrackingModel.objects.exists())
+
+    def test_baseline(self):
+        """Test results are compared with the baseline and regressions flagged."""
+        scenarios = ["--scenario", "project-create", "--scenario", "time-tracking-list"]
+        self.benchmark(*scenarios, "--update-baseline")
+        baseline = json.loads(self.baseline.read_text())
+        self.assertEqual(baseline["dataset"], {"users": 2, "projects": 3, "entries": 5})
+        self.assertEqual(
+            baseline["run"], {"repeat": 3, "password_repeat": 10, "warmup": 1, "seed": 0}
+        )
+        self.assertEqual(baseline["scenarios"]["time-tracking-list"]["queries"], 1)
+
+        output = self.benchmark(*scenarios, tolerance=100)
+        self.assertIn("No regressions against the baseline.", output)
+
+        baseline["scenarios"]["time-tracking-list"]["queries"] = 0
+        self.baseline.write_text(json.dumps(baseline))
+        with self.assertRaisesMessage(CommandError, "1 regressions against the baseline."):
+            self.benchmark(*scenarios, tolerance=100)
+
+    def test_baseline_other_dataset(self):
+        """Test a baseline measured on another dataset isn't compared."""
+        self.benchmark("--scenario", "project-list", "--update-baseline")
+
+        output = self.benchmark("--scenario", "project-list", entries=6)
+
+        self.assertIn("not compared", output)
+
+    def test_baseline_other_run_options(self):
+        """Test a baseline measured with other repeat, warmup or seed options isn't compared."""
+        self.benchmark("--scenario", "project-detail", "--update-baseline")
+
+        for options in ({"repeat": 4}, {"warmup": 0}, {"seed": 1}):
+            with self.subTest(**options):
+                output = self.benchmark("--scenario", "project-detail", **options)
+
+                self.assertIn("not compared", output)
+
+        # Updating the baseline with other options replaces it.
+        self.benchmark("--scenario", "project-list", "--update-baseline", repeat=4)
+        baseline = json.loads(self.baseline.read_text())
+        self.assertEqual(baseline["run"]["repeat"], 4)
+        self.assertEqual(list(baseline["scenarios"]), ["project-list"])
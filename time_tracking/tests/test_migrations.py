@@ -0,0 +1,77 @@
+from importlib import import_module
+from types import SimpleNamespace
+
+from django.apps import apps
+from django.db import connection
+from django.test import TestCase
+
+from time_tracking.tests.factory import ProjectFactory, UserFactory
+
+lower_username_indexes = import_module(
+    "time_tracking.migrations.0004_auth_user_lower_username_indexes"
+)
+title_search = import_module("time_tracking.migrations.0005_projectsmodel_title_search")
+
+
+class UsernameDuplicatesCheckTestCase(TestCase):
+    """Class for the check run before the unique LOWER(username) index is created."""
+
+    def setUp(self) -> None:
+        """Drop the index, as before the migration, so duplicates can be inserted."""
+        with connection.cursor() as cursor:
+            cursor.execute("DROP INDEX auth_user_username_lower_uniq")
+        self.schema_editor = SimpleNamespace(connection=connection)
+
+    def test_duplicates(self):
+        """Test usernames differing only by case are listed."""
+        first = UserFactory(username="Alice@test.com")
+        second = UserFactory(username="alice@test.com")
+        UserFactory(username="bob@test.com")
+
+        with self.assertRaises(RuntimeError) as raised:
+            lower_username_indexes.check_username_duplicates(apps, self.schema_editor)
+
+        message = str(raised.exception)
+        self.assertIn(f"id={first.id} username='Alice@test.com'", message)
+        self.assertIn(f"id={second.id} username='alice@test.com'", message)
+        self.assertNotIn("bob", message)
+
+    def test_no_duplicates(self):
+        """Test the check passes when the usernames are unique regardless of case."""
+        UserFactory(username="alice@test.com")
+        UserFactory(username="bob@test.com")
+
+        lower_username_indexes.check_username_duplicates(apps, self.schema_editor)
+
+
+class TitleDuplicatesCheckTestCase(TestCase):
+    """Class for the check run before the unique constraint on live project titles."""
+
+    def setUp(self) -> None:
+        """Drop the constraint, as before the migration, so duplicates can be inserted."""
+        with connection.cursor() as cursor:
+            cursor.execute("DROP INDEX project_title_active_uniq")
+        self.schema_editor = SimpleNamespace(connection=connection)
+
+    def test_duplicates(self):
+        """Test live projects sharing a title are listed, deleted ones aren't."""
+        first = ProjectFactory(title="Website")
+        second = ProjectFactory(title="Website")
+        deleted = ProjectFactory(title="Website", is_deleted=True)
+        ProjectFactory(title="Mobile app")
+
+        with self.assertRaises(RuntimeError) as raised:
+            title_search.check_title_duplicates(apps, self.schema_editor)
+
+        message = str(raised.exception)
+        self.assertIn(f"id={first.id} title='Website'", message)
+        self.assertIn(f"id={second.id} title='Website'", message)
+        self.assertNotIn(f"id={deleted.id} ", message)
+        self.assertNotIn("Mobile app", message)
+
+    def test_no_duplicates(self):
+        """Test the check passes when only a deleted project shares a title."""
+        ProjectFactory(title="Website")
+        ProjectFactory(title="Website", is_deleted=True)
+
+        title_search.check_title_duplicates(apps, self.schema_editor)
@@ -0,0 +1,175 @@
+import datetime
+from io import StringIO
+from unittest import skipIf, skipUnless
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from time_tracking.filters import TimeTrackingModelFilter
+from time_tracking.models import TimeTrackingModel
+from time_tracking.partitions import (
+    DEFAULT_PARTITION,
+    add_months,
+    create_partition,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+    month_range,
+    partition_name,
+)
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+def utc(*args) -> datetime.datetime:
+    return datetime.datetime(*args, tzinfo=datetime.timezone.utc)
+
+
+def partition_of(entry: TimeTrackingModel) -> str:
+    """The name of the partition holding the entry."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT tableoid::regclass::text FROM {TimeTrackingModel._meta.db_table} "
+            "WHERE id = %s",
+            [entry.id],
+        )
+        return cursor.fetchone()[0]
+
+
+@skipUnless(connection.vendor == "postgresql", "Only PostgreSQL partitions the entries.")
+class PartitionsTestCase(TestCase):
+    """Class for the monthly partitions of the time entries test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory(title="Alpha")
+
+    def test_migrated(self):
+        """Test the table is partitioned up to a few months ahead, with a default partition."""
+        self.assertTrue(is_partitioned())
+        names = [name for name, _ in list_partitions()]
+        self.assertIn(DEFAULT_PARTITION, names)
+        today = timezone.now().date()
+        self.assertIn(partition_name(add_months(today, 3)), names)
+
+        entry = TimeTrackingModelFactory(
+            user=self.user, project=self.project, date_worked=timezone.now(), hours=2
+        )
+        self.assertEqual(partition_of(entry), partition_name(today))
+
+    def test_create_partition(self):
+        """Test a new partition takes its month's entries over from the default partition."""
+        entry = TimeTrackingModelFactory(
+            user=self.user, project=self.project, date_worked=utc(2001, 2, 28, 23), hours=2
+        )
+        self.assertEqual(partition_of(entry), DEFAULT_PARTITION)
+
+        self.assertTrue(create_partition(datetime.date(2001, 2, 1)))
+        self.assertFalse(create_partition(datetime.date(2001, 2, 1)))
+
+        self.assertEqual(partition_of(entry), "time_tracking_timetrackingmodel_p2001_02")
+        bounds = dict(list_partitions())["time_tracking_timetrackingmodel_p2001_02"]
+        self.assertEqual(
+            bounds, "FOR VALUES FROM ('2001-02-01 00:00:00+00') TO ('2001-03-01 00:00:00+00')"
+        )
+
+    def test_orm(self):
+        """Test entries move between partitions when their date changes, and stay unique."""
+        ensure_partitions(datetime.date(2001, 1, 1), datetime.date(2001, 2, 1))
+        entry = TimeTrackingModelFactory(
+            user=self.user, project=self.project, date_worked=utc(2001, 1, 15), hours=2
+        )
+        other = TimeTrackingModelFactory(
+            user=self.user, project=self.project, date_worked=utc(2001, 1, 15), hours=2
+        )
+
+        entry.date_worked = utc(2001, 2, 15)
+        entry.save()
+
+        self.assertEqual(partition_of(entry), "time_tracking_timetrackingmodel_p2001_02")
+        self.assertEqual(TimeTrackingModel.objects.get(pk=entry.pk).date_worked, entry.date_worked)
+        self.assertNotEqual(entry.pk, other.pk)
+        entry.delete()
+        self.assertFalse(TimeTrackingModel.objects.filter(pk=entry.pk).exists())
+
+    def test_filter_pruning(self):
+        """Test the date filters only scan the partitions of their months."""
+        ensure_partitions(datetime.date(2001, 1, 1), datetime.date(2001, 4, 1))
+        queryset = TimeTrackingModelFilter(
+            {"start_date": "2001-02-10", "end_date": "2001-03-05"},
+            queryset=TimeTrackingModel.objects.filter(user=self.user),
+        ).qs
+
+        plan = queryset.explain()
+
+        self.assertIn("_p2001_02", plan)
+        self.assertIn("_p2001_03", plan)
+        self.assertNotIn("_p2001_01", plan)
+        self.assertNotIn("_p2001_04", plan)
+        self.assertNotIn(DEFAULT_PARTITION, plan)
+
+    def test_command(self):
+        """Test the command creates the coming months and reports default partition entries."""
+        TimeTrackingModelFactory(
+            user=self.user, project=self.project, date_worked=utc(2001, 1, 15), hours=2
+        )
+        stdout = StringIO()
+
+        call_command("create_time_tracking_partitions", months=5, stdout=stdout)
+
+        last = add_months(timezone.now().date(), 5)
+        self.assertIn(f"Created {partition_name(last)}.", stdout.getvalue())
+        self.assertIn("1 entries are in the default partition", stdout.getvalue())
+
+        stdout = StringIO()
+        call_command(
+            "create_time_tracking_partitions",
+            months=0,
+            start_date=datetime.date(2001, 1, 31),
+            stdout=stdout,
+        )
+        self.assertIn(f"Created {partition_name(datetime.date(2001, 1, 1))}.", stdout.getvalue())
+        self.assertNotIn("default partition", stdout.getvalue())
+
+
+@skipIf(connection.vendor == "postgresql", "PostgreSQL partitions the entries.")
+class PlainTableTestCase(TestCase):
+    """Class for the partition helpers on databases keeping a plain table."""
+
+    def test_not_partitioned(self):
+        """Test the helpers and the command do nothing."""
+        stdout = StringIO()
+
+        call_command("create_time_tracking_partitions", stdout=stdout)
+
+        self.assertFalse(is_partitioned())
+        self.assertEqual(
+            ensure_partitions(datetime.date(2001, 1, 1), datetime.date(2001, 3, 1)), []
+        )
+        self.assertIn("isn't partitioned", stdout.getvalue())
+
+
+class MonthsTestCase(SimpleTestCase):
+    """Class for the month arithmetic test cases."""
+
+    def test_months(self):
+        """Test months are added across years and ranges include both ends' months."""
+        self.assertEqual(add_months(datetime.date(2024, 11, 1), 3), datetime.date(2025, 2, 1))
+        self.assertEqual(add_months(datetime.date(2024, 1, 1), -1), datetime.date(2023, 12, 1))
+        self.assertEqual(
+            list(month_range(datetime.date(2024, 12, 31), datetime.date(2025, 2, 1))),
+            [datetime.date(2024, 12, 1), datetime.date(2025, 1, 1), datetime.date(2025, 2, 1)],
+        )
+        self.assertEqual(
+            partition_name(datetime.date(2025, 2, 1)), "time_tracking_timetrackingmodel_p2025_02"
+        )
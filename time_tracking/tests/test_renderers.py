@@ -0,0 +1,79 @@
+import datetime
+import decimal
+import io
+import uuid
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from time_tracking import renderers
+from time_tracking.renderers import FastJSONParser, FastJSONRenderer
+
+
+class FastJSONTestCase(SimpleTestCase):
+    """Class for the orjson renderer and parser test cases."""
+
+    data = {
+        "id": 1,
+        "hours": 7,
+        "ratio": 0.25,
+        "rate": decimal.Decimal("12.50"),
+        "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "title": "Ünïcödé ✓ \u2028\u2029 \"quoted\"",
+        "label": gettext_lazy("This field is required."),
+        "utc": datetime.datetime(2024, 3, 1, 9, 30, tzinfo=datetime.timezone.utc),
+        "zoned": datetime.datetime(2024, 3, 1, 9, 30, 0, 1500, tzinfo=ZoneInfo("Europe/Berlin")),
+        "naive": datetime.datetime(2024, 3, 1, 9, 30, 15),
+        "day": datetime.date(2024, 3, 1),
+        "nested": [{"empty": None, "flag": True}, (1, 2)],
+        2: "integer key",
+    }
+
+    def test_render_matches_json_renderer(self):
+        """Test the output is byte-for-byte that of DRF's JSONRenderer."""
+        self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_render_falls_back_to_json_renderer(self):
+        """Test indented output and a missing orjson use DRF's JSONRenderer."""
+        media_type = "application/json; indent=4"
+        self.assertEqual(
+            FastJSONRenderer().render(self.data, media_type),
+            JSONRenderer().render(self.data, media_type),
+        )
+
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_render_integer_over_64_bits(self):
+        """Test values orjson rejects are rendered by the stdlib encoder."""
+        self.assertEqual(FastJSONRenderer().render({"big": 2**70}), b'{"big":1180591620717411303424}')
+
+    def test_parse_matches_json_parser(self):
+        """Test parsing gives the same data as DRF's JSONParser."""
+        body = JSONRenderer().render({"title": "Ünïcödé ✓", "hours": 3, "items": [1.5, None]})
+
+        self.assertEqual(
+            FastJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body))
+        )
+
+    def test_parse_errors(self):
+        """Test invalid bodies and NaN raise a parse error."""
+        for body in (b'{"hours": ', b'{"hours": NaN}'):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                FastJSONParser().parse(io.BytesIO(body))
+
+    def test_benchmark_command(self):
+        """Test the benchmark reports both renderers and checks they agree."""
+        out = io.StringIO()
+        call_command("benchmark_json", rows=50, repeat=1, stdout=out)
+
+        self.assertIn("stdlib: render", out.getvalue())
+        self.assertIn("orjson: render", out.getvalue())
+        self.assertIn("identical output", out.getvalue())
@@ -0,0 +1,137 @@
+from unittest import mock
+
+from django.db import OperationalError, connections, router
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, RequestFactory, TestCase, override_settings
+
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from time_tracking import replicas
+from time_tracking.models import TimeTrackingModel
+from time_tracking.replicas import ReplicaRoutingMiddleware, get_pin_cache
+from time_tracking.tests.factory import UserFactory
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaRoutingTestCase(TestCase):
+    """Class for the read-replica routing test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.user_2 = UserFactory(
+            username="testuser2@test.com",
+            password="Test@123",
+        )
+
+    def setUp(self) -> None:
+        get_pin_cache().clear()
+        replicas._unavailable.clear()
+        # The replica alias isn't configured, so nothing may connect to it.
+        patcher = mock.patch.object(replicas, "is_available", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.read_aliases = []
+
+    def get_response(self, request):
+        self.read_aliases.append(router.db_for_read(TimeTrackingModel))
+        return HttpResponse()
+
+    def request(self, method: str, user=None):
+        """Send a request through the middleware and return the database it read from."""
+        headers = {}
+        if user is not None:
+            headers["HTTP_AUTHORIZATION"] = f"Bearer {RefreshToken.for_user(user).access_token}"
+        request = getattr(RequestFactory(), method)("/api/time-tracking", **headers)
+        ReplicaRoutingMiddleware(self.get_response)(request)
+        return self.read_aliases[-1]
+
+    def test_safe_requests_read_from_replica(self):
+        """Test safe requests read from a replica and writes always go to the primary."""
+        self.assertEqual(self.request("get", self.user), "replica")
+        self.assertEqual(self.request("head"), "replica")
+        self.assertEqual(router.db_for_write(TimeTrackingModel), "default")
+
+    def test_reads_outside_requests_use_primary(self):
+        """Test reads outside of a request, e.g. in commands, use the primary."""
+        self.request("get", self.user)
+
+        self.assertEqual(router.db_for_read(TimeTrackingModel), "default")
+
+    def test_user_pinned_after_write(self):
+        """Test a user's reads stay on the primary for a while after a write of theirs."""
+        self.assertEqual(self.request("post", self.user), "default")
+
+        self.assertEqual(self.request("get", self.user), "default")
+        self.assertEqual(self.request("get", self.user_2), "replica")
+
+        # The pin expired.
+        get_pin_cache().clear()
+        self.assertEqual(self.request("get", self.user), "replica")
+
+    def test_invalid_token(self):
+        """Test requests with an invalid token are routed without failing."""
+        request = RequestFactory().post("/api/time-tracking", HTTP_AUTHORIZATION="Bearer invalid")
+        ReplicaRoutingMiddleware(self.get_response)(request)
+
+        self.assertEqual(self.read_aliases, ["default"])
+
+    async def test_async_requests(self):
+        """Test the routing of requests served by async views."""
+
+        async def get_response(request):
+            self.read_aliases.append(router.db_for_read(TimeTrackingModel))
+            return HttpResponse()
+
+        headers = {"Authorization": f"Bearer {RefreshToken.for_user(self.user).access_token}"}
+        middleware = ReplicaRoutingMiddleware(get_response)
+        for method in ("get", "post", "get"):
+            request = getattr(AsyncRequestFactory(), method)("/api/time-tracking", headers=headers)
+            await middleware(request)
+
+        self.assertEqual(self.read_aliases, ["replica", "default", "default"])
+
+    def test_no_migrations_on_replicas(self):
+        """Test migrations are only run on the primary."""
+        self.assertFalse(router.allow_migrate("replica", "time_tracking"))
+        self.assertTrue(router.allow_migrate("default", "time_tracking"))
+
+
+class ReplicaAvailabilityTestCase(TestCase):
+    """Class for the replica availability test cases."""
+
+    def setUp(self) -> None:
+        replicas._unavailable.clear()
+        self.addCleanup(replicas._unavailable.clear)
+
+    @override_settings(DATABASE_REPLICAS=["default"])
+    def test_available_replica(self):
+        """Test a replica that connects is used."""
+        self.assertEqual(replicas.get_replica(), "default")
+
+    @override_settings(DATABASE_REPLICAS=["default"], DATABASE_REPLICA_RETRY_SECONDS=60)
+    def test_unavailable_replica(self):
+        """Test a replica that fails to connect falls back to the primary and is left out."""
+        with mock.patch.object(
+            connections["default"], "ensure_connection", side_effect=OperationalError
+        ) as ensure_connection, self.assertLogs("time_tracking.replicas", "WARNING"):
+            self.assertIsNone(replicas.get_replica())
+            self.assertIsNone(replicas.get_replica())
+
+        self.assertEqual(ensure_connection.call_count, 1)
+        # Still left out once it's back.
+        self.assertIsNone(replicas.get_replica())
+
+    @override_settings(DATABASE_REPLICAS=["default"], DATABASE_REPLICA_RETRY_SECONDS=0)
+    def test_replica_retried(self):
+        """Test a replica is retried once the retry delay passed."""
+        with mock.patch.object(
+            connections["default"], "ensure_connection", side_effect=OperationalError
+        ), self.assertLogs("time_tracking.replicas", "WARNING"):
+            self.assertIsNone(replicas.get_replica())
+
+        self.assertEqual(replicas.get_replica(), "default")
@@ -0,0 +1,135 @@
+import datetime
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.models import DailyTimeTrackingRollupModel, TimeTrackingModel
+from time_tracking.rollups import find_rollup_mismatches
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+from time_tracking.views import TimeTrackingsViewSet
+
+
+def utc(*args) -> datetime.datetime:
+    return datetime.datetime(*args, tzinfo=datetime.timezone.utc)
+
+
+class DailyRollupTestCase(APITestCase):
+    """Class for daily rollup maintenance test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.admin = UserFactory(
+            username="admin@test.com",
+            password="Test@123",
+            is_staff=True,
+            is_superuser=True,
+        )
+        cls.project = ProjectFactory()
+        cls.project_2 = ProjectFactory()
+        cls.entry = TimeTrackingModelFactory(
+            user=cls.user,
+            project=cls.project,
+            date_worked=utc(2025, 3, 10, 9),
+            hours=3,
+        )
+        cls.time_tracking_url = "time-tracking-list"
+        cls.time_tracking_details_url = "time-tracking-detail"
+
+    def rollups(self) -> list:
+        return list(
+            DailyTimeTrackingRollupModel.objects.order_by("project_id", "day").values_list(
+                "project_id", "day", "hours", "entries"
+            )
+        )
+
+    def test_api_writes_keep_rollups_exact(self):
+        """Test create, update and delete through the API keep the rollups exact."""
+        self.client.force_authenticate(user=self.user)
+        payload = {
+            "project": self.project.id,
+            "date_worked": utc(2025, 3, 10, 15),
+            "hours": 2,
+            "work_description": "Test description",
+        }
+        response = self.client.post(reverse(self.time_tracking_url), payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.rollups(), [(self.project.id, datetime.date(2025, 3, 10), 5, 2)])
+
+        url = reverse(self.time_tracking_details_url, kwargs={"pk": response.json()["id"]})
+        response = self.client.patch(
+            url,
+            {"project": self.project_2.id, "date_worked": utc(2025, 3, 11, 9), "hours": 4},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.rollups(),
+            [
+                (self.project.id, datetime.date(2025, 3, 10), 3, 1),
+                (self.project_2.id, datetime.date(2025, 3, 11), 4, 1),
+            ],
+        )
+
+        response = self.client.delete(url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.rollups(), [(self.project.id, datetime.date(2025, 3, 10), 3, 1)])
+        self.assertEqual(find_rollup_mismatches(), [])
+
+    def test_writes_after_a_concurrent_write_keep_rollups_exact(self):
+        """Test updates and deletes move the entry's current values, not the ones read before."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse(self.time_tracking_details_url, kwargs={"pk": self.entry.id})
+
+        for method, data in ((self.client.patch, {"hours": 4}), (self.client.delete, None)):
+            # Read before a concurrent write changes the entry.
+            stale = TimeTrackingModel.objects.select_related("project").get(pk=self.entry.id)
+            self.client.patch(url, {"hours": stale.hours + 2}, format="json")
+
+            with mock.patch.object(TimeTrackingsViewSet, "get_object", return_value=stale):
+                response = method(url, data, format="json")
+
+            self.assertLess(response.status_code, 300)
+            self.assertEqual(find_rollup_mismatches(), [])
+
+    def test_admin_delete_keeps_rollups_exact(self):
+        """Test deleting an entry through the admin removes it from the rollups."""
+        self.client.force_login(self.admin)
+        url = reverse("admin:time_tracking_timetrackingmodel_delete", args=[self.entry.id])
+
+        response = self.client.post(url, {"post": "yes"})
+
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertEqual(self.rollups(), [])
+        self.assertEqual(find_rollup_mismatches(), [])
+
+    def test_check_and_rebuild_commands(self):
+        """Test the checker reports drift and the rebuild command fixes it."""
+        # Raw writes bypass the rollups, e.g. a manual fix in the database.
+        TimeTrackingModel.objects.filter(id=self.entry.id).update(hours=8)
+
+        with self.assertRaises(CommandError):
+            call_command("check_time_tracking_rollups", stdout=StringIO())
+
+        call_command(
+            "rebuild_time_tracking_rollups",
+            "--start-date=2025-03-10",
+            "--end-date=2025-03-10",
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(self.rollups(), [(self.project.id, datetime.date(2025, 3, 10), 8, 1)])
+        call_command("check_time_tracking_rollups", stdout=StringIO())
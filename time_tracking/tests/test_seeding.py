@@ -0,0 +1,145 @@
+import datetime
+import io
+import random
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.db.models import Count
+from django.test import SimpleTestCase, TestCase
+
+from time_tracking.cache import get_projects_version
+from time_tracking.models import ProjectsModel, TimeTrackingModel
+from time_tracking.rollups import find_rollup_mismatches
+from time_tracking.seeding import DataSeeder, DateSampler, entry_counts
+
+START = datetime.date(2024, 1, 1)
+
+
+class SeedingTestCase(TestCase):
+    """Class for the synthetic dataset generator test cases."""
+
+    def seed(self, prefix: str = "seed", **options) -> str:
+        stdout = io.StringIO()
+        options = {
+            "users": 5,
+            "projects": 4,
+            "entries": 200,
+            "start_date": START,
+            "days": 30,
+            "batch_size": 64,
+            **options,
+        }
+        # None leaves the option to its default.
+        options = {name: value for name, value in options.items() if value is not None}
+        call_command("seed_data", prefix=prefix, stdout=stdout, **options)
+        return stdout.getvalue()
+
+    def entries(self, prefix: str) -> list:
+        """The generated entries, with users and projects by their index."""
+        rows = (
+            TimeTrackingModel.objects.filter(user__username__startswith=f"{prefix}-user-")
+            .order_by("id")
+            .values_list(
+                "user__username", "project__title", "date_worked", "work_description", "hours"
+            )
+        )
+        return [
+            (username.split("-user-")[1], title.split(" project ")[1], *values)
+            for username, title, *values in rows
+        ]
+
+    def test_seed_data(self):
+        """Test the dataset is generated with one password hash and matching rollups."""
+        version = get_projects_version()
+
+        output = self.seed()
+
+        self.assertIn("Seeded 5 users, 4 projects and 200 entries", output)
+        users = User.objects.filter(username__startswith="seed-user-")
+        self.assertEqual(users.count(), 5)
+        self.assertEqual(users.values("password").distinct().count(), 1)
+        self.assertTrue(users.first().check_password("Seed@123"))
+        self.assertEqual(ProjectsModel.objects.filter(title__startswith="seed project ").count(), 4)
+
+        entries = TimeTrackingModel.objects.all()
+        self.assertEqual(entries.count(), 200)
+        self.assertFalse(entries.filter(date_worked__date__lt=START).exists())
+        last_day = START + datetime.timedelta(days=29)
+        self.assertFalse(entries.filter(date_worked__date__gt=last_day).exists())
+        self.assertEqual(find_rollup_mismatches(), [])
+        # The cached project responses are dropped despite bulk_create sending no signal.
+        self.assertNotEqual(get_projects_version(), version)
+
+    def test_deterministic(self):
+        """Test the same seed generates the same rows, and another seed other rows."""
+        self.seed("first")
+        self.seed("second")
+        self.seed("third", seed=1)
+        self.seed("default-start", start_date=None)
+
+        self.assertEqual(self.entries("first"), self.entries("second"))
+        self.assertNotEqual(self.entries("first"), self.entries("third"))
+        # The default start date is fixed too.
+        self.assertEqual(self.entries("first"), self.entries("default-start"))
+
+    def test_bulk_create(self):
+        """Test entries inserted with bulk_create match the COPY ones on PostgreSQL."""
+        self.seed("copy")
+        self.seed("bulk", no_copy=True)
+
+        self.assertEqual(self.entries("copy"), self.entries("bulk"))
+
+    def test_existing_prefix(self):
+        """Test seeding twice with the same prefix is refused."""
+        self.seed(users=1, entries=1)
+
+        with self.assertRaisesMessage(CommandError, "Data prefixed seed exists already"):
+            self.seed(users=1, entries=1)
+
+    def test_pareto(self):
+        """Test the pareto distribution gives most entries to few users."""
+        self.seed(users=20, entries=1000, entry_distribution="pareto", skew=2)
+
+        counts = sorted(
+            TimeTrackingModel.objects.values("user").annotate(count=Count("id")).values_list(
+                "count", flat=True
+            ),
+            reverse=True,
+        )
+        self.assertGreater(sum(counts[:4]), 800)
+
+
+class DistributionsTestCase(SimpleTestCase):
+    """Class for the entry and date distribution test cases."""
+
+    def test_entry_counts(self):
+        """Test the counts always add up to the total."""
+        for distribution in ("uniform", "pareto"):
+            with self.subTest(distribution=distribution):
+                counts = entry_counts(1001, 7, distribution, 1.2, random.Random(0))
+                self.assertEqual(sum(counts), 1001)
+                self.assertEqual(len(counts), 7)
+
+        self.assertEqual(entry_counts(10, 3, "uniform", 1.2, random.Random(0)), [4, 3, 3])
+
+    def test_dates(self):
+        """Test the date distributions stay in the range, weekdays on weekdays."""
+        for distribution in ("uniform", "weekdays", "recent"):
+            with self.subTest(distribution=distribution):
+                sample = DateSampler(START, 14, distribution, random.Random(0))
+                days = [sample().date() for _ in range(500)]
+                self.assertTrue(all(START <= day < START + datetime.timedelta(14) for day in days))
+                if distribution == "weekdays":
+                    self.assertTrue(all(day.weekday() < 5 for day in days))
+
+        recent = DateSampler(START, 14, "recent", random.Random(0))
+        days = [recent().date() for _ in range(1000)]
+        second_week = sum(day >= START + datetime.timedelta(7) for day in days)
+        self.assertGreater(second_week, 700)
+
+    def test_seeder_names(self):
+        """Test the generated names carry the prefix."""
+        seeder = DataSeeder(prefix="load")
+
+        self.assertEqual(seeder.username(3), "load-user-3@example.com")
+        self.assertEqual(seeder.project_title(3), "load project 3")
@@ -0,0 +1,80 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from time_tracking.models import TimeTrackingModel
+from time_tracking.serializers import TimeTrackingModelSerializer, TimeTrackingValuesSerializer
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+class TimeTrackingValuesSerializerTestCase(APITestCase):
+    """Class for the read-only .values() serializer test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory(title="Ünïcödé   project")
+        cls.project_2 = ProjectFactory()
+        base = datetime.datetime(2024, 3, 31, 23, 30, tzinfo=datetime.timezone.utc)
+        for index in range(5):
+            TimeTrackingModelFactory(
+                user=cls.user,
+                project=cls.project if index % 2 else cls.project_2,
+                # Whole seconds and microseconds, across a DST change in Europe.
+                date_worked=base + datetime.timedelta(hours=index * 7, microseconds=index * 1001),
+                work_description=f'"Quoted" \\ work {index} ✓',
+                hours=index,
+            )
+
+    def render_both(self) -> tuple:
+        queryset = TimeTrackingModel.objects.filter(user=self.user).order_by("id")
+        renderer = JSONRenderer()
+        expected = renderer.render(TimeTrackingModelSerializer(queryset, many=True).data)
+        actual = renderer.render(
+            TimeTrackingValuesSerializer(TimeTrackingValuesSerializer.values(queryset)).data
+        )
+        return expected, actual
+
+    def test_output_matches_model_serializer(self):
+        """Test the rendered rows are byte-for-byte those of TimeTrackingModelSerializer."""
+        expected, actual = self.render_both()
+
+        self.assertEqual(actual, expected)
+
+    def test_output_matches_in_other_timezone(self):
+        """Test the datetimes are converted to the current timezone like the model serializer."""
+        with timezone.override("Europe/Berlin"):
+            expected, actual = self.render_both()
+
+        self.assertIn(b"+02:00", actual)
+        self.assertEqual(actual, expected)
+
+    @override_settings(REST_FRAMEWORK={"DATETIME_FORMAT": "%Y-%m-%d %H:%M"})
+    def test_output_matches_with_custom_datetime_format(self):
+        """Test a custom DATETIME_FORMAT falls back to the DRF field formatting."""
+        expected, actual = self.render_both()
+
+        self.assertEqual(actual, expected)
+
+    def test_benchmark_command(self):
+        """Test the benchmark reports rows per second for both paths."""
+        out = StringIO()
+        call_command("benchmark_serialization", rows=50, repeat=1, stdout=out)
+
+        self.assertIn("TimeTrackingModelSerializer", out.getvalue())
+        self.assertIn("TimeTrackingValuesSerializer", out.getvalue())
+        self.assertIn("rows/s", out.getvalue())
@@ -0,0 +1,28 @@
+import os
+from unittest import mock
+
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase
+
+from core.settings import database
+
+
+class DatabaseSettingsTestCase(SimpleTestCase):
+    """Class for the database settings built from the environment test cases."""
+
+    @mock.patch.dict(os.environ, {"DB_POOL": "true", "DB_CONN_HEALTH_CHECKS": "true"})
+    def test_pool_checks_connections(self):
+        """Test pooled connections are pinged by the pool before they are handed out."""
+        from psycopg_pool import ConnectionPool
+
+        connection = ConnectionHandler({"default": database("pooled")})["default"]
+        try:
+            self.assertEqual(connection.settings_dict["CONN_MAX_AGE"], 0)
+            self.assertIs(connection.pool._check, ConnectionPool.check_connection)
+        finally:
+            connection.close_pool()
+
+    @mock.patch.dict(os.environ, {"DB_POOL": "true"})
+    def test_unpooled(self):
+        """Test pooled=False leaves the pool options out."""
+        self.assertNotIn("OPTIONS", database("test", pooled=False))
@@ -0,0 +1,127 @@
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from time_tracking.authentication import get_auth_cache
+from time_tracking.cache import get_projects_cache
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+class AsyncViewsTestCase(APITestCase):
+    """Class for the async read endpoints test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.user_2 = UserFactory(
+            username="testuser2@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory(title="Alpha")
+        cls.project_2 = ProjectFactory(title="Beta")
+        cls.entries = [
+            TimeTrackingModelFactory(
+                user=cls.user,
+                project=cls.project if index % 2 else cls.project_2,
+                date_worked=timezone.now() + timedelta(days=index),
+                hours=index + 1,
+            )
+            for index in range(5)
+        ]
+        cls.other_entry = TimeTrackingModelFactory(
+            user=cls.user_2, project=cls.project, date_worked=timezone.now(), hours=1
+        )
+
+    def setUp(self) -> None:
+        get_auth_cache().clear()
+        get_projects_cache().clear()
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def assertSameResponse(self, sync_url: str, async_url: str, params: dict = None):
+        """Assert the async endpoint answers exactly like the sync one."""
+        expected = self.client.get(sync_url, params, format="json")
+        actual = self.client.get(async_url, params, format="json")
+
+        self.assertEqual(actual.status_code, expected.status_code)
+        self.assertEqual(actual["Content-Type"], expected["Content-Type"])
+        self.assertEqual(actual.content, expected.content)
+        return actual
+
+    def test_time_tracking_list(self):
+        """Test the async entry list matches the sync one, with filters and pagination."""
+        sync_url = reverse("time-tracking-list")
+        async_url = reverse("async-time-tracking-list")
+
+        response = self.assertSameResponse(sync_url, async_url)
+        self.assertEqual(len(response.json()), 5)
+        self.assertSameResponse(sync_url, async_url, {"project": self.project.id})
+        self.assertSameResponse(sync_url, async_url, {"start_date": "not a date"})
+
+        page = self.client.get(async_url, {"page_size": 2}, format="json").json()
+        self.assertEqual(len(page["results"]), 2)
+        self.assertIsNotNone(page["next"])
+        next_url = urlparse(page["next"])
+        self.assertEqual(next_url.path, async_url)
+        params = {key: values[0] for key, values in parse_qs(next_url.query).items()}
+
+        # The links point at each endpoint's own URL.
+        expected = self.client.get(sync_url, params, format="json").json()
+        actual = self.client.get(async_url, params, format="json").json()
+        self.assertEqual(actual["results"], expected["results"])
+        self.assertEqual(len(actual["results"]), 2)
+        for link in ("next", "previous"):
+            self.assertEqual(actual[link], expected[link].replace(sync_url, async_url, 1))
+
+    def test_time_tracking_list_not_modified(self):
+        """Test the async entry list answers 304 for an unchanged list."""
+        url = reverse("async-time-tracking-list")
+        etag = self.client.get(url, format="json")["ETag"]
+
+        response = self.client.get(url, format="json", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_time_tracking_detail(self):
+        """Test the async entry detail matches the sync one, including other users' entries."""
+        for entry in (self.entries[0], self.other_entry):
+            with self.subTest(entry=entry.id):
+                self.assertSameResponse(
+                    reverse("time-tracking-detail", kwargs={"pk": entry.id}),
+                    reverse("async-time-tracking-detail", kwargs={"pk": entry.id}),
+                )
+
+    def test_projects(self):
+        """Test the async project endpoints match the sync ones."""
+        self.assertSameResponse(reverse("project-list"), reverse("async-project-list"))
+        for pk in (self.project.id, 500):
+            with self.subTest(pk=pk):
+                self.assertSameResponse(
+                    reverse("project-detail", kwargs={"pk": pk}),
+                    reverse("async-project-detail", kwargs={"pk": pk}),
+                )
+
+    def test_authentication_required(self):
+        """Test the async endpoints reject missing and invalid tokens like the API."""
+        for credentials in ({}, {"HTTP_AUTHORIZATION": "Bearer invalid"}):
+            with self.subTest(credentials=credentials):
+                self.client.credentials(**credentials)
+                response = self.assertSameResponse(
+                    reverse("time-tracking-list"), reverse("async-time-tracking-list")
+                )
+                self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+                self.assertEqual(response["WWW-Authenticate"], 'Bearer realm="api"')
@@ -0,0 +1,93 @@
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from time_tracking.authentication import get_auth_cache
+from time_tracking.cache import get_projects_cache
+from time_tracking.tests.factory import ProjectFactory, UserFactory
+
+
+class CachedJWTAuthenticationTestCase(APITestCase):
+    """Class for the cached JWT authentication test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory()
+
+        cls.project_url = "project-list"
+        cls.time_tracking_url = "time-tracking-list"
+        cls.cache_stats_url = "diagnostics-cache"
+
+    def setUp(self) -> None:
+        get_auth_cache().clear()
+        get_projects_cache().clear()
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_authenticated_reads_skip_the_user_query(self):
+        """Test only the first request loads the user from the database."""
+        # The user, then the projects.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse(self.project_url), format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Cached user and cached projects: no query at all.
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse(self.project_url), format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_created_entries_belong_to_the_cached_user(self):
+        """Test the cached user works as the owner of new entries."""
+        self.client.get(reverse(self.project_url), format="json")
+        payload = {
+            "project": self.project.id,
+            "date_worked": "2024-03-01T09:00:00Z",
+            "work_description": "Cached user",
+            "hours": 2,
+        }
+
+        response = self.client.post(reverse(self.time_tracking_url), payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["user"], self.user.id)
+
+    def test_deactivated_user_is_rejected(self):
+        """Test deactivating a user invalidates the cached state."""
+        self.client.get(reverse(self.project_url), format="json")
+
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(reverse(self.project_url), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.json()["code"], "user_inactive")
+
+    def test_deleted_user_is_rejected(self):
+        """Test deleting a user invalidates the cached state."""
+        self.client.get(reverse(self.project_url), format="json")
+
+        self.user.delete()
+        response = self.client.get(reverse(self.project_url), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.json()["code"], "user_not_found")
+
+    def test_permission_changes_apply(self):
+        """Test promoting a user to staff applies on the next request."""
+        self.assertEqual(
+            self.client.get(reverse(self.cache_stats_url)).status_code, status.HTTP_403_FORBIDDEN
+        )
+
+        self.user.is_staff = True
+        self.user.save()
+
+        self.assertEqual(
+            self.client.get(reverse(self.cache_stats_url)).status_code, status.HTTP_200_OK
+        )
@@ -0,0 +1,199 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from time_tracking.archival import EntryArchiver
+from time_tracking.cache import get_projects_cache
+from time_tracking.models import TimeTrackingModel
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+class ConditionalGetTestCase(APITestCase):
+    """Class for the ETag / Last-Modified conditional GET test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.user_2 = UserFactory(
+            username="testuser2@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory(title="Alpha")
+        cls.entries = [
+            TimeTrackingModelFactory(
+                user=cls.user,
+                project=cls.project,
+                date_worked=timezone.now() + timedelta(days=index),
+                hours=index + 1,
+            )
+            for index in range(3)
+        ]
+
+        cls.time_tracking_url = "time-tracking-list"
+        cls.time_tracking_details_url = "time-tracking-detail"
+        cls.project_url = "project-list"
+        cls.project_details_url = "project-detail"
+
+    def setUp(self) -> None:
+        get_projects_cache().clear()
+        self.client.force_authenticate(user=self.user)
+
+    def get(self, url: str, etag: str = None, **params):
+        headers = {"If-None-Match": etag} if etag else {}
+        return self.client.get(url, params, format="json", headers=headers)
+
+    def test_list_not_modified(self):
+        """Test an unchanged entry list returns 304 without querying the database."""
+        url = reverse(self.time_tracking_url)
+        etag = self.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.get(url, etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_list_etag_changes_on_writes(self):
+        """Test creating, updating and hard-deleting entries change the list ETag."""
+        url = reverse(self.time_tracking_url)
+        etag = self.get(url)["ETag"]
+
+        self.client.patch(
+            reverse(self.time_tracking_details_url, kwargs={"pk": self.entries[0].id}),
+            {"hours": 8},
+            format="json",
+        )
+        response = self.get(url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        self.client.delete(
+            reverse(self.time_tracking_details_url, kwargs={"pk": self.entries[1].id}),
+            format="json",
+        )
+        response = self.get(url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 2)
+
+    def test_list_etag_changes_on_bulk_writes(self):
+        """Test batch creates, bulk updates, bulk deletes and archival change the list ETag."""
+        url = reverse(self.time_tracking_url)
+        writes = [
+            lambda: self.client.post(
+                reverse("time-tracking-batch"),
+                [
+                    {
+                        "project": self.project.id,
+                        "date_worked": timezone.now(),
+                        "work_description": "Batch",
+                        "hours": 1,
+                    }
+                ],
+                format="json",
+            ),
+            lambda: self.client.post(
+                reverse("time-tracking-bulk-update"),
+                {"ids": [self.entries[0].id], "changes": {"hours": 7}},
+                format="json",
+            ),
+            lambda: self.client.post(
+                reverse("time-tracking-bulk-delete"), {"ids": [self.entries[1].id]}, format="json"
+            ),
+            lambda: EntryArchiver().archive_batch(
+                TimeTrackingModel.objects.filter(pk=self.entries[2].pk), "retention"
+            ),
+        ]
+
+        for write in writes:
+            etag = self.get(url)["ETag"]
+            write()
+            self.assertEqual(self.get(url, etag).status_code, status.HTTP_200_OK)
+
+    def test_list_etag_depends_on_filters_and_user(self):
+        """Test the list ETag differs between filters and between users."""
+        url = reverse(self.time_tracking_url)
+        etag = self.get(url)["ETag"]
+
+        response = self.get(url, etag, project=self.project.id)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=self.user_2)
+        response = self.get(url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_not_modified(self):
+        """Test an unchanged entry returns 304 for its ETag and its Last-Modified."""
+        url = reverse(self.time_tracking_details_url, kwargs={"pk": self.entries[0].id})
+        first = self.get(url)
+        self.assertIn("Last-Modified", first)
+
+        with self.assertNumQueries(1):
+            response = self.get(url, first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(
+            url, format="json", headers={"If-Modified-Since": first["Last-Modified"]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.patch(url, {"hours": 8}, format="json")
+        response = self.get(url, first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_entries_modified_by_project_rename(self):
+        """Test renaming a project changes the ETags of the entries listed with its title."""
+        # The async views authenticate with the token only.
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        urls = [
+            reverse(self.time_tracking_url),
+            reverse(self.time_tracking_details_url, kwargs={"pk": self.entries[0].id}),
+            reverse("async-time-tracking-list"),
+            reverse("async-time-tracking-detail", kwargs={"pk": self.entries[0].id}),
+        ]
+        etags = [self.get(url)["ETag"] for url in urls]
+
+        response = self.client.patch(
+            reverse(self.project_details_url, kwargs={"pk": self.project.id}),
+            {"title": "Beta"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        for url, etag in zip(urls, etags):
+            with self.subTest(url=url):
+                response = self.get(url, etag)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertIn('"project_title":"Beta"', response.content.decode().replace(" ", ""))
+
+    def test_projects_not_modified_from_cache(self):
+        """Test unchanged projects return 304 without querying the database."""
+        list_url = reverse(self.project_url)
+        detail_url = reverse(self.project_details_url, kwargs={"pk": self.project.id})
+        list_etag = self.get(list_url)["ETag"]
+        detail_etag = self.get(detail_url)["ETag"]
+
+        with self.assertNumQueries(0):
+            list_response = self.get(list_url, list_etag)
+            detail_response = self.get(detail_url, detail_etag)
+
+        self.assertEqual(list_response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(detail_response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.patch(detail_url, {"title": "Beta"}, format="json")
+        self.assertEqual(self.get(list_url, list_etag).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get(detail_url, detail_etag).status_code, status.HTTP_200_OK)
@@ -0,0 +1,55 @@
+from django.db import connection
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.tests.factory import UserFactory
+
+
+class DiagnosticsTestCase(APITestCase):
+    """Class for the diagnostics endpoints test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.admin = UserFactory(
+            username="admin@test.com",
+            password="Test@123",
+            is_staff=True,
+            is_superuser=True,
+        )
+
+        cls.db_pool_url = "diagnostics-db-pool"
+
+    def test_db_pool(self):
+        """Test the connection settings of each database are reported."""
+        self.client.force_authenticate(user=self.admin)
+
+        response = self.client.get(reverse(self.db_pool_url), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        database = response.json()[connection.alias]
+        pooled = bool(connection.settings_dict["OPTIONS"].get("pool"))
+        self.assertEqual(database["vendor"], connection.vendor)
+        self.assertEqual(database["pooled"], pooled)
+        self.assertEqual(database["conn_max_age"], connection.settings_dict["CONN_MAX_AGE"])
+        self.assertEqual(
+            database["health_checks"], connection.settings_dict["CONN_HEALTH_CHECKS"]
+        )
+        if pooled:
+            self.assertIn("pool_size", database["pool"])
+        else:
+            self.assertIsNone(database["pool"])
+
+    def test_db_pool_requires_admin(self):
+        """Test only admins can see the connection settings."""
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(reverse(self.db_pool_url), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,186 @@
+import pstats
+import tempfile
+
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.profiling import ProfilingMiddleware, list_profiles, make_token
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+class ProfilingTestCase(APITestCase):
+    """Class for the on-demand request profiling test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.admin = UserFactory(
+            username="admin@test.com",
+            password="Test@123",
+            is_staff=True,
+            is_superuser=True,
+        )
+        project = ProjectFactory(title="Alpha")
+        TimeTrackingModelFactory(
+            user=cls.user, project=project, date_worked=timezone.now(), hours=2
+        )
+
+        cls.token_url = "diagnostics-profile-token"
+        cls.profiles_url = "diagnostics-profiles"
+        cls.profile_url = "diagnostics-profile-detail"
+        cls.time_tracking_url = "time-tracking-list"
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.enterContext(override_settings(PROFILING_DIR=directory.name))
+
+    def profiled_get(self, token: str, url: str = None):
+        """GET the time tracking list as the user, sending the profiling token."""
+        self.client.force_authenticate(user=self.user)
+        return self.client.get(url or reverse(self.time_tracking_url), HTTP_X_PROFILE=token)
+
+    def test_profile_request(self):
+        """Test a request sending a token is profiled, listed and downloadable."""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(reverse(self.token_url), {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["header"], "X-Profile")
+        self.assertEqual(response.json()["expires_in"], 900)
+
+        response = self.profiled_get(response.json()["token"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("X-Profile-Skipped", response)
+        name = response["X-Profile-Id"]
+        self.assertTrue(name.endswith(".prof"))
+        self.assertIn("-get-api-time-tracking-", name)
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse(self.profiles_url))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        [profile] = response.json()
+        self.assertEqual(profile["name"], name)
+        self.assertGreater(profile["size"], 0)
+
+        response = self.client.get(reverse(self.profile_url, args=[name]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with tempfile.NamedTemporaryFile(suffix=".prof") as file:
+            file.write(b"".join(response.streaming_content))
+            file.flush()
+            functions = [function for _, _, function in pstats.Stats(file.name).stats]
+        self.assertIn("dispatch", functions)
+
+        response = self.client.get(
+            reverse(self.profile_url, args=[name]), {"sort": "cumulative", "limit": 5}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("Ordered by: cumulative time", response.content.decode())
+
+    def test_token_requires_admin(self):
+        """Test only admins can get tokens and see the profiles."""
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(reverse(self.token_url), {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get(reverse(self.profiles_url))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_token_path(self):
+        """Test tokens limited to a path only profile the requests under it."""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(reverse(self.token_url), {"path": "api/"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(
+            reverse(self.token_url), {"path": "/api/time-tracking"}, format="json"
+        )
+        token = response.json()["token"]
+
+        self.assertIn("X-Profile-Id", self.profiled_get(token))
+        response = self.profiled_get(token, reverse("project-list"))
+        self.assertEqual(response["X-Profile-Skipped"], "path")
+        self.assertNotIn("X-Profile-Id", response)
+
+    def test_skipped_tokens(self):
+        """Test requests with an invalid, expired or revoked token are not profiled."""
+        token = make_token(self.admin)
+        self.assertEqual(self.profiled_get("forged")["X-Profile-Skipped"], "invalid")
+        with override_settings(PROFILING_TOKEN_MAX_AGE=-1):
+            self.assertEqual(self.profiled_get(token)["X-Profile-Skipped"], "expired")
+        self.assertEqual(
+            self.profiled_get(make_token(self.user))["X-Profile-Skipped"], "revoked"
+        )
+
+        self.admin.is_staff = False
+        self.admin.save()
+        response = self.profiled_get(token)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-Profile-Skipped"], "revoked")
+        self.assertEqual(list_profiles(), [])
+
+    def test_busy(self):
+        """Test requests over the concurrency limit are served without profiling."""
+        token = make_token(self.admin)
+        inner = []
+
+        def view(request):
+            # The outer request, while being profiled, makes the inner one.
+            if request.path == "/outer":
+                inner.append(middleware(RequestFactory().get("/inner", HTTP_X_PROFILE=token)))
+            return HttpResponse()
+
+        middleware = ProfilingMiddleware(view)
+        outer = middleware(RequestFactory().get("/outer", HTTP_X_PROFILE=token))
+
+        self.assertEqual(inner[0]["X-Profile-Skipped"], "busy")
+        self.assertIn("X-Profile-Id", outer)
+
+    @override_settings(PROFILING_MAX_FILES=2)
+    def test_rotation(self):
+        """Test only the newest profiles are kept."""
+        token = make_token(self.admin)
+        names = [self.profiled_get(token)["X-Profile-Id"] for _ in range(3)]
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse(self.profiles_url))
+
+        self.assertEqual(sorted(profile["name"] for profile in response.json()), sorted(names[1:]))
+
+    def test_unknown_profile(self):
+        """Test downloading a profile that doesn't exist returns 404."""
+        self.client.force_authenticate(user=self.admin)
+
+        response = self.client.get(reverse(self.profile_url, args=["missing.prof"]))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(PROFILING_DIR="")
+    def test_disabled(self):
+        """Test nothing is profiled without a profiles directory."""
+        response = self.profiled_get(make_token(self.admin))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertNotIn("X-Profile-Skipped", response)
+
+    async def test_async(self):
+        """Test requests served under ASGI are not profiled."""
+        response = await self.async_client.get(
+            reverse(self.time_tracking_url), headers={"X-Profile": "token"}
+        )
+
+        self.assertEqual(response["X-Profile-Skipped"], "async")
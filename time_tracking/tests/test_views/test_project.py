@@ -3,6 +3,7 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from time_tracking.cache import get_projects_cache
 from time_tracking.models import ProjectsModel
 from time_tracking.serializers import ProjectsSerializer
 from time_tracking.tests.factory import ProjectFactory, UserFactory
@@ -23,6 +24,10 @@ class AuthenticationTestCase(APITestCase):
         cls.project_url = "project-list"
         cls.project_details_url = "project-detail"
 
+    def setUp(self) -> None:
+        # The projects cache outlives the per-test database rollback.
+        get_projects_cache().clear()
+
     def test_successful_retrieve_project_list(self):
         """Test successful retrieve of project list."""
         self.client.force_authenticate(user=self.user)
@@ -0,0 +1,98 @@
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.cache import get_projects_cache
+from time_tracking.tests.factory import ProjectFactory, UserFactory
+
+
+class ProjectCacheTestCase(APITestCase):
+    """Class for the cached project responses test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.admin = UserFactory(
+            username="admin@test.com",
+            password="Test@123",
+            is_staff=True,
+            is_superuser=True,
+        )
+        cls.project = ProjectFactory(title="Alpha")
+
+        cls.project_url = "project-list"
+        cls.project_details_url = "project-detail"
+        cls.cache_stats_url = "diagnostics-cache"
+
+    def setUp(self) -> None:
+        get_projects_cache().clear()
+        self.client.force_authenticate(user=self.user)
+
+    def test_list_and_detail_are_cached(self):
+        """Test repeated reads are served without querying the database."""
+        detail_url = reverse(self.project_details_url, kwargs={"pk": self.project.id})
+        first_list = self.client.get(reverse(self.project_url), format="json")
+        first_detail = self.client.get(detail_url, format="json")
+
+        with self.assertNumQueries(0):
+            second_list = self.client.get(reverse(self.project_url), format="json")
+            second_detail = self.client.get(detail_url, format="json")
+
+        self.assertEqual(second_list.status_code, status.HTTP_200_OK)
+        self.assertEqual(second_list.json(), first_list.json())
+        self.assertEqual(second_detail.json(), first_detail.json())
+
+    def test_api_writes_invalidate_the_cache(self):
+        """Test creating, updating and soft-deleting projects invalidate the cache."""
+        self.client.get(reverse(self.project_url), format="json")
+
+        response = self.client.post(reverse(self.project_url), {"title": "Beta"}, format="json")
+        beta_id = response.json()["id"]
+        response = self.client.get(reverse(self.project_url), format="json")
+        self.assertEqual([project["title"] for project in response.json()], ["Alpha", "Beta"])
+
+        detail_url = reverse(self.project_details_url, kwargs={"pk": beta_id})
+        self.client.get(detail_url, format="json")
+        self.client.patch(detail_url, {"title": "Gamma"}, format="json")
+        response = self.client.get(detail_url, format="json")
+        self.assertEqual(response.json()["title"], "Gamma")
+
+        self.client.delete(detail_url, format="json")
+        response = self.client.get(reverse(self.project_url), format="json")
+        self.assertEqual([project["title"] for project in response.json()], ["Alpha"])
+        response = self.client.get(detail_url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_admin_edit_invalidates_the_cache(self):
+        """Test editing a project in the admin invalidates the cache."""
+        self.client.get(reverse(self.project_url), format="json")
+
+        self.client.force_login(self.admin)
+        response = self.client.post(
+            reverse("admin:time_tracking_projectsmodel_change", args=[self.project.id]),
+            {"title": "Alpha renamed", "is_active": "on"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+
+        response = self.client.get(reverse(self.project_url), format="json")
+        self.assertEqual(response.json(), [{"id": self.project.id, "title": "Alpha renamed"}])
+
+    def test_cache_stats(self):
+        """Test the hit/miss counters are exposed to admins only."""
+        for _ in range(3):
+            self.client.get(reverse(self.project_url), format="json")
+
+        response = self.client.get(reverse(self.cache_stats_url), format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse(self.cache_stats_url), format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = response.json()["projects"]
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
@@ -0,0 +1,91 @@
+from unittest import mock
+
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.cache import get_projects_cache
+from time_tracking.serializers import ProjectsSerializer
+from time_tracking.tests.factory import ProjectFactory, UserFactory
+
+
+class ProjectSearchTestCase(APITestCase):
+    """Class for the project title search and uniqueness test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.acme = ProjectFactory(title="Acme website")
+        cls.acme_app = ProjectFactory(title="Acme app")
+        cls.redesign = ProjectFactory(title="Redesign for ACME")
+        cls.other = ProjectFactory(title="Internal tools")
+        cls.deleted = ProjectFactory(title="Acme archive", is_deleted=True)
+
+        cls.project_url = "project-list"
+        cls.project_details_url = "project-detail"
+        cls.search_url = "project-search"
+
+    def setUp(self) -> None:
+        get_projects_cache().clear()
+        self.client.force_authenticate(user=self.user)
+
+    def search(self, **params):
+        return self.client.get(reverse(self.search_url), params, format="json")
+
+    def test_search_prefix_matches_first(self):
+        """Test prefix matches come before substring matches, case-insensitively."""
+        response = self.search(q="aCmE")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            ProjectsSerializer([self.acme_app, self.acme, self.redesign], many=True).data,
+        )
+
+    def test_search_limit(self):
+        """Test the limit caps the results, prefix matches first."""
+        response = self.search(q="ACME", limit=1)
+
+        self.assertEqual(response.json(), ProjectsSerializer([self.acme_app], many=True).data)
+
+    def test_search_invalid_params(self):
+        """Test the search requires q and a limit in range."""
+        response = self.search(limit=100)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {
+                "q": ["This field is required."],
+                "limit": ["Ensure this value is less than or equal to 50."],
+            },
+        )
+
+    def test_deleted_title_can_be_reused(self):
+        """Test a soft-deleted project's title is free for a new project."""
+        response = self.client.post(reverse(self.project_url), {"title": "Acme archive"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_update_keeps_own_title(self):
+        """Test updating a project with its own title is not reported as taken."""
+        url = reverse(self.project_details_url, kwargs={"pk": self.acme.id})
+
+        response = self.client.put(url, {"title": "Acme website"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_title_race_is_rejected(self):
+        """Test the unique constraint rejects a title taken after the check passed."""
+        with mock.patch.object(ProjectsSerializer, "validate_title", lambda serializer, value: value):
+            response = self.client.post(
+                reverse(self.project_url), {"title": "Acme website"}, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {"title": ["Project title is already taken."]})
@@ -0,0 +1,113 @@
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from time_tracking.authentication import get_auth_cache
+from time_tracking.cache import get_projects_cache
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+def server_timing(response) -> dict:
+    """The Server-Timing metrics of the response by name."""
+    metrics = {}
+    for metric in response["Server-Timing"].split(", "):
+        name, *params = metric.split(";")
+        metrics[name] = dict(param.split("=", 1) for param in params)
+    return metrics
+
+
+@override_settings(REQUEST_TIMING=True, REQUEST_TIMING_SLOW_MS=60000)
+class RequestTimingTestCase(APITestCase):
+    """Class for the request timing middleware test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        project = ProjectFactory(title="Alpha")
+        cls.entry = TimeTrackingModelFactory(
+            user=cls.user, project=project, date_worked=timezone.now(), hours=2
+        )
+
+        cls.time_tracking_url = "time-tracking-list"
+
+    def setUp(self) -> None:
+        get_auth_cache().clear()
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_server_timing(self):
+        """Test the queries and phases of a request are sent in Server-Timing and logged."""
+        with self.assertLogs("time_tracking.timing", "INFO") as logs:
+            response = self.client.get(reverse(self.time_tracking_url), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        metrics = server_timing(response)
+        # The user and the entries.
+        self.assertEqual(metrics["db"]["desc"], '"2 queries"')
+        for name in ("db", "auth", "serialize", "view", "render", "total"):
+            self.assertGreaterEqual(float(metrics[name]["dur"]), 0)
+        self.assertGreaterEqual(float(metrics["total"]["dur"]), float(metrics["view"]["dur"]))
+
+        [line] = logs.output
+        self.assertIn(
+            "INFO:time_tracking.timing:request method=GET path=/api/time-tracking status=200 "
+            "queries=2 db_ms=",
+            line,
+        )
+        self.assertEqual(logs.records[0].timing["queries"], 2)
+
+    @override_settings(REQUEST_TIMING_SLOW_MS=0)
+    def test_slow_request(self):
+        """Test slow requests are logged as warnings with their SQL."""
+        with self.assertLogs("time_tracking.timing", "WARNING") as logs:
+            self.client.get(reverse(self.time_tracking_url), format="json")
+
+        [line] = logs.output
+        self.assertIn("slow request method=GET path=/api/time-tracking", line)
+        self.assertIn("ms [default] SELECT", line)
+        self.assertIn("time_tracking_timetrackingmodel", line)
+
+    def test_model_serializer(self):
+        """Test the endpoints serializing with ModelSerializers report their phases too."""
+        for url in (
+            reverse("time-tracking-detail", args=[self.entry.id]),
+            reverse("project-list"),
+        ):
+            with self.subTest(url=url), self.assertLogs("time_tracking.timing", "INFO"):
+                get_projects_cache().clear()
+                response = self.client.get(url, format="json")
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                metrics = server_timing(response)
+                self.assertIn("serialize", metrics)
+                self.assertIn("render", metrics)
+
+    def test_async_view(self):
+        """Test the queries of async views, run in another thread, are counted."""
+        with self.assertLogs("time_tracking.timing", "INFO"):
+            response = self.client.get(reverse("async-time-tracking-list"), format="json")
+
+        metrics = server_timing(response)
+        self.assertEqual(metrics["db"]["desc"], '"2 queries"')
+        self.assertIn("render", metrics)
+
+    @override_settings(REQUEST_TIMING=False)
+    def test_disabled(self):
+        """Test nothing is measured when the timing is off."""
+        with self.assertNoLogs("time_tracking.timing"):
+            response = self.client.get(reverse(self.time_tracking_url), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("Server-Timing", response)
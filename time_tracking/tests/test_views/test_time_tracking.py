@@ -59,7 +59,7 @@ class AuthenticationTestCase(APITestCase):
         url = reverse(self.time_tracking_url)
         response = self.client.get(url, format="json")
 
-        queryset = TimeTrackingModel.objects.filter(user=self.user)
+        queryset = TimeTrackingModel.objects.filter(user=self.user).order_by("date_worked", "id")
 
         serialiazer = TimeTrackingModelSerializer(queryset, many=True)
 
@@ -72,7 +72,7 @@ class AuthenticationTestCase(APITestCase):
         url = reverse(self.time_tracking_url)
         response = self.client.get(url, format="json")
 
-        queryset = TimeTrackingModel.objects.filter(user=self.user)
+        queryset = TimeTrackingModel.objects.filter(user=self.user).order_by("date_worked", "id")
 
         serialiazer = TimeTrackingModelSerializer(queryset, many=True)
 
@@ -0,0 +1,91 @@
+import datetime
+
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.archival import EntryArchiver
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+def utc(*args) -> datetime.datetime:
+    return datetime.datetime(*args, tzinfo=datetime.timezone.utc)
+
+
+class TimeTrackingArchivedTestCase(APITestCase):
+    """Class for the archived time tracking entries endpoint test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.other_user = UserFactory(
+            username="otheruser@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory(title="Alpha")
+        cls.entries = [
+            TimeTrackingModelFactory(
+                user=cls.user, project=cls.project, date_worked=utc(2001, 3, day), hours=day
+            )
+            for day in (1, 2, 3)
+        ]
+        TimeTrackingModelFactory(
+            user=cls.other_user, project=cls.project, date_worked=utc(2001, 3, 1), hours=1
+        )
+        EntryArchiver(retention_months=24).run()
+
+        cls.archived_url = "time-tracking-archived"
+        cls.time_tracking_url = "time-tracking-list"
+
+    def test_archived(self):
+        """Test the user's archived entries are listed, and not anymore in the entries list."""
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(reverse(self.archived_url), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([entry["id"] for entry in response.json()], [e.id for e in self.entries])
+        entry = response.json()[0]
+        self.assertEqual(entry["date_worked"], "2001-03-01T00:00:00Z")
+        self.assertEqual(entry["project_title"], "Alpha")
+        self.assertEqual(entry["user"], self.user.id)
+        self.assertEqual(entry["reason"], "retention")
+        self.assertIsNotNone(entry["archived_at"])
+
+        response = self.client.get(reverse(self.time_tracking_url), format="json")
+        self.assertEqual(response.json(), [])
+
+    def test_filters_and_pagination(self):
+        """Test the list filters and pagination params apply to the archived entries."""
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(
+            reverse(self.archived_url),
+            {"start_date": "2001-03-02", "project": self.project.id, "page_size": 1},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        [entry] = response.json()["results"]
+        self.assertEqual(entry["id"], self.entries[1].id)
+        response = self.client.get(response.json()["next"], format="json")
+        [entry] = response.json()["results"]
+        self.assertEqual(entry["id"], self.entries[2].id)
+
+        response = self.client.get(reverse(self.archived_url), {"start_date": "nope"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requires_authentication(self):
+        """Test anonymous users can't read archived entries."""
+        response = self.client.get(reverse(self.archived_url), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
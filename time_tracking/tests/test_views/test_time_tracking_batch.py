@@ -0,0 +1,94 @@
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.models import TimeTrackingModel
+from time_tracking.rollups import find_rollup_mismatches
+from time_tracking.serializers import TimeTrackingModelSerializer
+from time_tracking.tests.factory import ProjectFactory, UserFactory
+
+
+class TimeTrackingBatchCreateTestCase(APITestCase):
+    """Class for time tracking batch create test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.projects = ProjectFactory.create_batch(3)
+        cls.batch_url = "time-tracking-batch"
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(user=self.user)
+
+    def payload(self, count: int) -> list:
+        return [
+            {
+                "project": self.projects[index % len(self.projects)].id,
+                "date_worked": timezone.now(),
+                "hours": index % 8 + 1,
+                "work_description": f"Entry {index}",
+            }
+            for index in range(count)
+        ]
+
+    def test_successful_batch_create(self):
+        """Test a batch is inserted with a fixed number of queries."""
+        # Project lookup, then bulk INSERT and rollup upsert in a savepoint.
+        with self.assertNumQueries(5):
+            response = self.client.post(reverse(self.batch_url), self.payload(100), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["created"], 100)
+        self.assertEqual(response.json()["failed"], 0)
+
+        entries = TimeTrackingModel.objects.filter(user=self.user).order_by("id")
+        self.assertEqual(entries.count(), 100)
+        self.assertEqual(
+            [result["entry"] for result in response.json()["results"]],
+            TimeTrackingModelSerializer(entries, many=True).data,
+        )
+        self.assertEqual(find_rollup_mismatches(), [])
+
+    def test_partial_batch_create(self):
+        """Test invalid items are reported and the valid ones are still created."""
+        payload = self.payload(4)
+        payload[1]["project"] = 99999
+        payload[2]["hours"] = "a lot"
+        payload[3] = "not an entry"
+
+        response = self.client.post(reverse(self.batch_url), payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(response.json()["created"], 1)
+        self.assertEqual(response.json()["failed"], 3)
+        results = response.json()["results"]
+        self.assertEqual(results[0]["entry"]["work_description"], "Entry 0")
+        self.assertEqual(
+            results[1],
+            {
+                "index": 1,
+                "errors": {"project": ['Invalid pk "99999" - object does not exist.']},
+            },
+        )
+        self.assertEqual(results[2], {"index": 2, "errors": {"hours": ["A valid integer is required."]}})
+        self.assertEqual(results[3]["index"], 3)
+        self.assertIn("non_field_errors", results[3]["errors"])
+        self.assertEqual(TimeTrackingModel.objects.filter(user=self.user).count(), 1)
+
+    @override_settings(TIME_TRACKING_BATCH_MAX_SIZE=2)
+    def test_batch_too_large(self):
+        """Test batches over the configured size are rejected."""
+        response = self.client.post(reverse(self.batch_url), self.payload(3), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(), {"non_field_errors": ["A batch can have at most 2 entries."]}
+        )
+        self.assertFalse(TimeTrackingModel.objects.exists())
@@ -0,0 +1,156 @@
+import datetime
+
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.models import TimeTrackingModel
+from time_tracking.rollups import find_rollup_mismatches
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+@override_settings(TIME_TRACKING_BULK_CHUNK_SIZE=2)
+class TimeTrackingBulkTestCase(APITestCase):
+    """Class for time tracking bulk update and delete test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.user_2 = UserFactory(
+            username="testuser2@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory()
+        cls.project_2 = ProjectFactory()
+        cls.week_start = datetime.datetime(2025, 3, 10, 9, tzinfo=datetime.timezone.utc)
+        cls.entries = [
+            TimeTrackingModelFactory(
+                user=cls.user,
+                project=cls.project,
+                date_worked=cls.week_start + datetime.timedelta(days=index),
+                hours=index + 1,
+            )
+            for index in range(5)
+        ]
+        cls.later_entry = TimeTrackingModelFactory(
+            user=cls.user,
+            project=cls.project,
+            date_worked=cls.week_start + datetime.timedelta(days=30),
+            hours=2,
+        )
+        cls.other_user_entry = TimeTrackingModelFactory(
+            user=cls.user_2,
+            project=cls.project,
+            date_worked=cls.week_start,
+            hours=2,
+        )
+        cls.bulk_update_url = "time-tracking-bulk-update"
+        cls.bulk_delete_url = "time-tracking-bulk-delete"
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(user=self.user)
+
+    def test_bulk_update_by_filters(self):
+        """Test re-assigning a week of entries to another project."""
+        before = timezone.now()
+        response = self.client.post(
+            reverse(self.bulk_update_url) + "?start_date=2025-03-10&end_date=2025-03-16",
+            {"changes": {"project": self.project_2.id}},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"updated": 5})
+        moved = TimeTrackingModel.objects.filter(project=self.project_2)
+        self.assertEqual(
+            sorted(moved.values_list("id", flat=True)), [entry.id for entry in self.entries]
+        )
+        self.assertTrue(all(entry.updated_at >= before for entry in moved))
+        self.assertEqual(
+            TimeTrackingModel.objects.get(id=self.later_entry.id).project_id, self.project.id
+        )
+        self.assertEqual(find_rollup_mismatches(), [])
+
+    def test_bulk_update_by_ids_is_scoped_to_user(self):
+        """Test ids of another user's entries are ignored."""
+        response = self.client.post(
+            reverse(self.bulk_update_url),
+            {"ids": [self.entries[0].id, self.other_user_entry.id], "changes": {"hours": 7}},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"updated": 1})
+        self.assertEqual(TimeTrackingModel.objects.get(id=self.entries[0].id).hours, 7)
+        self.assertEqual(TimeTrackingModel.objects.get(id=self.other_user_entry.id).hours, 2)
+        self.assertEqual(find_rollup_mismatches(), [])
+
+    def test_bulk_update_requires_selection_and_changes(self):
+        """Test a bulk update must select entries and change at least one field."""
+        response = self.client.post(
+            reverse(self.bulk_update_url), {"changes": {"hours": 1}}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {"non_field_errors": ["Select the entries with ids or the list filters."]},
+        )
+
+        response = self.client.post(
+            reverse(self.bulk_update_url), {"ids": [self.entries[0].id], "changes": {}}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(), {"changes": {"non_field_errors": ["Provide at least one field to change."]}}
+        )
+
+    def test_empty_filters_select_nothing(self):
+        """Test empty filter values don't count as selecting the entries."""
+        for url in (self.bulk_update_url, self.bulk_delete_url):
+            with self.subTest(url=url):
+                response = self.client.post(
+                    reverse(url) + "?project=&start_date=",
+                    {"changes": {"hours": 1}},
+                    format="json",
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(
+                    response.json(),
+                    {"non_field_errors": ["Select the entries with ids or the list filters."]},
+                )
+        self.assertEqual(TimeTrackingModel.objects.filter(user=self.user).count(), 6)
+        self.assertEqual(TimeTrackingModel.objects.filter(hours=1).count(), 1)
+
+    def test_bulk_delete_in_chunks(self):
+        """Test deleting the selected entries chunk by chunk."""
+        response = self.client.post(
+            reverse(self.bulk_delete_url) + f"?project={self.project.id}", {}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"deleted": 6})
+        self.assertFalse(TimeTrackingModel.objects.filter(user=self.user).exists())
+        self.assertTrue(TimeTrackingModel.objects.filter(id=self.other_user_entry.id).exists())
+        self.assertEqual(find_rollup_mismatches(), [])
+
+    def test_bulk_delete_by_ids(self):
+        """Test deleting entries by id."""
+        ids = [self.entries[1].id, self.entries[2].id, self.entries[3].id]
+        response = self.client.post(reverse(self.bulk_delete_url), {"ids": ids}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"deleted": 3})
+        self.assertFalse(TimeTrackingModel.objects.filter(id__in=ids).exists())
+        self.assertEqual(TimeTrackingModel.objects.filter(user=self.user).count(), 3)
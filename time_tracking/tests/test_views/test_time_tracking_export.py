@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.models import TimeTrackingModel
+from time_tracking.serializers import TimeTrackingModelSerializer
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+class TimeTrackingExportTestCase(APITestCase):
+    """Class for time tracking export test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.user_2 = UserFactory(
+            username="testuser2@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory()
+        cls.project_2 = ProjectFactory(title='Quoted, "project"')
+        for index in range(6):
+            TimeTrackingModelFactory(
+                user=cls.user,
+                project=cls.project if index % 2 else cls.project_2,
+                date_worked=timezone.now() + timedelta(days=index),
+                hours=index + 1,
+            )
+        TimeTrackingModelFactory(
+            user=cls.user_2,
+            project=cls.project,
+            date_worked=timezone.now(),
+            hours=1,
+        )
+        cls.export_url = "time-tracking-export"
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(user=self.user)
+
+    def expected_rows(self, **filters) -> list:
+        queryset = TimeTrackingModel.objects.filter(user=self.user, **filters).order_by(
+            "date_worked", "id"
+        )
+        return TimeTrackingModelSerializer(queryset, many=True).data
+
+    def test_export_csv(self):
+        """Test the CSV export streams the same columns and values as the serializer."""
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse(self.export_url))
+            content = b"".join(response.streaming_content).decode()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(io.StringIO(content)))
+        expected = [
+            {key: str(value) for key, value in row.items()} for row in self.expected_rows()
+        ]
+        self.assertEqual(rows, expected)
+
+    def test_export_ndjson_with_filters(self):
+        """Test the NDJSON export applies the list filters."""
+        response = self.client.get(
+            reverse(self.export_url), {"file_format": "ndjson", "project": self.project.id}
+        )
+        content = b"".join(response.streaming_content).decode()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(rows, self.expected_rows(project=self.project))
+
+    def test_export_invalid_format(self):
+        """Test unsupported export formats are rejected."""
+        response = self.client.get(reverse(self.export_url), {"file_format": "xlsx"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(), {"file_format": ['"xlsx" is not a valid choice.']}
+        )
@@ -0,0 +1,102 @@
+import datetime
+from zoneinfo import ZoneInfo
+
+from django.test import override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+MANILA = ZoneInfo("Asia/Manila")
+
+
+@override_settings(TIME_ZONE="Asia/Manila")
+class TimeTrackingDateFilterTestCase(APITestCase):
+    """Class for time tracking date range filter test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory()
+        cls.before_start = TimeTrackingModelFactory(
+            user=cls.user,
+            project=cls.project,
+            date_worked=datetime.datetime(2025, 3, 9, 23, 59, 59, tzinfo=MANILA),
+            hours=1,
+        )
+        cls.at_start = TimeTrackingModelFactory(
+            user=cls.user,
+            project=cls.project,
+            date_worked=datetime.datetime(2025, 3, 10, 0, 0, tzinfo=MANILA),
+            hours=2,
+        )
+        cls.end_of_last_day = TimeTrackingModelFactory(
+            user=cls.user,
+            project=cls.project,
+            date_worked=datetime.datetime(2025, 3, 16, 23, 59, 59, tzinfo=MANILA),
+            hours=3,
+        )
+        cls.after_end = TimeTrackingModelFactory(
+            user=cls.user,
+            project=cls.project,
+            date_worked=datetime.datetime(2025, 3, 17, 0, 0, tzinfo=MANILA),
+            hours=4,
+        )
+        cls.time_tracking_url = "time-tracking-list"
+
+    def test_date_range_uses_local_day_boundaries(self):
+        """Test start_date and end_date include whole days in the active timezone."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            reverse(self.time_tracking_url),
+            {"start_date": "2025-03-10", "end_date": "2025-03-16"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            sorted(entry["id"] for entry in response.json()),
+            sorted([self.at_start.id, self.end_of_last_day.id]),
+        )
+
+    def test_single_day_range(self):
+        """Test a range where start_date equals end_date returns that day only."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            reverse(self.time_tracking_url),
+            {"start_date": "2025-03-17", "end_date": "2025-03-17"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([entry["id"] for entry in response.json()], [self.after_end.id])
+
+    def test_extreme_dates(self):
+        """Test the first and last representable days filter instead of overflowing."""
+        self.client.force_authenticate(user=self.user)
+        for url in (
+            reverse(self.time_tracking_url),
+            reverse("time-tracking-archived"),
+            reverse("time-tracking-export"),
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(
+                    url, {"start_date": "0001-01-01", "end_date": "9999-12-31"}
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(
+            reverse(self.time_tracking_url), {"end_date": "9999-12-31"}, format="json"
+        )
+        self.assertEqual(len(response.json()), 4)
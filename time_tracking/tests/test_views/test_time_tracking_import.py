@@ -0,0 +1,118 @@
+import datetime
+import tempfile
+from io import StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.models import TimeTrackingModel
+from time_tracking.rollups import find_rollup_mismatches
+from time_tracking.tests.factory import ProjectFactory, UserFactory
+
+CSV_CONTENT = """project_title,date_worked,work_description,hours
+Alpha,2025-03-10T09:00:00Z,Planning,2
+Beta,2025-03-10T13:00:00Z,Review,3
+Unknown,2025-03-11T09:00:00Z,Nothing,1
+Alpha,not a date,Broken,x
+Alpha,2025-03-10T09:00:00Z,Planning,2
+"""
+
+
+class TimeTrackingImportTestCase(APITestCase):
+    """Class for time tracking CSV import test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory(title="Alpha")
+        cls.project_2 = ProjectFactory(title="Beta")
+        cls.import_url = "time-tracking-import"
+
+    def upload(self, content: str):
+        self.client.force_authenticate(user=self.user)
+        csv_file = SimpleUploadedFile("entries.csv", content.encode(), content_type="text/csv")
+        return self.client.post(reverse(self.import_url), {"file": csv_file}, format="multipart")
+
+    def test_successful_import(self):
+        """Test valid rows are imported and invalid or repeated rows are reported."""
+        response = self.upload(CSV_CONTENT)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["created"], 2)
+        self.assertEqual(response.json()["duplicates"], 1)
+        self.assertEqual(response.json()["invalid"], 2)
+        self.assertEqual(
+            response.json()["errors"][0],
+            {"line": 4, "errors": {"project_title": ['Unknown project "Unknown".']}},
+        )
+        self.assertEqual(response.json()["errors"][1]["line"], 5)
+        self.assertEqual(
+            sorted(response.json()["errors"][1]["errors"]), ["date_worked", "hours"]
+        )
+
+        entry = TimeTrackingModel.objects.get(user=self.user, project=self.project)
+        self.assertEqual(entry.date_worked, datetime.datetime(2025, 3, 10, 9, tzinfo=datetime.timezone.utc))
+        self.assertEqual(entry.work_description, "Planning")
+        self.assertEqual(entry.hours, 2)
+        self.assertEqual(find_rollup_mismatches(), [])
+
+    def test_rerun_skips_imported_rows(self):
+        """Test importing the same file twice doesn't insert the rows again."""
+        self.upload(CSV_CONTENT)
+        response = self.upload(CSV_CONTENT)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["created"], 0)
+        self.assertEqual(response.json()["duplicates"], 3)
+        self.assertEqual(TimeTrackingModel.objects.filter(user=self.user).count(), 2)
+
+    def test_missing_columns(self):
+        """Test files without the required columns are rejected."""
+        response = self.upload("project_title,hours\nAlpha,2\n")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(), {"file": ["Missing columns: date_worked, work_description."]}
+        )
+
+    def test_unreadable_file(self):
+        """Test files that aren't UTF-8 or valid CSV are rejected."""
+        self.client.force_authenticate(user=self.user)
+        csv_file = SimpleUploadedFile(
+            "entries.csv", CSV_CONTENT.replace("Review", "Révision").encode("latin-1")
+        )
+        response = self.client.post(
+            reverse(self.import_url), {"file": csv_file}, format="multipart"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {"file": ["The file isn't UTF-8 encoded text."]})
+
+        response = self.upload(CSV_CONTENT + f"Alpha,2025-03-12T09:00:00Z,{'x' * 200000},2\n")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {"file": ["Invalid CSV after line 6: field larger than field limit (131072)."]},
+        )
+
+    def test_import_command(self):
+        """Test the management command imports a CSV file for the given user."""
+        with tempfile.NamedTemporaryFile("w", suffix=".csv") as csv_file:
+            csv_file.write(CSV_CONTENT)
+            csv_file.flush()
+            stdout = StringIO()
+            call_command(
+                "import_time_entries", csv_file.name, "--user", self.user.username, stdout=stdout
+            )
+
+        self.assertIn("Created 2 entries, skipped 1 duplicates and 2 invalid rows.", stdout.getvalue())
+        self.assertEqual(TimeTrackingModel.objects.filter(user=self.user).count(), 2)
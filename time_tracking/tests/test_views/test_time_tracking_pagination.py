@@ -0,0 +1,100 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+class TimeTrackingPaginationTestCase(APITestCase):
+    """Class for time tracking keyset pagination test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory()
+        cls.other_project = ProjectFactory()
+        now = timezone.now()
+        # Two entries share the same date_worked to exercise the id tie-breaker.
+        cls.entries = [
+            TimeTrackingModelFactory(
+                user=cls.user,
+                project=cls.project if index % 2 else cls.other_project,
+                date_worked=now + timedelta(days=index // 2),
+                hours=index + 1,
+            )
+            for index in range(7)
+        ]
+        cls.time_tracking_url = "time-tracking-list"
+
+    def test_list_is_not_paginated_by_default(self):
+        """Test the list stays a plain array when no pagination param is given."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse(self.time_tracking_url), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), len(self.entries))
+
+    def test_walk_all_pages_forward_and_back(self):
+        """Test following next links visits every entry once in (date_worked, id) order."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse(self.time_tracking_url) + "?page_size=3"
+
+        seen, pages = [], []
+        while url:
+            response = self.client.get(url, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append(response.json())
+            seen.extend(entry["id"] for entry in response.json()["results"])
+            url = response.json()["next"]
+
+        expected = [
+            entry.id
+            for entry in sorted(self.entries, key=lambda entry: (entry.date_worked, entry.id))
+        ]
+        self.assertEqual(seen, expected)
+        self.assertEqual([len(page["results"]) for page in pages], [3, 3, 1])
+        self.assertIsNone(pages[0]["previous"])
+
+        response = self.client.get(pages[-1]["previous"], format="json")
+        self.assertEqual(
+            [entry["id"] for entry in response.json()["results"]],
+            [entry["id"] for entry in pages[-2]["results"]],
+        )
+
+    def test_pagination_applies_filters(self):
+        """Test filter params are honored on paginated requests."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            reverse(self.time_tracking_url),
+            {"page_size": 10, "project": self.project.id},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {entry["project"] for entry in response.json()["results"]}, {self.project.id}
+        )
+        self.assertEqual(len(response.json()["results"]), 3)
+        self.assertIsNone(response.json()["next"])
+
+    def test_invalid_cursor(self):
+        """Test an invalid cursor is rejected."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            reverse(self.time_tracking_url), {"cursor": "not-a-cursor"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.json(), {"detail": "Invalid cursor"})
@@ -0,0 +1,111 @@
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+class TimeTrackingQueryCountTestCase(APITestCase):
+    """
+    Guard the number of queries per endpoint so project_title never goes back
+    to a per-row lookup.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.projects = ProjectFactory.create_batch(5)
+        cls.entries = [
+            TimeTrackingModelFactory(
+                user=cls.user,
+                project=project,
+                date_worked=timezone.now(),
+                hours=2,
+            )
+            for project in cls.projects * 4
+        ]
+        cls.time_tracking_url = "time-tracking-list"
+        cls.time_tracking_details_url = "time-tracking-detail"
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(user=self.user)
+
+    def test_list_query_count(self):
+        """Test listing entries runs a single query joining the projects."""
+        # The ETag comes from the cached versions, without a query.
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse(self.time_tracking_url), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), len(self.entries))
+        self.assertEqual(
+            {entry["project_title"] for entry in response.json()},
+            {project.title for project in self.projects},
+        )
+
+    def test_paginated_list_query_count(self):
+        """Test a paginated page runs a single query joining the projects."""
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse(self.time_tracking_url), {"page_size": 10}, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 10)
+
+    def test_retrieve_runs_a_single_query(self):
+        """Test retrieving an entry fetches its project in the same query."""
+        url = reverse(self.time_tracking_details_url, kwargs={"pk": self.entries[0].id})
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["project_title"], self.projects[0].title)
+
+    def test_create_query_count(self):
+        """Test creating an entry only validates the project and inserts."""
+        payload = {
+            "project": self.projects[1].id,
+            "date_worked": timezone.now(),
+            "hours": 2,
+            "work_description": "Test description",
+        }
+
+        # Project lookup, then INSERT and rollup upsert in a savepoint.
+        with self.assertNumQueries(5):
+            response = self.client.post(reverse(self.time_tracking_url), payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["project_title"], self.projects[1].title)
+        self.assertEqual(response.json()["user"], self.user.id)
+
+    def test_update_query_count(self):
+        """Test updating an entry fetches it with its project, then locks it."""
+        url = reverse(self.time_tracking_details_url, kwargs={"pk": self.entries[0].id})
+
+        # Entry with joined project, then the locked entry, UPDATE and rollup
+        # upsert in a savepoint.
+        with self.assertNumQueries(6):
+            response = self.client.patch(url, {"hours": 5}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["project_title"], self.projects[0].title)
+
+        # Entry with joined project, new project lookup, then the locked entry,
+        # UPDATE, rollup upsert and removal of the emptied rollup in a savepoint.
+        with self.assertNumQueries(8):
+            response = self.client.patch(url, {"project": self.projects[2].id}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["project_title"], self.projects[2].title)
@@ -0,0 +1,161 @@
+import datetime
+
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from time_tracking.archival import EntryArchiver
+from time_tracking.models import TimeTrackingModel
+from time_tracking.tests.factory import (
+    ProjectFactory,
+    UserFactory,
+    TimeTrackingModelFactory,
+)
+
+
+class TimeTrackingReportTestCase(APITestCase):
+    """Class for time tracking hours report test cases."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data"""
+        cls.user = UserFactory(
+            username="testuser@test.com",
+            password="Test@123",
+        )
+        cls.user_2 = UserFactory(
+            username="testuser2@test.com",
+            password="Test@123",
+        )
+        cls.project = ProjectFactory(title="Alpha")
+        cls.project_2 = ProjectFactory(title="Beta")
+
+        def entry(user, project, date_worked, hours):
+            return TimeTrackingModelFactory(
+                user=user,
+                project=project,
+                date_worked=datetime.datetime(*date_worked, tzinfo=datetime.timezone.utc),
+                hours=hours,
+            )
+
+        # Monday 2025-03-10 and Sunday 2025-03-16 share an ISO week.
+        entry(cls.user, cls.project, (2025, 3, 10, 9), 2)
+        entry(cls.user, cls.project, (2025, 3, 10, 14), 3)
+        entry(cls.user, cls.project_2, (2025, 3, 16, 9), 4)
+        entry(cls.user, cls.project, (2025, 4, 1, 9), 5)
+        # Another user's entry never shows up in the report.
+        entry(cls.user_2, cls.project, (2025, 3, 10, 9), 8)
+
+        cls.report_url = "time-tracking-report"
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(user=self.user)
+
+    def test_report_by_project(self):
+        """Test the default report groups by project in a single query."""
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse(self.report_url), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {
+                "group_by": ["project"],
+                "total_hours": 14,
+                "entries": 4,
+                "results": [
+                    {
+                        "project": self.project.id,
+                        "project_title": "Alpha",
+                        "total_hours": 10,
+                        "entries": 3,
+                    },
+                    {
+                        "project": self.project_2.id,
+                        "project_title": "Beta",
+                        "total_hours": 4,
+                        "entries": 1,
+                    },
+                ],
+            },
+        )
+
+    def test_report_by_project_and_day(self):
+        """Test grouping by a combination of project and day."""
+        response = self.client.get(
+            reverse(self.report_url), {"group_by": "day,project"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["group_by"], ["project", "day"])
+        self.assertEqual(
+            [
+                (row["project"], row["day"], row["total_hours"], row["entries"])
+                for row in response.json()["results"]
+            ],
+            [
+                (self.project.id, "2025-03-10", 5, 2),
+                (self.project.id, "2025-04-01", 5, 1),
+                (self.project_2.id, "2025-03-16", 4, 1),
+            ],
+        )
+
+    def test_report_by_week_and_month(self):
+        """Test weeks start on the ISO Monday and months on the first day."""
+        response = self.client.get(reverse(self.report_url), {"group_by": "week"}, format="json")
+        self.assertEqual(
+            [(row["week"], row["total_hours"]) for row in response.json()["results"]],
+            [("2025-03-10", 9), ("2025-03-31", 5)],
+        )
+
+        response = self.client.get(reverse(self.report_url), {"group_by": "month"}, format="json")
+        self.assertEqual(
+            [(row["month"], row["total_hours"]) for row in response.json()["results"]],
+            [("2025-03-01", 9), ("2025-04-01", 5)],
+        )
+
+    def test_report_applies_filters(self):
+        """Test the report honors the date and project filters of the list."""
+        response = self.client.get(
+            reverse(self.report_url),
+            {
+                "group_by": "project",
+                "start_date": "2025-03-11",
+                "end_date": "2025-04-30",
+                "project": self.project.id,
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["total_hours"], 5)
+        self.assertEqual(response.json()["entries"], 1)
+
+    def test_report_leaves_archived_entries_out(self):
+        """Test the hours of archived entries leave the report."""
+        EntryArchiver().archive_batch(
+            TimeTrackingModel.objects.filter(
+                date_worked__lt=datetime.datetime(2025, 4, 1, tzinfo=datetime.timezone.utc)
+            ),
+            "retention",
+        )
+
+        response = self.client.get(reverse(self.report_url), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["total_hours"], 5)
+        self.assertEqual(response.json()["entries"], 1)
+        self.assertEqual(
+            [row["project_title"] for row in response.json()["results"]], ["Alpha"]
+        )
+
+    def test_report_invalid_group_by(self):
+        """Test unsupported groupings are rejected."""
+        response = self.client.get(reverse(self.report_url), {"group_by": "year"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {"group_by": ["Choose one or more of: project, month, week, day."]},
+        )
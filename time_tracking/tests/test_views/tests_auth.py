@@ -1,8 +1,12 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
 from django.urls import reverse
 
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from time_tracking.serializers import UserRegistrationSerializer
 from time_tracking.tests.factory import UserFactory
 
 # Create your tests here.
@@ -102,3 +106,52 @@ class AuthenticationTestCase(APITestCase):
             response.json(),
             {"username": ["This email/username has already been taken."]},
         )
+
+    def test_register_user_username_taken_in_other_case(self):
+        """Test unsucessful register when the username is taken with other letter case."""
+        url = reverse(self.register_url)
+
+        payload = {
+            "username": "TestUser@Test.com",
+            "password": "Test@123",
+        }
+        response = self.client.post(url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {"username": ["This email/username has already been taken."]},
+        )
+
+    def test_register_user_race_is_rejected(self):
+        """Test the unique index rejects a username registered after the check passed."""
+        url = reverse(self.register_url)
+
+        payload = {
+            "username": self.user.username,
+            "password": "Test@123",
+        }
+        # Let the check pass, as if the other registration committed just after it.
+        with mock.patch.object(
+            UserRegistrationSerializer, "validate_username", lambda serializer, value: value
+        ):
+            response = self.client.post(url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {"username": ["This email/username has already been taken."]},
+        )
+
+    def test_register_user_inserts_once(self):
+        """Test registering checks the username and inserts the user without re-fetching it."""
+        url = reverse(self.register_url)
+
+        payload = {"username": "testuser4@test.com", "password": "Test@123"}
+        # Username check, then SAVEPOINT, INSERT and RELEASE SAVEPOINT.
+        with self.assertNumQueries(4):
+            response = self.client.post(url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        user = User.objects.get(username="testuser4@test.com")
+        self.assertEqual(user.email, "testuser4@test.com")
+        self.assertTrue(user.check_password("Test@123"))
@@ -0,0 +1,184 @@
+"""
+Per-request timing, turned on with settings.REQUEST_TIMING.
+
+RequestTimingMiddleware measures each request: its SQL queries and their
+total duration, the authentication, serialization and rendering phases, the
+view and the whole request. It sends them in a Server-Timing header, for the
+browser's network panel, and logs them as one logfmt line on the
+"time_tracking.timing" logger. Requests slower than
+settings.REQUEST_TIMING_SLOW_MS are logged as warnings with their SQL.
+
+The serialize phase is recorded by the serializers of response bodies
+(TimedSerializerMixin and TimeTrackingValuesSerializer) and the render phase
+by FastJSONRenderer, so every JSON endpoint reports them. Streamed and file
+responses, e.g. the entries export, aren't covered: their bodies are
+produced while they are sent, after the middleware returned. Neither is the
+browsable API's HTML.
+
+The phases overlap: the SQL of a lazily evaluated queryset runs while
+serializing, and authentication and serialization happen inside the view.
+When REQUEST_TIMING is off the middleware removes itself from the stack and
+nothing is recorded.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+# The RequestTimings of the request being served, None outside of one.
+_timings: ContextVar = ContextVar("request_timings", default=None)
+# SQL longer than this is cut short in the slow request logs.
+MAX_LOGGED_SQL = 2000
+
+
+class RequestTimings:
+    """Durations (seconds) recorded while serving a request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        # When the view was called and when it returned an unrendered response.
+        self.view_started = None
+        self.view_ended = None
+        self.phases = {}
+        # (database alias, SQL, seconds) of every query.
+        self.queries = []
+
+    def add(self, name: str, duration: float) -> None:
+        self.phases[name] = self.phases.get(name, 0) + duration
+
+    @property
+    def db_time(self) -> float:
+        return sum(duration for _, _, duration in self.queries)
+
+
+@contextmanager
+def timed(name: str):
+    """Adds the duration of the block to the current request's phase called name."""
+    timings = _timings.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - started)
+
+
+def record_query(execute, sql, params, many, context):
+    """Database execute wrapper timing the queries of timed requests."""
+    timings = _timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.queries.append(
+            (context["connection"].alias, sql, time.perf_counter() - started)
+        )
+
+
+def install_query_recorder(sender=None, connection=None, **kwargs) -> None:
+    """Adds record_query to the connection's execute wrappers, once."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class RequestTimingMiddleware:
+    """Measures requests, see the module docstring."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_TIMING", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_seconds = getattr(settings, "REQUEST_TIMING_SLOW_MS", 500) / 1000
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+        # Connections are per thread, and the async ORM's queries run in
+        # another thread than async middleware, so every connection gets
+        # the recorder and it looks the request up in the context.
+        for connection in connections.all(initialized_only=True):
+            install_query_recorder(connection=connection)
+        connection_created.connect(install_query_recorder)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        timings = RequestTimings()
+        token = _timings.set(timings)
+        try:
+            response = self.get_response(request)
+        finally:
+            _timings.reset(token)
+        self.finish(request, response, timings)
+        return response
+
+    async def __acall__(self, request):
+        timings = RequestTimings()
+        token = _timings.set(timings)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _timings.reset(token)
+        self.finish(request, response, timings)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timings = _timings.get()
+        if timings is not None:
+            timings.view_started = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        # Called once the view returned, right before the response is rendered.
+        timings = _timings.get()
+        if timings is not None:
+            timings.view_ended = time.perf_counter()
+        return response
+
+    def finish(self, request, response, timings: RequestTimings) -> None:
+        ended = time.perf_counter()
+        if timings.view_started is not None:
+            timings.add("view", (timings.view_ended or ended) - timings.view_started)
+        total = ended - timings.started
+
+        phases = {name: f"{duration * 1000:.2f}" for name, duration in timings.phases.items()}
+        db_time = f"{timings.db_time * 1000:.2f}"
+        metrics = [f'db;dur={db_time};desc="{len(timings.queries)} queries"']
+        metrics += [f"{name};dur={duration}" for name, duration in phases.items()]
+        metrics.append(f"total;dur={total * 1000:.2f}")
+        response["Server-Timing"] = ", ".join(metrics)
+
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": len(timings.queries),
+            "db_ms": db_time,
+            **{f"{name}_ms": duration for name, duration in phases.items()},
+            "total_ms": f"{total * 1000:.2f}",
+        }
+        line = " ".join(f"{key}={value}" for key, value in fields.items())
+        if total < self.slow_seconds:
+            logger.info("request %s", line, extra={"timing": fields})
+            return
+
+        sql = "\n".join(
+            f"  {duration * 1000:.2f} ms [{alias}] {statement[:MAX_LOGGED_SQL]}"
+            for alias, statement, duration in timings.queries
+        )
+        logger.warning("slow request %s\n%s", line, sql, extra={"timing": fields})
@@ -7,7 +7,14 @@ from rest_framework_simplejwt.views import (
     TokenRefreshView,
 )
 
+from time_tracking.async_views import (
+    AsyncProjectDetailView,
+    AsyncProjectListView,
+    AsyncTimeTrackingDetailView,
+    AsyncTimeTrackingListView,
+)
 from time_tracking.views import (
+    DiagnosticsViewSet,
     ProjectsViewSet,
     RegisterUserViewSet,
     TimeTrackingsViewSet,
@@ -20,11 +27,27 @@ router = SimpleRouter(trailing_slash=False)
 urlpatterns = [
     path("login/", TokenObtainPairView.as_view(), name="login"),
     path("token/refresh/", TokenRefreshView.as_view(), name="token-refresh"),
+    # Async variants of the read endpoints, for ASGI deployments.
+    path("async/project", AsyncProjectListView.as_view(), name="async-project-list"),
+    path(
+        "async/project/<int:pk>", AsyncProjectDetailView.as_view(), name="async-project-detail"
+    ),
+    path(
+        "async/time-tracking",
+        AsyncTimeTrackingListView.as_view(),
+        name="async-time-tracking-list",
+    ),
+    path(
+        "async/time-tracking/<int:pk>",
+        AsyncTimeTrackingDetailView.as_view(),
+        name="async-time-tracking-detail",
+    ),
 ]
 
 router.register(r"register", RegisterUserViewSet, basename="register")
 router.register(r"project", ProjectsViewSet, basename="project")
 router.register(r"time-tracking", TimeTrackingsViewSet, basename="time-tracking")
+router.register(r"diagnostics", DiagnosticsViewSet, basename="diagnostics")
 
 
 urlpatterns = format_suffix_patterns(urlpatterns)
@@ -1,21 +1,71 @@
+import io
+import pstats
+
 from django.shortcuts import render
-from django.contrib.auth.models import User
+from django.conf import settings
+from django.db import connections, transaction
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from django_filters.rest_framework import DjangoFilterBackend
+from django_filters.utils import translate_validation
 
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.relations import PrimaryKeyRelatedField
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
 
-from time_tracking.filters import TimeTrackingModelFilter
-from time_tracking.models import ProjectsModel, TimeTrackingModel
+from time_tracking.bulk import bulk_delete_entries, bulk_insert_entries, bulk_update_entries
+from time_tracking.cache import (
+    get_entries_version,
+    get_or_set_projects,
+    get_projects_cache_stats,
+    get_projects_version,
+    invalidate_entries,
+)
+from time_tracking.conditional import (
+    conditional_response,
+    content_etag,
+    entry_validators,
+    list_etag,
+    validator_headers,
+)
+from time_tracking.exports import EXPORT_FORMATS, export_rows
+from time_tracking.filters import (
+    DailyRollupFilter,
+    TimeTrackingArchiveFilter,
+    TimeTrackingModelFilter,
+)
+from time_tracking.imports import TimeEntryCSVImporter
+from time_tracking.models import (
+    DailyTimeTrackingRollupModel,
+    ProjectsModel,
+    TimeTrackingArchiveModel,
+    TimeTrackingModel,
+)
+from time_tracking.pagination import TimeTrackingCursorPagination
+from time_tracking.profiling import get_profile_path, list_profiles, make_token
+from time_tracking.reports import build_hours_report
+from time_tracking.rollups import apply_deltas, entry_delta, merge_deltas
 from time_tracking.serializers import (
+    ProfileStatsSerializer,
+    ProfileTokenSerializer,
+    ProjectSearchSerializer,
     ProjectsSerializer,
+    TimeTrackingArchiveValuesSerializer,
+    TimeTrackingBatchItemSerializer,
+    TimeTrackingBulkSelectionSerializer,
+    TimeTrackingBulkUpdateSerializer,
+    TimeTrackingExportSerializer,
     TimeTrackingModelSerializer,
+    TimeTrackingReportSerializer,
+    TimeTrackingValuesSerializer,
     UserRegistrationSerializer,
 )
 
@@ -29,9 +79,8 @@ class RegisterUserViewSet(GenericViewSet):
 
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
-
-        user = User.objects.get(username=serializer.validated_data["username"])
+        # Issue the tokens for the saved instance instead of fetching it again.
+        user = serializer.save()
         refresh: RefreshToken = RefreshToken.for_user(user)
 
         # Assign the auth tokens after successful registration.
@@ -52,6 +101,63 @@ class ProjectsViewSet(ModelViewSet):
     serializer_class = ProjectsSerializer
     queryset = ProjectsModel.objects.filter(is_deleted=False)
 
+    def cached_response(self, name: str, load) -> Response:
+        """
+        Returns the cached response data called name, or a 304 when the
+        client's If-None-Match still matches it. The ETag is stored with the
+        data, so a 304 from a warm cache runs no query at all.
+        """
+
+        def load_with_etag():
+            data = load()
+            return {"data": data, "etag": content_etag(data)}
+
+        cached = get_or_set_projects(name, load_with_etag)
+        not_modified = conditional_response(self.request, etag=cached["etag"])
+        if not_modified is not None:
+            return not_modified
+
+        return Response(cached["data"], status.HTTP_200_OK, headers=validator_headers(cached["etag"]))
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """Endpoint to fetch the projects, served from the projects cache."""
+
+        def load():
+            queryset = self.filter_queryset(self.get_queryset())
+            return list(self.get_serializer(queryset, many=True).data)
+
+        return self.cached_response("list", load)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        """Endpoint to fetch a project, served from the projects cache."""
+
+        def load():
+            return dict(self.get_serializer(self.get_object()).data)
+
+        return self.cached_response(f"detail:{kwargs['pk']}", load)
+
+    @action(detail=False, methods=["get"])
+    def search(self, request: Request) -> Response:
+        """
+        Endpoint to autocomplete project titles, e.g. ?q=acme&limit=10.
+        Titles starting with q come first, then titles containing it, both
+        case-insensitive and sorted by title.
+        """
+        query_serializer = ProjectSearchSerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        term = query_serializer.validated_data["q"]
+        limit = query_serializer.validated_data["limit"]
+
+        # Both lookups are served by the title search indexes (migration 0005).
+        queryset = self.get_queryset().order_by("title", "id")
+        projects = list(queryset.filter(title__istartswith=term)[:limit])
+        if len(projects) < limit:
+            projects += queryset.filter(title__icontains=term).exclude(
+                title__istartswith=term
+            )[: limit - len(projects)]
+
+        return Response(self.get_serializer(projects, many=True).data, status.HTTP_200_OK)
+
     def destroy(self, request: Request, *args, **kwargs) -> Response:
         """Override method to soft delete the project for archiving purposes."""
         instance: ProjectsModel = self.get_object()
@@ -61,33 +167,404 @@ class ProjectsViewSet(ModelViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class DiagnosticsViewSet(GenericViewSet):
+    """Admin-only endpoints to check how the service is performing."""
+
+    permission_classes = [IsAdminUser]
+    queryset = None
+
+    @action(detail=False, methods=["get"])
+    def cache(self, request: Request) -> Response:
+        """Endpoint to fetch the hit/miss counters of the projects cache."""
+        return Response({"projects": get_projects_cache_stats()}, status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="db-pool", url_name="db-pool")
+    def db_pool(self, request: Request) -> Response:
+        """
+        Endpoint to fetch the connection settings of each database, with the
+        pool statistics of the pooled ones.
+        """
+        databases = {}
+        for connection in connections.all():
+            # Only PostgreSQL connections with a pool configured have one.
+            pool = getattr(connection, "pool", None)
+            databases[connection.alias] = {
+                "vendor": connection.vendor,
+                "pooled": pool is not None,
+                "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+                "health_checks": connection.settings_dict["CONN_HEALTH_CHECKS"],
+                "pool": pool.get_stats() if pool is not None else None,
+            }
+
+        return Response(databases, status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"])
+    def profiles(self, request: Request) -> Response:
+        """Endpoint to list the saved request profiles, newest first."""
+        return Response(list_profiles(), status.HTTP_200_OK)
+
+    @action(
+        detail=False, methods=["post"], url_path="profiles/token", url_name="profile-token"
+    )
+    def profile_token(self, request: Request) -> Response:
+        """
+        Endpoint to issue a token profiling the requests that send it in the
+        X-Profile header, optionally only those under a path.
+        """
+        serializer = ProfileTokenSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        token = make_token(request.user, serializer.validated_data["path"])
+
+        return Response(
+            {
+                "token": token,
+                "header": "X-Profile",
+                "expires_in": getattr(settings, "PROFILING_TOKEN_MAX_AGE", 900),
+            },
+            status.HTTP_201_CREATED,
+        )
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"profiles/(?P<name>[\w-]+\.prof)",
+        url_name="profile-detail",
+    )
+    def profile(self, request: Request, name: str) -> Response:
+        """
+        Endpoint to download a saved profile, for pstats or snakeviz, or with
+        ?sort= its top functions as text.
+        """
+        path = get_profile_path(name)
+        if path is None:
+            raise NotFound("No such profile.")
+        if "sort" not in request.query_params:
+            return FileResponse(path.open("rb"), as_attachment=True, filename=name)
+
+        serializer = ProfileStatsSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        output = io.StringIO()
+        stats = pstats.Stats(str(path), stream=output)
+        stats.sort_stats(serializer.validated_data["sort"])
+        stats.print_stats(serializer.validated_data["limit"])
+        return HttpResponse(output.getvalue(), content_type="text/plain; charset=utf-8")
+
+
 class TimeTrackingsViewSet(ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = TimeTrackingModelSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_class = TimeTrackingModelFilter
+    pagination_class = TimeTrackingCursorPagination
 
     def get_queryset(self):
         """Override get queryset to only filter entries by the authenticated user."""
         request: Request = self.request
         user = request.user
 
-        queryset = TimeTrackingModel.objects.filter(user=user)
+        # Join the project so serializing project_title doesn't query per row.
+        queryset = TimeTrackingModel.objects.filter(user=user).select_related("project")
 
         return queryset
 
-    def create(self, request: Request, *args, **kwargs) -> Response:
-        """Endpoint to create a Entry"""
-        # Override the create method to assign authenticated user to the payload data
-        request.data["user"] = request.user.id
+    def perform_create(self, serializer: TimeTrackingModelSerializer) -> None:
+        """Assign the authenticated user to the new entry."""
+        with transaction.atomic():
+            # Passing the instance avoids re-fetching the user by the posted id.
+            entry = serializer.save(user=self.request.user)
+            apply_deltas(entry_delta(entry))
+            invalidate_entries([entry.user_id])
+
+    def lock_entry(self, entry: TimeTrackingModel) -> TimeTrackingModel:
+        """
+        Re-reads the entry with its row locked until the end of the transaction,
+        so concurrent writes to it can't both move the same old values out of
+        the daily rollups.
+        """
+        try:
+            return self.get_queryset().select_for_update(of=("self",)).get(pk=entry.pk)
+        except TimeTrackingModel.DoesNotExist:
+            raise NotFound()
+
+    def perform_update(self, serializer: TimeTrackingModelSerializer) -> None:
+        """Move the entry's hours in the daily rollups along with the update."""
+        with transaction.atomic():
+            serializer.instance = self.lock_entry(serializer.instance)
+            before = entry_delta(serializer.instance, sign=-1)
+            entry = serializer.save()
+            apply_deltas(merge_deltas(before, entry_delta(entry)))
+            invalidate_entries([entry.user_id])
+
+    def perform_destroy(self, instance: TimeTrackingModel) -> None:
+        """Remove the entry's hours from the daily rollups along with the entry."""
+        with transaction.atomic():
+            instance = self.lock_entry(instance)
+            apply_deltas(entry_delta(instance, sign=-1))
+            instance.delete()
+            invalidate_entries([instance.user_id])
+
+    def get_bulk_queryset(self, ids: list = None):
+        """
+        Returns the entries a bulk operation applies to: the given ids, or
+        else whatever the list filters in the query params select.
+        """
+        filterset = self.filterset_class(
+            self.request.query_params, queryset=self.get_queryset(), request=self.request
+        )
+        if not filterset.is_valid():
+            raise translate_validation(filterset.errors)
+        # django-filter skips empty values, so ?project= alone selects nothing
+        # and mustn't count as a selection of every entry.
+        selected = [
+            value for value in filterset.form.cleaned_data.values() if value not in (None, "")
+        ]
+        if not ids and not selected:
+            raise ValidationError(
+                {"non_field_errors": ["Select the entries with ids or the list filters."]}
+            )
+
+        queryset = filterset.qs
+        if ids:
+            queryset = queryset.filter(id__in=ids)
+
+        return queryset
 
-        return super().create(request)
+    def list_etag(self) -> str:
+        """Returns the ETag of the requested list, from the cached versions without a query."""
+        user_id = self.request.user.id
+        return list_etag(
+            user_id,
+            self.request.get_full_path(),
+            get_entries_version(user_id),
+            get_projects_version(),
+        )
 
     def list(self, request: Request, *args, **kwargs) -> Response:
         """Endpoint to fetch list of entries"""
         # Override the list method to apply filtering.
         queryset = self.filter_queryset(self.get_queryset())
 
+        etag = self.list_etag()
+        not_modified = conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        # Read plain .values() rows, rendered the same as the model serializer,
+        # in the order of the pages so the response doesn't depend on the plan.
+        rows = TimeTrackingValuesSerializer.values(
+            queryset.order_by(*TimeTrackingCursorPagination.ordering)
+        )
+
+        # Keyset pagination is opt-in, see TimeTrackingCursorPagination.
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            response = self.get_paginated_response(TimeTrackingValuesSerializer(page).data)
+        else:
+            response = Response(TimeTrackingValuesSerializer(rows).data, status.HTTP_200_OK)
+
+        response["ETag"] = etag
+        return response
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        """Endpoint to fetch an entry, or a 304 when the client's copy is current."""
+        instance = self.get_object()
+
+        etag, last_modified = entry_validators(instance)
+        not_modified = conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        return Response(
+            self.get_serializer(instance).data,
+            status.HTTP_200_OK,
+            headers=validator_headers(etag, last_modified),
+        )
+
+    @action(detail=False, methods=["get"])
+    def report(self, request: Request) -> Response:
+        """
+        Endpoint to fetch total hours and entry counts grouped by project, day,
+        week and/or month, e.g. ?group_by=project,week. Accepts the list filters.
+        Archived entries aren't counted (see time_tracking.archival).
+        """
+        query_serializer = TimeTrackingReportSerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        # Every grouping and filter is at day granularity, so the report reads
+        # the daily rollups instead of the raw entries.
+        filterset = DailyRollupFilter(
+            request.query_params,
+            queryset=DailyTimeTrackingRollupModel.objects.filter(user=request.user),
+            request=request,
+        )
+        if not filterset.is_valid():
+            raise translate_validation(filterset.errors)
+        queryset = filterset.qs
+
+        return Response(
+            build_hours_report(queryset, query_serializer.validated_data["group_by"]),
+            status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=["get"])
+    def archived(self, request: Request) -> Response:
+        """
+        Endpoint to fetch the entries moved to the archive (see
+        time_tracking.archival), e.g. past the retention period. Accepts the
+        list filters and pagination params.
+        """
+        filterset = TimeTrackingArchiveFilter(
+            request.query_params,
+            queryset=TimeTrackingArchiveModel.objects.filter(user=request.user),
+            request=request,
+        )
+        if not filterset.is_valid():
+            raise translate_validation(filterset.errors)
+        rows = TimeTrackingArchiveValuesSerializer.values(
+            filterset.qs.order_by(*TimeTrackingCursorPagination.ordering)
+        )
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(TimeTrackingArchiveValuesSerializer(page).data)
+        return Response(TimeTrackingArchiveValuesSerializer(rows).data, status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        """
+        Endpoint to download the entries as CSV or NDJSON, e.g.
+        ?file_format=ndjson. Accepts the list filters. The file is streamed
+        so memory use doesn't grow with the number of entries.
+        """
+        query_serializer = TimeTrackingExportSerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        file_format = query_serializer.validated_data["file_format"]
+
+        queryset = self.filter_queryset(self.get_queryset())
+        stream, content_type = EXPORT_FORMATS[file_format]
+
+        response = StreamingHttpResponse(
+            stream(export_rows(queryset)), content_type=content_type
+        )
+        response["Content-Disposition"] = f'attachment; filename="time-tracking.{file_format}"'
+
+        return response
+
+    @action(detail=False, methods=["post"], url_path="batch", url_name="batch")
+    def batch_create(self, request: Request) -> Response:
+        """
+        Endpoint to create a list of entries at once. Valid entries are
+        inserted together and the response reports the created entry or the
+        errors of every item, in the order they were sent.
+        """
+        max_size = getattr(settings, "TIME_TRACKING_BATCH_MAX_SIZE", 5000)
+        if not isinstance(request.data, list):
+            raise ValidationError({"non_field_errors": ["Expected a list of entries."]})
+        if len(request.data) > max_size:
+            raise ValidationError(
+                {"non_field_errors": [f"A batch can have at most {max_size} entries."]}
+            )
+
+        # Validate every item on its own so one bad entry doesn't hide the others.
+        item_serializer = TimeTrackingBatchItemSerializer()
+        validated = []
+        for data in request.data:
+            try:
+                validated.append((item_serializer.run_validation(data), None))
+            except ValidationError as exc:
+                validated.append((None, exc.detail))
+
+        # Look up every referenced project in a single query.
+        projects = ProjectsModel.objects.in_bulk({item["project"] for item, _ in validated if item})
+        missing_message = PrimaryKeyRelatedField.default_error_messages["does_not_exist"]
+
+        results, entries = [], []
+        for index, (item, item_errors) in enumerate(validated):
+            if item and item["project"] not in projects:
+                item_errors = {"project": [missing_message.format(pk_value=item["project"])]}
+            if item_errors:
+                results.append({"index": index, "errors": item_errors})
+                continue
+
+            entry = TimeTrackingModel(
+                **{**item, "project": projects[item["project"]]}, user=request.user
+            )
+            entries.append(entry)
+            results.append({"index": index, "entry": entry})
+
+        if entries:
+            bulk_insert_entries(entries)
+
+        for result in results:
+            if "entry" in result:
+                result["entry"] = TimeTrackingModelSerializer(result["entry"]).data
+
+        if not entries:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif len(entries) < len(results):
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_201_CREATED
+
+        return Response(
+            {"created": len(entries), "failed": len(results) - len(entries), "results": results},
+            response_status,
+        )
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        url_name="import",
+        parser_classes=[MultiPartParser],
+    )
+    def import_csv(self, request: Request) -> Response:
+        """
+        Endpoint to import entries from an uploaded CSV ``file`` with the
+        columns project_title, date_worked, work_description and hours. Rows
+        already imported before are skipped.
+        """
+        uploaded_file = request.FILES.get("file")
+        if uploaded_file is None:
+            raise ValidationError({"file": ["This field is required."]})
+
+        lines = io.TextIOWrapper(uploaded_file.file, encoding="utf-8-sig", newline="")
+        report = TimeEntryCSVImporter(request.user).run(lines)
+
         return Response(
-            self.get_serializer(queryset, many=True).data, status.HTTP_200_OK
+            report, status.HTTP_201_CREATED if report["created"] else status.HTTP_200_OK
+        )
+
+    @action(detail=False, methods=["post"], url_path="bulk-update", url_name="bulk-update")
+    def bulk_update(self, request: Request) -> Response:
+        """
+        Endpoint to change the same fields on many entries at once, selected
+        by ``ids`` in the body or by the list filters in the query params.
+        """
+        serializer = TimeTrackingBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        queryset = self.get_bulk_queryset(serializer.validated_data.get("ids"))
+        updated = bulk_update_entries(
+            queryset,
+            serializer.validated_data["changes"],
+            chunk_size=getattr(settings, "TIME_TRACKING_BULK_CHUNK_SIZE", 1000),
         )
+
+        return Response({"updated": updated}, status.HTTP_200_OK)
+
+    @action(detail=False, methods=["post"], url_path="bulk-delete", url_name="bulk-delete")
+    def bulk_delete(self, request: Request) -> Response:
+        """
+        Endpoint to delete many entries at once, selected by ``ids`` in the
+        body or by the list filters in the query params.
+        """
+        serializer = TimeTrackingBulkSelectionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        queryset = self.get_bulk_queryset(serializer.validated_data.get("ids"))
+        deleted = bulk_delete_entries(
+            queryset, chunk_size=getattr(settings, "TIME_TRACKING_BULK_CHUNK_SIZE", 1000)
+        )
+
+        return Response({"deleted": deleted}, status.HTTP_200_OK)